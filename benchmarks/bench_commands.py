@@ -0,0 +1,61 @@
+"""
+Measures the per-token cost of finding and executing the command of a token.
+
+The "linear" variant reproduces the former protocol: every command of the supplier is
+tried in order with can_parse() and execute() runs the regex again on the token.
+The "dispatch" variant uses classify() and hands the match to execute_match().
+
+Usage: python -m benchmarks.bench_commands [--number N]
+"""
+import argparse
+import timeit
+
+from metar_taf_parser.command.common import CommandSupplier
+from metar_taf_parser.command.metar import CommandSupplier as MetarCommandSupplier
+from metar_taf_parser.command.taf import TAFCommandSupplier
+from metar_taf_parser.model.model import Metar, TAF
+
+COMMON_TOKENS = ['27010G25KT', 'VRB03KT', '240V300', '9999', '0800', '3000NE', '6SM', 'P6SM', '1 1/2SM', 'VV002',
+                 'FEW020', 'SCT035', 'BKN040CB', 'OVC080', 'NSC', 'WS020/24045KT']
+METAR_TOKENS = ['R26/0600U', 'R26L/0550V700U', 'R16/290155', 'M02/M02', '15/12', 'Q1013', 'A3006']
+TAF_TOKENS = ['620304', '520004', '640308', '510002']
+
+
+def _linear(supplier, container_factory, tokens):
+    commands = supplier._commands
+    container = container_factory()
+    for token in tokens:
+        for command in commands:
+            if command.can_parse(token):
+                command.execute(container, token)
+                break
+
+
+def _dispatch(supplier, container_factory, tokens):
+    container = container_factory()
+    for token in tokens:
+        command, match = supplier.classify(token)
+        if command:
+            command.execute_match(container, match)
+
+
+def _run(name, supplier, container_factory, tokens, number):
+    results = {}
+    for variant, function in (('linear', _linear), ('dispatch', _dispatch)):
+        duration = min(timeit.repeat(lambda: function(supplier, container_factory, tokens), number=number, repeat=5))
+        results[variant] = duration / (number * len(tokens)) * 1e9
+    saving = 100 * (1 - results['dispatch'] / results['linear'])
+    print(f'{name:<8} linear {results["linear"]:8.0f} ns/token   dispatch {results["dispatch"]:8.0f} ns/token   saving {saving:5.1f}%')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=2000, help='iterations over the token list per repeat')
+    args = parser.parse_args()
+    _run('common', CommandSupplier(), Metar, COMMON_TOKENS, args.number)
+    _run('metar', MetarCommandSupplier(), Metar, METAR_TOKENS, args.number)
+    _run('taf', TAFCommandSupplier(), TAF, TAF_TOKENS, args.number)
+
+
+if __name__ == '__main__':
+    main()
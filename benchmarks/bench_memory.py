@@ -0,0 +1,70 @@
+"""
+Measures the memory held by parsed METAR and TAF objects.
+
+The messages are parsed and kept in a list while tracemalloc traces the allocations, so the
+reported size covers the whole object graph of a report: the container, its wind, visibility,
+clouds, weather conditions, trends, and so on. The raw message is shared with the input list
+and is not counted.
+
+The interned rows freeze each report with its winds, visibilities, weather conditions and clouds
+interned, so the groups repeated in the batch are held once.
+
+Usage: python -m benchmarks.bench_memory [--count N]
+"""
+import argparse
+import gc
+import tracemalloc
+
+from metar_taf_parser.model.model import clear_interned, freeze
+from metar_taf_parser.parser.parser import MetarParser, TAFParser
+
+METARS = [
+    'LFPG 170830Z 00000KT 0350 R27L/0375N R09R/0175N R26R/0500D R08L/0400N FG SCT000 M01/M01 Q1026 NOSIG',
+    'KTTN 051853Z 04011KT 9999 VCTS SN FZFG BKN003 OVC010 M02/M02 A3006',
+    'LFBD 031300Z 27010G25KT 240V300 9999 FEW020 BKN040CB 15/12 Q1013 TEMPO 4000 RA',
+]
+TAFS = [
+    'TAF LFPG 150500Z 1506/1612 17005KT 6000 SCT012 TEMPO 1506/1509 3000 BR BKN006 PROB40 TEMPO 1506/1508 0400 BCFG '
+    'BKN002 BECMG 1520/1522 CAVOK TX17/1512Z TN07/1605Z',
+    'TAF KLWT 211120Z 2112/2212 20008KT 9999 SKC 620304 520004 FM212300 30012G22KT 9999 FEW045 BKN100',
+]
+
+
+def _interned(report):
+    return freeze(report, intern=True)
+
+
+def measure(parser, messages: list, count: int, store=None) -> float:
+    """
+    :param store: function applied to each report before it is kept
+    :return: the number of bytes allocated per parsed message
+    """
+    inputs = [messages[i % len(messages)] for i in range(count)]
+    parser.parse(inputs[0])
+    clear_interned()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    if store is None:
+        results = [parser.parse(message) for message in inputs]
+    else:
+        results = [store(parser.parse(message)) for message in inputs]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del results
+    return (after - before) / count
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument('--count', type=int, default=5000)
+    args = arg_parser.parse_args()
+    print(f'{"metar":16} {measure(MetarParser(), METARS, args.count):8.0f} bytes/report')
+    print(f'{"taf":16} {measure(TAFParser(), TAFS, args.count):8.0f} bytes/report')
+    print(f'{"metar interned":16} {measure(MetarParser(), METARS, args.count, _interned):8.0f} bytes/report')
+    print(f'{"taf interned":16} {measure(TAFParser(), TAFS, args.count, _interned):8.0f} bytes/report')
+
+
+if __name__ == '__main__':
+    main()
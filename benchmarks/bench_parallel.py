@@ -0,0 +1,54 @@
+"""
+Compares the sequential parse_many with ParallelParser on a generated batch of METARs
+and reports the size of the result payload sent back by the workers.
+
+Usage: python -m benchmarks.bench_parallel [--count N] [--workers N] [--chunk-size N]
+"""
+import argparse
+import pickle
+import time
+
+from metar_taf_parser.parallel import ParallelParser, _parse_chunk, _init_worker, METAR
+from metar_taf_parser.parser.parser import MetarParser
+
+TEMPLATES = [
+    'KTTN {} 04011KT 9999 VCTS SN FZFG BKN003 OVC010 M02/M02 A3006 RMK AO2 SLP013',
+    'LFPG {} 27010G25KT 240V300 9999 FEW020 BKN040CB 15/12 Q1013 NOSIG',
+    'EGLL {} AUTO 24015KT 9999 -RA SCT012 BKN020 12/10 Q0998 TEMPO 4000 RA',
+    'KJFK {} 31012G20KT 10SM FEW050 SCT250 22/08 A2992 RMK AO2 PK WND 30027/1318 SLP132 T02220083',
+]
+
+
+def _message(index: int) -> str:
+    delivery_time = f'{index % 28 + 1:02d}{index // 28 % 24:02d}{index // 672 % 60:02d}Z'
+    return TEMPLATES[index % len(TEMPLATES)].format(delivery_time)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=20000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=500)
+    args = parser.parse_args()
+    messages = [_message(i) for i in range(args.count)]
+
+    start = time.perf_counter()
+    results, _ = MetarParser().parse_many(messages)
+    sequential = time.perf_counter() - start
+    print(f'sequential {args.count / sequential:10.0f} reports/s')
+
+    with ParallelParser(max_workers=args.workers, chunk_size=args.chunk_size) as parallel:
+        start = time.perf_counter()
+        parallel.parse_many(messages)
+        duration = time.perf_counter() - start
+    print(f'parallel   {args.count / duration:10.0f} reports/s')
+
+    chunk = messages[:args.chunk_size]
+    full = pickle.dumps(MetarParser().parse_many(chunk), protocol=pickle.HIGHEST_PROTOCOL)
+    _init_worker(METAR, False)
+    compact = _parse_chunk(chunk, None, 'collect')
+    print(f'payload    {len(full) / len(chunk):10.0f} bytes/report with the message, {len(compact) / len(chunk):.0f} without')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Measures the parse throughput of METAR and TAF messages, with and without a token memo, and
+the cost of filling a model object the way the commands do.
+
+Usage: python -m benchmarks.bench_parse [--number N] [--repeat R]
+"""
+import argparse
+import timeit
+
+from metar_taf_parser.model.model import Wind
+from metar_taf_parser.parser.cache import ParseCache
+from metar_taf_parser.parser.parser import MetarParser, TAFParser
+
+METARS = [
+    'LFPG 170830Z 00000KT 0350 R27L/0375N R09R/0175N R26R/0500D R08L/0400N FG SCT000 M01/M01 Q1026 NOSIG',
+    'KTTN 051853Z 04011KT 9999 VCTS SN FZFG BKN003 OVC010 M02/M02 A3006',
+    'LFBD 031300Z 27010G25KT 240V300 9999 FEW020 BKN040CB 15/12 Q1013 TEMPO 4000 RA',
+    'KJFK 031351Z 31012G20KT 10SM FEW050 SCT250 22/08 A2992',
+]
+TAFS = [
+    'TAF LFPG 150500Z 1506/1612 17005KT 6000 SCT012 TEMPO 1506/1509 3000 BR BKN006 PROB40 TEMPO 1506/1508 0400 BCFG '
+    'BKN002 BECMG 1520/1522 CAVOK TX17/1512Z TN07/1605Z',
+    'TAF KLWT 211120Z 2112/2212 20008KT 9999 SKC 620304 520004 FM212300 30012G22KT 9999 FEW045 BKN100',
+]
+
+
+def throughput(parser, messages: list, number: int, repeat: int) -> float:
+    """
+    :return: the best number of messages parsed per second over the repeats
+    """
+    def run():
+        for message in messages:
+            parser.parse(message)
+
+    best = min(timeit.repeat(run, number=number, repeat=repeat))
+    return number * len(messages) / best
+
+
+def _fill_wind():
+    wind = Wind()
+    wind.direction = 'N'
+    wind.degrees = 360
+    wind.speed = 10
+    wind.unit = 'KT'
+    return wind.speed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument('--number', type=int, default=500)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+    print(f'{"metar":10} {throughput(MetarParser(), METARS, args.number, args.repeat):10.0f} messages/s')
+    print(f'{"taf":10} {throughput(TAFParser(), TAFS, args.number, args.repeat):10.0f} messages/s')
+    print(f'{"metar memo":10} {throughput(MetarParser(token_memo=ParseCache()), METARS, args.number, args.repeat):10.0f} '
+          f'messages/s')
+    print(f'{"taf memo":10} {throughput(TAFParser(token_memo=ParseCache()), TAFS, args.number, args.repeat):10.0f} '
+          f'messages/s')
+    number = args.number * 100
+    best = min(timeit.repeat(_fill_wind, number=number, repeat=args.repeat))
+    print(f'{"wind":10} {best / number * 1e9:10.0f} ns/object')
+
+
+if __name__ == '__main__':
+    main()
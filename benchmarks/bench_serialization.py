@@ -0,0 +1,110 @@
+"""
+Compares the binary encoding of metar_taf_parser.serialization with pickle and JSON on a
+generated batch of METARs: size per report, encoding and decoding rates.
+
+Each report is encoded on its own, then the whole batch at once (write_reports for the binary
+encoding, write_ndjson for JSON). The JSON figures compare to_dict with a generic walk of the
+slots of the objects, decoding only goes back to dicts.
+
+Usage: python -m benchmarks.bench_serialization [--count N]
+"""
+import argparse
+import enum
+import io
+import json
+import pickle
+import time
+from datetime import time as time_of_day
+
+from metar_taf_parser.parser.parser import MetarParser
+from metar_taf_parser.serialization import from_bytes, read_reports, to_bytes, write_ndjson, write_reports
+
+TEMPLATES = [
+    'KTTN {} 04011KT 9999 VCTS SN FZFG BKN003 OVC010 M02/M02 A3006 RMK AO2 SLP013',
+    'LFPG {} 27010G25KT 240V300 9999 FEW020 BKN040CB 15/12 Q1013 NOSIG',
+    'EGLL {} AUTO 24015KT 9999 -RA SCT012 BKN020 12/10 Q0998 TEMPO 4000 RA',
+    'KJFK {} 31012G20KT 10SM FEW050 SCT250 22/08 A2992 RMK AO2 PK WND 30027/1318 SLP132 T02220083',
+]
+
+
+def _message(index: int) -> str:
+    delivery_time = f'{index % 28 + 1:02d}{index // 28 % 24:02d}{index // 672 % 60:02d}Z'
+    return TEMPLATES[index % len(TEMPLATES)].format(delivery_time)
+
+
+def _to_json_value(value):
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, time_of_day):
+        return value.isoformat()
+    if isinstance(value, (list, set, tuple)):
+        return [_to_json_value(item) for item in value]
+    if hasattr(type(value), '__slots__'):
+        return {slot: _to_json_value(getattr(value, slot)) for cls in type(value).__mro__
+                for slot in getattr(cls, '__slots__', ()) if slot != '_lazy_remark'}
+    return value
+
+
+def _rate(count: int, function) -> float:
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start)
+
+
+def _report(name: str, size: int, count: int, encode, decode):
+    print(f'{name:14} {size / count:8.0f} bytes/report {_rate(count, encode):10.0f} encoded/s '
+          f'{_rate(count, decode):10.0f} decoded/s')
+
+
+def _write_reports(reports: list) -> bytes:
+    file = io.BytesIO()
+    write_reports(file, reports)
+    return file.getvalue()
+
+
+def _write_ndjson(reports: list) -> str:
+    file = io.StringIO()
+    write_ndjson(file, reports)
+    return file.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=5000)
+    args = parser.parse_args()
+    reports, _ = MetarParser().parse_many([_message(i) for i in range(args.count)])
+    count = len(reports)
+
+    pickled = [pickle.dumps(report, pickle.HIGHEST_PROTOCOL) for report in reports]
+    _report('pickle', sum(map(len, pickled)), count,
+            lambda: [pickle.dumps(report, pickle.HIGHEST_PROTOCOL) for report in reports],
+            lambda: [pickle.loads(data) for data in pickled])
+    dumped = [json.dumps(_to_json_value(report)) for report in reports]
+    _report('json slots', sum(map(len, dumped)), count,
+            lambda: [json.dumps(_to_json_value(report)) for report in reports],
+            lambda: [json.loads(data) for data in dumped])
+    dumped = [json.dumps(report.to_dict()) for report in reports]
+    _report('json to_dict', sum(map(len, dumped)), count,
+            lambda: [json.dumps(report.to_dict()) for report in reports],
+            lambda: [json.loads(data) for data in dumped])
+    encoded = [to_bytes(report) for report in reports]
+    _report('to_bytes', sum(map(len, encoded)), count,
+            lambda: [to_bytes(report) for report in reports],
+            lambda: [from_bytes(data) for data in encoded])
+
+    batch = pickle.dumps(reports, pickle.HIGHEST_PROTOCOL)
+    _report('pickle batch', len(batch), count,
+            lambda: pickle.dumps(reports, pickle.HIGHEST_PROTOCOL),
+            lambda: pickle.loads(batch))
+    lines = _write_ndjson(reports)
+    _report('write_ndjson', len(lines), count,
+            lambda: _write_ndjson(reports),
+            lambda: [json.loads(line) for line in lines.splitlines()])
+    container = _write_reports(reports)
+    _report('write_reports', len(container), count,
+            lambda: _write_reports(reports),
+            lambda: list(read_reports(io.BytesIO(container))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+Measures the throughput of the parsers on the corpora of benchmarks.corpus and compares it with
+a stored baseline.
+
+Cases:
+- metar_eu, metar_us: MetarParser.parse on European METARs and on US METARs with long remarks;
+- taf: TAFParser.parse on multi-line TAFs;
+- taf_long: TAFParser.parse on amended TAFs with 8 to 12 change groups;
+- taf_segment: the split of the long TAFs into lines of tokens, the first step of TAFParser.parse;
+- remark: RemarkParser.parse on the remark sections of the US METARs;
+- tokenize: AbstractParser.tokenize on the European METARs;
+- translate_<locale>: RemarkParser.translate of the decoded remark records, per locale.
+
+Each case prints the best rate over the repeats, in reports per second, and its change from the
+baseline. The baseline is machine dependent: save one with --save before working on a change,
+then run again to compare.
+
+With --pyperf the cases are run by pyperf instead, which must be installed; the other pyperf
+options (--output, --rigorous...) are accepted after it. --count and --case are passed to the workers.
+
+Usage: python -m benchmarks.bench_suite [--count N] [--repeat R] [--case NAME] [--baseline PATH] [--save]
+       python -m benchmarks.bench_suite --pyperf [--count N] [--case NAME] [pyperf options]
+"""
+import argparse
+import json
+import os
+import timeit
+
+from benchmarks import corpus
+from metar_taf_parser.parser.parser import MetarParser, RemarkParser, TAFParser
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+LOCALES = ('en', 'fr', 'de')
+
+
+def _loop(function, inputs: list):
+    def run():
+        for item in inputs:
+            function(item)
+    return run
+
+
+def _translate(remark_parser: RemarkParser, locale: str):
+    return lambda records: remark_parser.translate(records, locale)
+
+
+def cases(count: int) -> dict:
+    """
+    :param count: number of reports of each corpus
+    :return: dict mapping a case name to a tuple (function running the case, number of reports)
+    """
+    european_metars = corpus.european_metars(count)
+    us_metars = corpus.us_metars(count)
+    tafs = corpus.tafs(count // 2)
+    long_tafs = corpus.long_tafs(count // 2)
+    taf_parser = TAFParser()
+    remarks = corpus.remarks(count)
+    metar_parser = MetarParser()
+    remark_parser = RemarkParser()
+    records = [remark_parser.parse_records(remark) for remark in remarks]
+    result = {
+        'metar_eu': (_loop(metar_parser.parse, european_metars), len(european_metars)),
+        'metar_us': (_loop(metar_parser.parse, us_metars), len(us_metars)),
+        'taf': (_loop(taf_parser.parse, tafs), len(tafs)),
+        'taf_long': (_loop(taf_parser.parse, long_tafs), len(long_tafs)),
+        'taf_segment': (_loop(taf_parser._extract_lines_tokens, long_tafs), len(long_tafs)),
+        'remark': (_loop(remark_parser.parse, remarks), len(remarks)),
+        'tokenize': (_loop(metar_parser.tokenize, european_metars), len(european_metars)),
+    }
+    for locale in LOCALES:
+        result[f'translate_{locale}'] = (_loop(_translate(remark_parser, locale), records), len(records))
+    return result
+
+
+def measure(function, count: int, repeat: int) -> float:
+    """
+    :return: the best number of reports per second over the repeats
+    """
+    function()
+    return count / min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def save_baseline(path: str, rates: dict):
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump({name: round(rate) for name, rate in rates.items()}, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def compare(name: str, rate: float, baseline: dict) -> str:
+    """
+    :return: the line of a case, with its change from the baseline when the baseline has the case
+    """
+    line = f'{name:14} {rate:10.0f} reports/s'
+    if name in baseline:
+        line += f'   baseline {baseline[name]:10.0f}   {100 * (rate / baseline[name] - 1):+6.1f}%'
+    return line
+
+
+def _run_pyperf(arguments: list, count: int, names: list):
+    """
+    Runs the cases with pyperf. The workers are started as a module, like the suite, so benchmarks is
+    importable, and with the same --count and --case: they are parsed before the options of pyperf.
+    :param arguments: the options of pyperf
+    :param count: number of reports of each corpus
+    :param names: the cases to run, None for all of them
+    """
+    import pyperf
+
+    program_args = ['-m', 'benchmarks.bench_suite', '--pyperf', '--count', str(count)]
+    for name in names or ():
+        program_args += ['--case', name]
+    runner = pyperf.Runner(program_args=tuple(program_args))
+    runner.parse_args(arguments)
+    for name, (function, reports) in cases(count).items():
+        if not names or name in names:
+            runner.bench_func(name, function, inner_loops=reports)
+
+
+def main():
+    # No abbreviations, so that the options of pyperf are never taken for those of the suite.
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     allow_abbrev=False)
+    parser.add_argument('--count', type=int, default=1000, help='reports of each corpus')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--case', action='append', help='run only this case, can be repeated')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline file, default %(default)s')
+    parser.add_argument('--save', action='store_true', help='store the rates as the new baseline')
+    parser.add_argument('--pyperf', action='store_true', help='run the cases with pyperf')
+    args, others = parser.parse_known_args()
+    if args.pyperf:
+        _run_pyperf(others, args.count, args.case)
+        return
+    if others:
+        parser.error(f'unrecognized arguments: {" ".join(others)}')
+    baseline = load_baseline(args.baseline)
+    rates = {}
+    for name, (function, reports) in cases(args.count).items():
+        if args.case and name not in args.case:
+            continue
+        rates[name] = measure(function, reports, args.repeat)
+        print(compare(name, rates[name], baseline))
+    if args.save:
+        save_baseline(args.baseline, {**baseline, **rates})
+        print(f'baseline saved to {args.baseline}')
+
+
+if __name__ == '__main__':
+    main()
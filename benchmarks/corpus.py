@@ -0,0 +1,136 @@
+"""
+Synthetic but realistic corpora for the benchmarks.
+
+The messages are built from the groups seen in real reports, with a fixed seed so every run
+measures the same messages:
+
+- european_metars: ICAO stations, winds in knots with variations, metric visibility, runway
+  visual ranges, Q pressure and NOSIG/TEMPO/BECMG trends;
+- us_metars: US stations, statute miles, A pressure and long RMK sections;
+- tafs: multi-line TAFs with FM, BECMG, TEMPO and PROB30 TEMPO groups;
+- long_tafs: amended TAFs on a single line with 8 to 12 change groups;
+- remarks: the RMK sections of us_metars.
+"""
+import random
+
+SEED = 20240917
+
+EUROPEAN_STATIONS = ['LFPG', 'LFBD', 'EGLL', 'EDDF', 'LEMD', 'LIRF', 'EHAM', 'LSZH', 'EBBR', 'LOWW', 'EKCH', 'ESSA']
+US_STATIONS = ['KJFK', 'KTTN', 'KORD', 'KATL', 'KDEN', 'KSEA', 'KBOS', 'KLAX', 'KMSP', 'KLWT']
+
+WEATHER = ['', '', '', '-RA', 'RA', '+SHRA', '-DZ', 'BR', 'FG', 'VCSH', '-SN', 'TSRA', 'FZFG', 'MIFG', 'BCFG']
+CLOUDS = ['FEW', 'SCT', 'BKN', 'OVC']
+TRENDS = ['NOSIG', 'NOSIG', 'TEMPO 4000 RA', 'BECMG 9999 NSW', 'TEMPO FM1830 3000 BR', 'BECMG AT1900 SCT015', '']
+REMARKS = ['PK WND 28045/15', 'WSHFT 30 FROPA', 'RAB05E30', 'CIG 005V010', 'VIS 1/2V2', '60012', '70125', '4/021',
+           '98123', 'TS SE MOV NE', '10142', '20012', '53012', 'PRESRR', 'FZRANO', 'TSNO', 'BKN014 V OVC',
+           'SFC VIS 1 1/2', 'GR 1 3/4', 'VIRGA', 'ACFT MSHP']
+
+
+def _time(rng: random.Random) -> str:
+    return f'{rng.randint(1, 28):02d}{rng.randint(0, 23):02d}{rng.choice(("00", "20", "50", "53"))}Z'
+
+
+def _wind(rng: random.Random, gust_rate: float = 0.2) -> str:
+    if rng.random() < 0.05:
+        return f'VRB0{rng.randint(1, 4)}KT'
+    direction = rng.randrange(0, 360, 10)
+    speed = rng.randint(2, 25)
+    gust = f'G{speed + rng.randint(8, 15)}' if rng.random() < gust_rate else ''
+    return f'{direction:03d}{speed:02d}{gust}KT'
+
+
+def _clouds(rng: random.Random) -> list:
+    heights = sorted(rng.sample(range(3, 250), rng.randint(1, 3)))
+    clouds = [f'{rng.choice(CLOUDS)}{height:03d}' for height in heights]
+    if rng.random() < 0.15:
+        clouds[0] += 'CB'
+    return clouds
+
+
+def _signed(value: int) -> str:
+    return f'M{-value:02d}' if value < 0 else f'{value:02d}'
+
+
+def _temperatures(rng: random.Random) -> str:
+    temperature = rng.randint(-10, 30)
+    return f'{_signed(temperature)}/{_signed(temperature - rng.randint(0, 12))}'
+
+
+def european_metar(rng: random.Random) -> str:
+    wind = _wind(rng)
+    groups = [rng.choice(EUROPEAN_STATIONS), _time(rng)]
+    if rng.random() < 0.2:
+        groups.append('AUTO')
+    groups.append(wind)
+    if rng.random() < 0.15:
+        direction = int(wind[:3]) if wind[:3].isdigit() else 180
+        groups.append(f'{(direction - 40) % 360:03d}V{(direction + 40) % 360:03d}')
+    if rng.random() < 0.2:
+        groups.append('CAVOK')
+    else:
+        groups.append(rng.choice(['9999', '9999', '8000', '4000', '1500', '0350']))
+        if rng.random() < 0.1:
+            groups.append(f'R{rng.choice(["27L", "09R", "26", "08L"])}/0{rng.randint(2, 9)}00{rng.choice("NUD")}')
+        groups += filter(None, [rng.choice(WEATHER)])
+        groups += _clouds(rng)
+    groups += [_temperatures(rng), f'Q{rng.randint(990, 1035):04d}']
+    groups += filter(None, [rng.choice(TRENDS)])
+    return ' '.join(groups)
+
+
+def us_metar(rng: random.Random) -> str:
+    groups = [rng.choice(US_STATIONS), _time(rng), _wind(rng, 0.3)]
+    groups.append(rng.choice(['10SM', '10SM', '6SM', '3SM', '1 1/2SM', '1/2SM']))
+    groups += filter(None, [rng.choice(WEATHER)])
+    groups += _clouds(rng)
+    groups += [_temperatures(rng), f'A{rng.randint(2950, 3050)}']
+    groups += ['RMK', rng.choice(['AO2', 'AO1']), f'SLP{rng.randint(0, 999):03d}', f'T{rng.randint(0, 300):04d}{rng.randint(0, 200):04d}']
+    groups += rng.sample(REMARKS, rng.randint(1, 6))
+    return ' '.join(groups)
+
+
+def taf(rng: random.Random, groups: tuple = (2, 5), amended: bool = False, separator: str = '\n') -> str:
+    day = rng.randint(1, 27)
+    hour = rng.choice([0, 6, 12, 18])
+    lines = [f'TAF {"AMD " if amended else ""}{rng.choice(EUROPEAN_STATIONS + US_STATIONS)} {day:02d}{hour:02d}00Z '
+             f'{day:02d}{hour:02d}/{day + 1:02d}{hour:02d} {_wind(rng)} 9999 {" ".join(_clouds(rng))}']
+    for index in range(rng.randint(*groups)):
+        start = (hour + 3 * index + 2) % 24
+        kind = rng.choice(['FM', 'BECMG', 'TEMPO', 'PROB30 TEMPO', 'PROB40'])
+        if kind == 'FM':
+            line = f'FM{day:02d}{start:02d}00 {_wind(rng)} {rng.choice(["9999", "6000", "P6SM"])}'
+        else:
+            line = f'{kind} {day:02d}{start:02d}/{day:02d}{min(start + 3, 24):02d} {rng.choice(["4000", "3000", "9999"])}'
+        line += ' ' + ' '.join(filter(None, [rng.choice(WEATHER)] + _clouds(rng)))
+        lines.append(line)
+    lines[-1] += f' TX{rng.randint(10, 30):02d}/{day:02d}15Z TN{_signed(rng.randint(-5, 9))}/{day + 1:02d}05Z'
+    return separator.join(lines)
+
+
+def long_taf(rng: random.Random) -> str:
+    return taf(rng, (8, 12), True, ' ')
+
+
+def _generate(factory, count: int) -> list:
+    rng = random.Random(f'{SEED}-{factory.__name__}')
+    return [factory(rng) for _ in range(count)]
+
+
+def european_metars(count: int = 1000) -> list:
+    return _generate(european_metar, count)
+
+
+def us_metars(count: int = 1000) -> list:
+    return _generate(us_metar, count)
+
+
+def tafs(count: int = 500) -> list:
+    return _generate(taf, count)
+
+
+def long_tafs(count: int = 500) -> list:
+    return _generate(long_taf, count)
+
+
+def remarks(count: int = 1000) -> list:
+    return [message.split(' RMK ', 1)[1] for message in us_metars(count)]
@@ -0,0 +1,343 @@
+"""
+Converts batches of METAR into columns.
+
+Each column is a typed array.array filled row by row, with a validity mask telling which
+rows have a value: 1 when the field is set, 0 when it is None in the Metar. The arrays are
+preallocated and grown by doubling, so a batch costs a few contiguous buffers instead of
+one object graph per report. The Metar objects are only read while they are added: with a
+generator such as iter_metars, each report can be released as soon as it is in the columns.
+
+parse_columns goes one step further and does not build the Metar objects at all: the parser
+writes the decoded fields straight into a MetarSink, see MetarParser.parse_into.
+
+numpy and pyarrow are optional. They are only imported by to_numpy and to_arrow.
+"""
+import abc
+from array import array
+from typing import Optional
+
+from metar_taf_parser.commons.converter import convert_speed_to_knots, convert_visibility_to_km, visibility_bound
+from metar_taf_parser.parser.parser import MetarParser, ParseFailure, ON_ERROR_RAISE, ON_ERROR_COLLECT, \
+    _ON_ERROR_MODES
+
+STATION = 'station'
+DEFAULT_CAPACITY = 1024
+
+# Name and array typecode of the numeric columns, in the order of the values returned by _metar_row.
+# The wind speeds are in knots whatever the unit of the message. visibility_bound is 1 when the
+# visibility is greater than visibility_km (P6SM, 9999, CAVOK), -1 when it is lower (M1/4SM), 0 otherwise.
+METAR_COLUMNS = (
+    ('day', 'b'),
+    ('hour', 'b'),
+    ('minute', 'b'),
+    ('wind_degrees', 'h'),
+    ('wind_speed', 'd'),
+    ('wind_gust', 'd'),
+    ('visibility_km', 'd'),
+    ('visibility_bound', 'b'),
+    ('cloud_base', 'i'),
+    ('temperature', 'h'),
+    ('dew_point', 'h'),
+    ('altimeter', 'h'),
+)
+
+_NUMPY_TYPES = {'b': 'int8', 'h': 'int16', 'i': 'int32', 'd': 'float64'}
+_DAY, _HOUR, _MINUTE, _WIND_DEGREES, _WIND_SPEED, _WIND_GUST, _VISIBILITY_KM, _VISIBILITY_BOUND, _CLOUD_BASE, \
+    _TEMPERATURE, _DEW_POINT, _ALTIMETER = range(len(METAR_COLUMNS))
+
+
+def _metar_row(metar) -> tuple:
+    """
+    :param metar: the Metar to convert
+    :return: tuple of the values of the numeric columns, None when the field is not set
+    """
+    wind = metar.wind
+    visibility = metar.visibility
+    time = metar.time
+    visibility_km = bound = None
+    if visibility is not None and visibility.distance is not None and visibility.unit is not None:
+        visibility_km = convert_visibility_to_km(visibility.distance, visibility.unit.value)
+        if visibility_km is not None:
+            bound = visibility_bound(visibility.distance)
+    heights = [cloud.height for cloud in metar.clouds if cloud.height is not None]
+    return (
+        metar.day,
+        None if time is None else time.hour,
+        None if time is None else time.minute,
+        None if wind is None else wind.degrees,
+        None if wind is None else convert_speed_to_knots(wind.speed, wind.unit),
+        None if wind is None or wind.gust is None else convert_speed_to_knots(wind.gust, wind.unit),
+        visibility_km,
+        bound,
+        min(heights) if heights else None,
+        metar.temperature,
+        metar.dew_point,
+        metar.altimeter,
+    )
+
+
+class MetarColumns:
+    """
+    Columns of a batch of METAR. A column is read with columns[name] and its validity mask with
+    columns.valid(name). The station column is a list of strings and has no mask.
+    """
+    __slots__ = ('_size', '_stations', '_values', '_valid')
+
+    def __init__(self, size: int, stations: list, values: dict, valid: dict):
+        self._size = size
+        self._stations = stations
+        self._values = values
+        self._valid = valid
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, name: str):
+        if name == STATION:
+            return self._stations
+        return self._values[name]
+
+    def valid(self, name: str) -> bytearray:
+        """
+        :param name: the name of a numeric column
+        :return: the validity mask of the column, 1 when the row has a value
+        """
+        return self._valid[name]
+
+    def names(self) -> list:
+        return [STATION] + [name for name, typecode in METAR_COLUMNS]
+
+    def to_numpy(self) -> dict:
+        """
+        Converts the columns to numpy arrays. Numeric columns are masked arrays sharing the buffers of the columns.
+        Requires numpy.
+        :return: dict mapping a column name to its array
+        """
+        import numpy
+
+        result = {STATION: numpy.array(self._stations, dtype=object)}
+        for name, typecode in METAR_COLUMNS:
+            values = numpy.frombuffer(self._values[name], dtype=_NUMPY_TYPES[typecode])
+            valid = numpy.frombuffer(self._valid[name], dtype=numpy.bool_)
+            result[name] = numpy.ma.MaskedArray(values, mask=~valid)
+        return result
+
+    def to_arrow(self):
+        """
+        Converts the columns to a pyarrow Table. Requires numpy and pyarrow.
+        :return: pyarrow.Table
+        """
+        import numpy
+        import pyarrow
+
+        arrays = [pyarrow.array(self._stations, type=pyarrow.string())]
+        for name, typecode in METAR_COLUMNS:
+            values = numpy.frombuffer(self._values[name], dtype=_NUMPY_TYPES[typecode])
+            valid = numpy.frombuffer(self._valid[name], dtype=numpy.bool_)
+            arrays.append(pyarrow.array(values, mask=~valid))
+        return pyarrow.Table.from_arrays(arrays, names=self.names())
+
+    def __repr__(self):
+        return f'MetarColumns[size={self._size}, names={self.names()}]'
+
+
+class MetarSink(abc.ABC):
+    """
+    Receives the fields of METAR decoded by MetarParser.parse_into, one report at a time.
+    begin is called first, then the setters in the order of the tokens, then end.
+    A setter can be called several times for a report, the last call wins.
+    """
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def begin(self, station: str):
+        pass
+
+    @abc.abstractmethod
+    def set_time(self, day: int, hour: int, minute: int):
+        pass
+
+    @abc.abstractmethod
+    def set_wind(self, degrees: Optional[int], speed: float, gust: Optional[float]):
+        """
+        :param degrees: the direction in degrees, None when the wind is variable
+        :param speed: the speed in knots, whatever the unit of the message
+        :param gust: the speed of the gusts in knots
+        """
+        pass
+
+    @abc.abstractmethod
+    def set_visibility(self, distance_km: Optional[float], bound: int = 0):
+        """
+        :param bound: 1 when the visibility is greater than the distance, -1 when it is lower, 0 otherwise
+        """
+        pass
+
+    @abc.abstractmethod
+    def add_cloud(self, height: Optional[int]):
+        """
+        :param height: the height of the layer in feet, None when it is not reported
+        """
+        pass
+
+    @abc.abstractmethod
+    def set_temperatures(self, temperature: int, dew_point: int):
+        pass
+
+    @abc.abstractmethod
+    def set_altimeter(self, altimeter: int):
+        pass
+
+    @abc.abstractmethod
+    def end(self):
+        pass
+
+
+class MetarColumnBuilder(MetarSink):
+    """
+    Fills the columns of a batch of METAR one report at a time, either from Metar objects with add
+    or as the MetarSink of MetarParser.parse_into.
+    """
+    __slots__ = ('_size', '_capacity', '_stations', '_values', '_valid')
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        :param capacity: number of rows preallocated. The arrays double in size when they are full.
+        """
+        self._capacity = max(capacity, 1)
+        self._reset()
+
+    def _reset(self):
+        self._size = 0
+        self._stations = []
+        self._values = [array(typecode, bytes(array(typecode).itemsize * self._capacity))
+                        for name, typecode in METAR_COLUMNS]
+        self._valid = [bytearray(self._capacity) for column in METAR_COLUMNS]
+
+    def _grow(self):
+        for values in self._values:
+            values.extend(array(values.typecode, bytes(values.itemsize * self._capacity)))
+        for valid in self._valid:
+            valid.extend(bytes(self._capacity))
+        self._capacity *= 2
+
+    def _set(self, column: int, value):
+        row = self._size
+        if value is None:
+            self._valid[column][row] = 0
+        else:
+            self._values[column][row] = value
+            self._valid[column][row] = 1
+
+    def __len__(self):
+        return self._size
+
+    def add(self, metar):
+        """
+        Adds a row with the fields of a Metar.
+        :param metar: the Metar to add
+        :return: None
+        """
+        self.begin(metar.station)
+        for column, value in enumerate(_metar_row(metar)):
+            self._set(column, value)
+        self.end()
+
+    def begin(self, station: str):
+        """
+        Starts a row. A row started but not ended, e.g. because the parsing failed, is overwritten.
+        """
+        row = self._size
+        if row == self._capacity:
+            self._grow()
+        del self._stations[row:]
+        self._stations.append(station)
+        for valid in self._valid:
+            valid[row] = 0
+
+    def set_time(self, day: int, hour: int, minute: int):
+        self._set(_DAY, day)
+        self._set(_HOUR, hour)
+        self._set(_MINUTE, minute)
+
+    def set_wind(self, degrees: Optional[int], speed: float, gust: Optional[float]):
+        self._set(_WIND_DEGREES, degrees)
+        self._set(_WIND_SPEED, speed)
+        self._set(_WIND_GUST, gust)
+
+    def set_visibility(self, distance_km: Optional[float], bound: int = 0):
+        self._set(_VISIBILITY_KM, distance_km)
+        self._set(_VISIBILITY_BOUND, None if distance_km is None else bound)
+
+    def add_cloud(self, height: Optional[int]):
+        row = self._size
+        if height is not None and (not self._valid[_CLOUD_BASE][row] or height < self._values[_CLOUD_BASE][row]):
+            self._set(_CLOUD_BASE, height)
+
+    def set_temperatures(self, temperature: int, dew_point: int):
+        self._set(_TEMPERATURE, temperature)
+        self._set(_DEW_POINT, dew_point)
+
+    def set_altimeter(self, altimeter: int):
+        self._set(_ALTIMETER, altimeter)
+
+    def end(self):
+        self._size += 1
+
+    def build(self) -> MetarColumns:
+        """
+        Returns the columns filled so far, trimmed to the number of rows, and empties the builder.
+        :return: MetarColumns
+        """
+        size = self._size
+        del self._stations[size:]
+        for values in self._values:
+            del values[size:]
+        for valid in self._valid:
+            del valid[size:]
+        names = [name for name, typecode in METAR_COLUMNS]
+        columns = MetarColumns(size, self._stations, dict(zip(names, self._values)), dict(zip(names, self._valid)))
+        self._reset()
+        return columns
+
+
+def to_columns(metars, capacity: int = DEFAULT_CAPACITY) -> MetarColumns:
+    """
+    Converts METAR into columns.
+    :param metars: iterable of Metar, e.g. a list or the generator returned by iter_metars
+    :param capacity: number of rows preallocated
+    :return: MetarColumns
+    """
+    builder = MetarColumnBuilder(capacity)
+    for metar in metars:
+        builder.add(metar)
+    return builder.build()
+
+
+def parse_columns(messages, on_error: str = ON_ERROR_RAISE, capacity: int = DEFAULT_CAPACITY,
+                  parser: MetarParser = None) -> tuple:
+    """
+    Parses METAR messages straight into columns, without building the Metar objects.
+    Only the tokens holding the fields of the columns are decoded: trends and remarks are skipped,
+    so a message is not rejected for an error in one of these parts.
+    :param messages: iterable of METAR messages, e.g. split_metars of the lines of a file
+    :param on_error: 'raise', 'skip' or 'collect', see AbstractParser.parse_many.
+        The messages that cannot be parsed are left out of the columns.
+    :param capacity: number of rows preallocated
+    :param parser: the MetarParser to use, a new one by default
+    :return: tuple (MetarColumns, errors) where errors is a list of ParseFailure, filled with on_error='collect'
+    """
+    if on_error not in _ON_ERROR_MODES:
+        raise ValueError(f'on_error must be one of {_ON_ERROR_MODES}, got {on_error!r}')
+    parser = parser or MetarParser()
+    builder = MetarColumnBuilder(capacity)
+    errors = []
+    for index, message in enumerate(messages):
+        try:
+            parser.parse_into(message, builder)
+        except Exception as error:
+            if on_error == ON_ERROR_RAISE:
+                raise
+            if on_error == ON_ERROR_COLLECT:
+                errors.append(ParseFailure(index, error))
+    return builder.build(), errors
@@ -1,10 +1,13 @@
 
 import re
 
+from metar_taf_parser.command.dispatch import DIGITS, UPPERCASE, LazyPattern, build_dispatch_table, classify
 from metar_taf_parser.commons import converter
-from metar_taf_parser.commons.converter import convert_visibility
+from metar_taf_parser.commons.converter import convert_speed_to_knots, convert_visibility, convert_visibility_to_km, \
+    visibility_bound
 from metar_taf_parser.model.enum import CloudQuantity, CloudType, LengthUnit
-from metar_taf_parser.model.model import Visibility, Wind, WindShear, Cloud, AbstractWeatherContainer
+from metar_taf_parser.model.model import Visibility, Wind, WindShear, Cloud, AbstractWeatherContainer, \
+    interned, is_frozen, thaw
 
 
 def set_wind_elements(wind: Wind, direction: str, speed: str, gust: str, unit: str):
@@ -33,12 +36,14 @@ def set_wind_elements(wind: Wind, direction: str, speed: str, gust: str, unit: s
 class CloudCommand:
     cloud_regex = r'^([A-Z]{3})((\d{3}|/{3})([A-Z]{2,3}|/{3})?)?$'
     undefined = '///'
-
-    def __init__(self):
-        self._pattern = re.compile(CloudCommand.cloud_regex)
+    leading_chars = UPPERCASE
+    _pattern = LazyPattern('cloud_regex')
 
     def parse(self, cloud_string: str):
-        m = self._pattern.search(cloud_string).groups()
+        return self.parse_match(self._pattern.search(cloud_string))
+
+    def parse_match(self, match):
+        m = match.groups()
         cloud = Cloud()
         try:
             if CloudQuantity[m[0]]:
@@ -53,38 +58,61 @@ class CloudCommand:
             return
 
     def execute(self, container: AbstractWeatherContainer, cloud_string: str):
-        cloud = self.parse(cloud_string)
+        return self.execute_match(container, self._pattern.search(cloud_string))
+
+    def execute_match(self, container: AbstractWeatherContainer, match):
+        return self.apply(container, self.parse_match(match))
+
+    def decode_match(self, match):
+        return self.parse_match(match)
+
+    def apply(self, container: AbstractWeatherContainer, cloud: Cloud):
         if cloud and cloud.quantity:
             container.add_cloud(cloud)
             return True
 
+    def write_match(self, sink, match):
+        m = match.groups()
+        if m[0] not in CloudQuantity.__members__:
+            return
+        if m[3] and m[3] != CloudCommand.undefined and m[3] not in CloudType.__members__:
+            return
+        sink.add_cloud(100 * int(m[2]) if m[2] and m[2] != CloudCommand.undefined else None)
+        return True
+
     def can_parse(self, cloud_string: str):
         return self._pattern.search(cloud_string)
 
 
 class MainVisibilityCommand:
     regex = r'^(\d{4})(|NDV)$'
-
-    def __init__(self):
-        self._pattern = re.compile(MainVisibilityCommand.regex)
+    leading_chars = DIGITS
+    _pattern = LazyPattern()
 
     def can_parse(self, visibility_string: str):
         return self._pattern.search(visibility_string)
 
     def execute(self, container: AbstractWeatherContainer, visibility_string: str):
-        matches = self._pattern.search(visibility_string).groups()
+        return self.execute_match(container, self._pattern.search(visibility_string))
+
+    def execute_match(self, container: AbstractWeatherContainer, match):
+        matches = match.groups()
         if container.visibility is None:
             container.visibility = Visibility()
         container.visibility.distance = convert_visibility(matches[0])
         container.visibility.unit = LengthUnit.METERS
         return True
 
+    def write_match(self, sink, match):
+        distance = convert_visibility(match.group(1))
+        sink.set_visibility(convert_visibility_to_km(distance, LengthUnit.METERS.value), visibility_bound(distance))
+        return True
+
 
 class WindCommand:
     regex = r'^(VRB|000|[0-3]\d{2})(\d{2})G?(\d{2,3})?(KT|MPS|KM\/H)?'
-
-    def __init__(self):
-        self._pattern = re.compile(WindCommand.regex)
+    leading_chars = 'V0123'
+    _pattern = LazyPattern()
 
     def can_parse(self, wind_string: str):
         """
@@ -96,48 +124,80 @@ class WindCommand:
         return self._pattern.search(wind_string)
 
     def parse_wind(self, wind_string: str):
+        return self.parse_wind_match(self._pattern.search(wind_string))
+
+    def parse_wind_match(self, match):
         wind = Wind()
-        matches = self._pattern.search(wind_string).groups()
+        matches = match.groups()
         set_wind_elements(wind, matches[0], matches[1], matches[2], matches[3])
         return wind
 
     def execute(self, container: AbstractWeatherContainer, wind_string: str):
-        wind = self.parse_wind(wind_string)
+        return self.execute_match(container, self._pattern.search(wind_string))
+
+    def execute_match(self, container: AbstractWeatherContainer, match):
+        return self.apply(container, self.parse_wind_match(match))
+
+    def decode_match(self, match):
+        return self.parse_wind_match(match)
+
+    def apply(self, container: AbstractWeatherContainer, wind: Wind):
         container.wind = wind
         return True
 
+    def write_match(self, sink, match):
+        matches = match.groups()
+        unit = matches[3]
+        sink.set_wind(None if 'VRB' == matches[0] else int(matches[0]), convert_speed_to_knots(int(matches[1]), unit),
+                      convert_speed_to_knots(int(matches[2]), unit) if matches[2] else None)
+        return True
+
 
 class WindVariationCommand:
     regex = r'^(\d{3})V(\d{3})'
-
-    def __init__(self):
-        self._pattern = re.compile(WindVariationCommand.regex)
+    leading_chars = DIGITS
+    _pattern = LazyPattern()
 
     def can_parse(self, wind_string: str):
         return self._pattern.search(wind_string)
 
     def parse_wind_variation(self, wind: Wind, wind_string: str):
-        matches = self._pattern.search(wind_string).groups()
+        self.parse_wind_variation_match(wind, self._pattern.search(wind_string))
+
+    def parse_wind_variation_match(self, wind: Wind, match):
+        matches = match.groups()
         wind.min_variation = int(matches[0])
         wind.max_variation = int(matches[1])
 
     def execute(self, container, wind_string):
-        self.parse_wind_variation(container.wind, wind_string)
+        return self.execute_match(container, self._pattern.search(wind_string))
+
+    def execute_match(self, container, match):
+        wind = container.wind
+        if is_frozen(wind):
+            # The wind is shared by a token memo, the variation goes to a copy.
+            wind = container.wind = thaw(wind)
+        self.parse_wind_variation_match(wind, match)
+        return True
+
+    def write_match(self, sink, match):
         return True
 
 
 class WindShearCommand:
     regex = r'^WS(\d{3})\/(\w{3})(\d{2})G?(\d{2,3})?(KT|MPS|KM\/H)'
-
-    def __init__(self):
-        self._pattern = re.compile(WindShearCommand.regex)
+    leading_chars = 'W'
+    _pattern = LazyPattern()
 
     def can_parse(self, wind_string: str):
         return self._pattern.search(wind_string)
 
     def parse_wind_shear(self, wind_string: str):
+        return self.parse_wind_shear_match(self._pattern.search(wind_string))
+
+    def parse_wind_shear_match(self, match):
         wind_shear = WindShear()
-        matches = self._pattern.search(wind_string).groups()
+        matches = match.groups()
 
         wind_shear.height = 100 * int(matches[0])
         wind_shear.height_unit = LengthUnit.FEET
@@ -145,32 +205,48 @@ class WindShearCommand:
         return wind_shear
 
     def execute(self, container: AbstractWeatherContainer, wind_string: str):
-        container.wind_shear = self.parse_wind_shear(wind_string)
+        return self.execute_match(container, self._pattern.search(wind_string))
+
+    def execute_match(self, container: AbstractWeatherContainer, match):
+        return self.apply(container, self.parse_wind_shear_match(match))
+
+    def decode_match(self, match):
+        return self.parse_wind_shear_match(match)
+
+    def apply(self, container: AbstractWeatherContainer, wind_shear: WindShear):
+        container.wind_shear = wind_shear
+        return True
+
+    def write_match(self, sink, match):
         return True
 
 
 class VerticalVisibilityCommand:
 
     regex = r'^VV(\d{3})$'
-
-    def __init__(self):
-        self._pattern = re.compile(VerticalVisibilityCommand.regex)
+    leading_chars = 'V'
+    _pattern = LazyPattern()
 
     def execute(self, container: AbstractWeatherContainer, visibility_string: str):
-        matches = self._pattern.search(visibility_string).groups()
+        return self.execute_match(container, self._pattern.search(visibility_string))
+
+    def execute_match(self, container: AbstractWeatherContainer, match):
+        matches = match.groups()
         container.vertical_visibility = 100 * int(matches[0])
         container.vertical_visibility_unit = LengthUnit.FEET
         return True
 
+    def write_match(self, sink, match):
+        return True
+
     def can_parse(self, visibility_string: str):
         return self._pattern.search(visibility_string)
 
 
 class MinimalVisibilityCommand:
     regex = r'^(\d{4})(N|NE|E|SE|S|SW|W|NW)$'
-
-    def __init__(self):
-        self._pattern = re.compile(MinimalVisibilityCommand.regex, re.IGNORECASE)
+    leading_chars = DIGITS
+    _pattern = LazyPattern(flags=re.IGNORECASE)
 
     def can_parse(self, visibility_string: str):
         return self._pattern.search(visibility_string)
@@ -182,7 +258,10 @@ class MinimalVisibilityCommand:
         :param visibility_string: string
         :return:
         """
-        matches = self._pattern.search(visibility_string).groups()
+        return self.execute_match(container, self._pattern.search(visibility_string))
+
+    def execute_match(self, container: AbstractWeatherContainer, match):
+        matches = match.groups()
         if container.visibility is None:
             container.visibility = Visibility()
         container.visibility.min_distance = int(matches[0])
@@ -190,35 +269,70 @@ class MinimalVisibilityCommand:
         container.visibility.unit = LengthUnit.METERS
         return True
 
+    def write_match(self, sink, match):
+        return True
+
 
 class MainVisibilityNauticalMilesCommand:
 
     regex = r'^(P|M)?(\d)*(\s)?((\d\/\d)?SM)$'
-
-    def __init__(self):
-        self._pattern = re.compile(MainVisibilityNauticalMilesCommand.regex)
+    leading_chars = 'PMS' + DIGITS
+    _pattern = LazyPattern()
 
     def can_parse(self, wind_string: str):
         return self._pattern.search(wind_string)
 
     def execute(self, container: AbstractWeatherContainer, visibility_string: str):
+        return self.execute_match(container, self._pattern.search(visibility_string))
+
+    def execute_match(self, container: AbstractWeatherContainer, match):
         if container.visibility is None:
             container.visibility = Visibility()
-        container.visibility.distance = re.sub(r'SM$', '', visibility_string).strip()
+        # The unit ends the token, it is removed from the distance.
+        container.visibility.distance = match.string[:match.end(4) - 2].strip()
         container.visibility.unit = LengthUnit.STATUTE_MILES
         return True
 
+    def write_match(self, sink, match):
+        distance = match.string[:match.end(4) - 2].strip()
+        sink.set_visibility(convert_visibility_to_km(distance, LengthUnit.STATUTE_MILES.value),
+                            visibility_bound(distance))
+        return True
+
 
 class CommandSupplier:
 
     def __init__(self):
-        self._commands = [
+        self._commands = (
             WindShearCommand(), WindCommand(), WindVariationCommand(), MainVisibilityCommand(),
             MainVisibilityNauticalMilesCommand(), MinimalVisibilityCommand(),
             VerticalVisibilityCommand(), CloudCommand()
-        ]
+        )
+        self._dispatch_table = build_dispatch_table(self._commands)
 
     def get(self, input: str):
-        for command in self._commands:
-            if command.can_parse(input):
-                return command
+        return self.classify(input)[0]
+
+    def classify(self, input: str):
+        """
+        Finds the command able to parse the token with a single lookup on its first character.
+        :param input: the token to parse
+        :return: tuple (command, match), (None, None) if no command can parse the token
+        """
+        return classify(self._dispatch_table, input)
+
+    def decode(self, input: str) -> tuple:
+        """
+        Decodes a token for a token memo. The decoded value is interned so it can be shared by the reports.
+        The intern table only holds it weakly: it is released with the memo entry and the reports using it.
+        :param input: the token to decode
+        :return: tuple (apply, value) where apply(container, value) updates a container like execute_match,
+            (None, None) if no command can parse the token
+        """
+        command, match = self.classify(input)
+        if command is None:
+            return None, None
+        decode_match = getattr(command, 'decode_match', None)
+        if decode_match is None:
+            return command.execute_match, match
+        return command.apply, interned(decode_match(match))
@@ -0,0 +1,72 @@
+import functools
+import re
+import string
+
+DIGITS = string.digits
+UPPERCASE = string.ascii_uppercase
+
+
+def build_dispatch_table(commands: list) -> dict:
+    """
+    Indexes commands by the first character of the tokens they can parse.
+    Each bucket keeps the order of the commands list, so the command found for a token
+    is the same as the one a linear scan of the list would return.
+    :param commands: list of commands exposing a leading_chars attribute
+    :return: dict mapping a character to the tuple of candidate commands
+    """
+    table = {}
+    for command in commands:
+        for char in command.leading_chars:
+            table.setdefault(char, []).append(command)
+    return {char: tuple(candidates) for char, candidates in table.items()}
+
+
+def classify(table: dict, input: str) -> tuple:
+    """
+    Finds the command able to parse a token using a dispatch table.
+    :param table: the dispatch table built by build_dispatch_table
+    :param input: the token to parse
+    :return: tuple (command, match) or (None, None) if no command can parse the token
+    """
+    for command in table.get(input[:1], ()):
+        match = command.can_parse(input)
+        if match:
+            return command, match
+    return None, None
+
+
+@functools.lru_cache(maxsize=None)
+def shared_supplier(supplier_class):
+    """
+    Builds a command supplier once per process. The suppliers and their commands hold no state, so
+    a single instance of each supplier is shared by all the parsers.
+    :param supplier_class: the class of the supplier, built without argument
+    :return: the shared instance of the class
+    """
+    return supplier_class()
+
+
+class LazyPattern:
+    """
+    Class attribute holding the compiled regex of a command. The regex is compiled the first time the
+    attribute is read, then the compiled pattern replaces the attribute on the class: importing the
+    commands or building the suppliers compiles nothing, and the commands never used are never compiled.
+    """
+    __slots__ = ('_regex_attribute', '_flags', '_owner', '_name')
+
+    def __init__(self, regex_attribute: str = 'regex', flags: int = 0):
+        """
+        :param regex_attribute: name of the class attribute holding the regex
+        :param flags: flags of re.compile
+        """
+        self._regex_attribute = regex_attribute
+        self._flags = flags
+
+    def __set_name__(self, owner, name):
+        self._owner = owner
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+        pattern = re.compile(getattr(self._owner, self._regex_attribute), self._flags)
+        setattr(self._owner, self._name, pattern)
+        return pattern
@@ -1,5 +1,4 @@
-import re
-
+from metar_taf_parser.command.dispatch import DIGITS, LazyPattern, build_dispatch_table, classify
 from metar_taf_parser.commons import converter
 from metar_taf_parser.commons.exception import ParseError
 from metar_taf_parser.model.enum import DepositType, DepositCoverage, LengthUnit
@@ -9,9 +8,8 @@ from metar_taf_parser.commons.i18n import _
 
 class AltimeterCommand:
     regex = r'^Q(\d{4})$'
-
-    def __init__(self):
-        self._pattern = re.compile(AltimeterCommand.regex)
+    leading_chars = 'Q'
+    _pattern = LazyPattern()
 
     def can_parse(self, input: str):
         return self._pattern.search(input)
@@ -23,44 +21,54 @@ class AltimeterCommand:
         :param input: string
         :return:
         """
-        matches = self._pattern.search(input).groups()
-        metar.altimeter = int(matches[0])
+        self.execute_match(metar, self._pattern.search(input))
+
+    def execute_match(self, metar: Metar, match):
+        metar.altimeter = int(match.group(1))
+
+    def write_match(self, sink, match):
+        sink.set_altimeter(int(match.group(1)))
 
 
 class AltimeterMercuryCommand:
     regex = r'^A(\d{4})$'
-
-    def __init__(self):
-        self._pattern = re.compile(AltimeterMercuryCommand.regex)
+    leading_chars = 'A'
+    _pattern = LazyPattern()
 
     def can_parse(self, input: str):
         return self._pattern.search(input)
 
     def execute(self, metar: Metar, input: str):
-        matches = self._pattern.search(input).groups()
-        mercury = float(matches[0]) / 100
+        self.execute_match(metar, self._pattern.search(input))
+
+    def execute_match(self, metar: Metar, match):
+        mercury = float(match.group(1)) / 100
         metar.altimeter = int(converter.convert_inches_mercury_to_pascal(mercury))
 
+    def write_match(self, sink, match):
+        mercury = float(match.group(1)) / 100
+        sink.set_altimeter(int(converter.convert_inches_mercury_to_pascal(mercury)))
+
 
 def _parse_runway_unit(input: str):
     return LengthUnit.FEET if input == 'FT' else LengthUnit.METERS
 
 
 def _parse_runway(matches, metar, runway):
-    runway.name = matches[0][0]
-    runway.indicator = matches[0][1]
-    runway.min_range = int(matches[0][2])
-    runway.trend = matches[0][3]
-    runway.unit = _parse_runway_unit(matches[0][4])
+    runway.name = matches[0]
+    runway.indicator = matches[5]
+    runway.min_range = int(matches[6])
+    runway.trend = matches[7]
+    runway.unit = _parse_runway_unit(matches[8])
     metar.add_runway_info(runway)
 
 
 def _parse_runway_max_range(matches, metar, runway):
-    runway.name = matches[0][0]
-    runway.min_range = int(matches[0][1])
-    runway.max_range = int(matches[0][2])
-    runway.trend = matches[0][3]
-    runway.unit = _parse_runway_unit(matches[0][4])
+    runway.name = matches[0]
+    runway.min_range = int(matches[9])
+    runway.max_range = int(matches[10])
+    runway.trend = matches[11]
+    runway.unit = _parse_runway_unit(matches[12])
     metar.add_runway_info(runway)
 
 
@@ -69,12 +77,13 @@ class RunwayCommand:
     runway_max_range_regex = r'^R(\d{2}\w?)/(\d{4})V(\d{3,4})([UDN])?(FT)?'
     runway_regex = r'^R(\d{2}\w?)/([MP])?(\d{4})([UDN])?(FT)?$'
     runway_deposit_regex = r'^R(\d{2}\w?)/([/\d])([/\d])(//|\d{2})(//|\d{2})$'
+    # The three regexes above as alternatives of an optional group, tried in the same order.
+    # A token matching none of them is still claimed by the command, like with generic_regex.
+    runway_any_regex = r'^R(\d{2}\w?)/(?:([/\d])([/\d])(//|\d{2})(//|\d{2})$|([MP])?(\d{4})([UDN])?(FT)?$|(\d{4})V(\d{3,4})([UDN])?(FT)?)?'
+    leading_chars = 'R'
+    _pattern = LazyPattern('runway_any_regex')
 
     def __init__(self):
-        self._generic_pattern = re.compile(RunwayCommand.generic_regex)
-        self._max_range_pattern = re.compile(RunwayCommand.runway_max_range_regex)
-        self._runway_pattern = re.compile(RunwayCommand.runway_regex)
-        self._runway_deposit_pattern = re.compile(RunwayCommand.runway_deposit_regex)
         self._deposit_thickness = {
             '//': 'DepositThickness.//',
             '00': 'DepositThickness.00',
@@ -97,33 +106,36 @@ class RunwayCommand:
         }
 
     def can_parse(self, input: str):
-        return self._generic_pattern.match(input)
+        return self._pattern.match(input)
 
     def execute(self, metar: Metar, input: str):
-        matches = self._runway_deposit_pattern.findall(input)
+        match = self._pattern.match(input)
+        if match:
+            self.execute_match(metar, match)
+
+    def execute_match(self, metar: Metar, match):
+        # Groups of the alternatives that did not participate are empty strings.
+        matches = match.groups('')
         runway = RunwayInfo()
         try:
-            if matches:
+            if matches[1]:
                 self.__parse_runway_deposit(matches, metar, runway)
-                return
-
-            matches = self._runway_pattern.findall(input)
-            if matches:
+            elif matches[6]:
                 _parse_runway(matches, metar, runway)
-                return
-
-            matches = self._max_range_pattern.findall(input)
-            if matches:
+            elif matches[9]:
                 _parse_runway_max_range(matches, metar, runway)
         except ValueError:
             raise ParseError(_("ErrorCode.IncompleteRunwayInformation"))
 
+    def write_match(self, sink, match):
+        pass
+
     def __parse_runway_deposit(self, matches, metar, runway):
-        runway.name = matches[0][0]
-        runway.deposit_type = DepositType(matches[0][1])
-        runway.coverage = DepositCoverage(matches[0][2])
-        runway.thickness = self.__parse_deposit_thickness(matches[0][3])
-        runway.braking_capacity = self.__parse_deposit_braking_capacity(matches[0][4])
+        runway.name = matches[0]
+        runway.deposit_type = DepositType(matches[1])
+        runway.coverage = DepositCoverage(matches[2])
+        runway.thickness = self.__parse_deposit_thickness(matches[3])
+        runway.braking_capacity = self.__parse_deposit_braking_capacity(matches[4])
         metar.add_runway_info(runway)
 
     def __parse_deposit_thickness(self, input):
@@ -137,24 +149,37 @@ class RunwayCommand:
 
 class TemperatureCommand:
     regex = r'^(M?\d{2})/(M?\d{2})$'
-
-    def __init__(self):
-        self._pattern = re.compile(TemperatureCommand.regex)
+    leading_chars = 'M' + DIGITS
+    _pattern = LazyPattern()
 
     def can_parse(self, input: str):
         return self._pattern.match(input)
 
     def execute(self, metar: Metar, input: str):
-        matches = self._pattern.search(input).groups()
+        self.execute_match(metar, self._pattern.search(input))
+
+    def execute_match(self, metar: Metar, match):
+        matches = match.groups()
         metar.temperature = converter.convert_temperature(matches[0])
         metar.dew_point = converter.convert_temperature(matches[1])
 
+    def write_match(self, sink, match):
+        matches = match.groups()
+        sink.set_temperatures(converter.convert_temperature(matches[0]), converter.convert_temperature(matches[1]))
+
 
 class CommandSupplier:
     def __init__(self):
-        self._commands = [RunwayCommand(), TemperatureCommand(), AltimeterCommand(), AltimeterMercuryCommand()]
+        self._commands = (RunwayCommand(), TemperatureCommand(), AltimeterCommand(), AltimeterMercuryCommand())
+        self._dispatch_table = build_dispatch_table(self._commands)
 
     def get(self, input: str):
-        for command in self._commands:
-            if command.can_parse(input):
-                return command
+        return self.classify(input)[0]
+
+    def classify(self, input: str):
+        """
+        Finds the command able to parse the token with a single lookup on its first character.
+        :param input: the token to parse
+        :return: tuple (command, match), (None, None) if no command can parse the token
+        """
+        return classify(self._dispatch_table, input)
@@ -1,9 +1,10 @@
 import abc
-import re
 
+from metar_taf_parser.command.dispatch import UPPERCASE, LazyPattern, build_dispatch_table
 from metar_taf_parser.commons.converter import convert_temperature_remarks, convert_precipitation_amount
 from metar_taf_parser.commons.exception import TranslationError
-from metar_taf_parser.commons.i18n import _
+from metar_taf_parser.commons.i18n import DEFAULT_LOCALE, _, get_table, translate
+from metar_taf_parser.model.model import RemarkRecord
 
 
 CLOUD_QUANTITY = 'CloudQuantity.'
@@ -17,10 +18,88 @@ def empty_if_none(code: str) -> str:
     return '' if code is None else code
 
 
+def int_or_none(code: str):
+    return None if code is None else int(code)
+
+
+def two_digits(value) -> str:
+    """
+    Formats an hour or a minute of a record as it is written in the message.
+    :param value: int or None
+    :return: the value on two digits or an empty string
+    """
+    return '' if value is None else f'{value:02d}'
+
+
+def checked_code(prefix: str, code: str) -> str:
+    """
+    Checks a code of a group has a translation, without translating it.
+    Like _(), it raises TranslationError otherwise so the group is decoded word by word.
+    :param prefix: the prefix of the translation key, e.g. CONVERTER
+    :param code: the code found in the group
+    :return: the code
+    """
+    if prefix + code not in get_table(DEFAULT_LOCALE):
+        raise TranslationError(translation=prefix + code, message='Missing translation')
+    return code
+
+
 class Command(abc.ABC):
+    """
+    Decodes a group of the remark.
+    The patterns are applied with match() at an offset of the remark, so they are not anchored with '^'.
+    leading_chars lists the characters a group decoded by the command can start with.
+    A group is first decoded into a RemarkRecord of the command's kind, without translation.
+    translate() turns the values of a record into the remark text.
+    """
+    leading_chars = ''
+    kind = None
+
+    def execute(self, code: str, remark: list) -> tuple:
+        """
+        Decodes the group at the start of the code.
+        :param code: the remark left to decode
+        :param remark: the list of decoded remarks to update
+        :return: tuple (the remark left to decode, remark)
+        """
+        return code[self.execute_match(self._pattern.match(code), remark):], remark
+
+    def execute_match(self, match, remark: list) -> int:
+        """
+        Decodes and translates a group matched by the pattern of the command.
+        :param match: the match of the pattern
+        :param remark: the list of decoded remarks to update
+        :return: the offset of the end of the group
+        """
+        remark.append(self.translate(self.parse_record(match).values))
+        return match.end()
+
+    def match(self, code: str, pos: int = 0):
+        """
+        :return: the match of the pattern at the offset pos of the code, or None
+        """
+        return self._pattern.match(code, pos)
+
+    def record(self, match, **values) -> RemarkRecord:
+        return RemarkRecord(self.kind, values, match.group(0))
 
     @abc.abstractmethod
-    def execute(self, code: str, remark: list) -> tuple:
+    def parse_record(self, match) -> RemarkRecord:
+        """
+        Decodes a group matched by the pattern of the command, without translation.
+        :param match: the match of the pattern
+        :return: the record of the group
+        :raise TranslationError: when a code of the group is unknown
+        """
+        pass
+
+    @abc.abstractmethod
+    def translate(self, values: dict) -> str:
+        """
+        Translates the values of a record with the active locale.
+        :param values: the values of a record of the command's kind
+        :return: the remark text
+        """
         pass
 
     @abc.abstractmethod
@@ -29,124 +108,127 @@ class Command(abc.ABC):
 
 
 class CeilingHeightCommand(Command):
-    regex = r'^CIG (\d{3})V(\d{3})\b'
-
-    def __init__(self):
-        self._pattern = re.compile(CeilingHeightCommand.regex)
+    regex = r'CIG (\d{3})V(\d{3})\b'
+    leading_chars = 'C'
+    kind = 'ceiling_height'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        min_ceiling = int(matches[0]) * 100
-        max_ceiling = int(matches[1]) * 100
-        remark.append(_('Remark.Ceiling.Height').format(min_ceiling, max_ceiling))
-        return self._pattern.sub('', code, 1), remark
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, min_ceiling=int(matches[0]) * 100, max_ceiling=int(matches[1]) * 100)
 
+    def translate(self, values: dict) -> str:
+        return _('Remark.Ceiling.Height').format(values['min_ceiling'], values['max_ceiling'])
 
-class CeilingSecondLocationCommand(Command):
-    regex = r'^CIG (\d{3}) (\w+)\b'
 
-    def __init__(self):
-        self._pattern = re.compile(CeilingSecondLocationCommand.regex)
+class CeilingSecondLocationCommand(Command):
+    regex = r'CIG (\d{3}) (\w+)\b'
+    leading_chars = 'C'
+    kind = 'ceiling_second_location'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        height = 100 * int(matches[0])
-        remark.append(_('Remark.Ceiling.Second.Location').format(height, matches[1]))
-        return self._pattern.sub('', code, 1), remark
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, height=100 * int(matches[0]), location=matches[1])
 
+    def translate(self, values: dict) -> str:
+        return _('Remark.Ceiling.Second.Location').format(values['height'], values['location'])
 
-class HailSizeCommand(Command):
-    regex = r'^GR ((\d/\d)|((\d) ?(\d/\d)?))'
 
-    def __init__(self):
-        self._pattern = re.compile(HailSizeCommand.regex)
+class HailSizeCommand(Command):
+    regex = r'GR ((\d/\d)|((\d) ?(\d/\d)?))'
+    leading_chars = 'G'
+    kind = 'hail_size'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Hail').format(matches[0]))
-        return self._pattern.sub('', code, 1), remark
+    def parse_record(self, match) -> RemarkRecord:
+        return self.record(match, size=match.group(1))
 
+    def translate(self, values: dict) -> str:
+        return _('Remark.Hail').format(values['size'])
 
-class HourlyMaximumMinimumTemperatureCommand(Command):
-    regex = r'^4([01])(\d{3})([01])(\d{3})\b'
 
-    def __init__(self):
-        self._pattern = re.compile(HourlyMaximumMinimumTemperatureCommand.regex)
+class HourlyMaximumMinimumTemperatureCommand(Command):
+    regex = r'4([01])(\d{3})([01])(\d{3})\b'
+    leading_chars = '4'
+    kind = 'hourly_maximum_minimum_temperature'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Hourly.Maximum.Minimum.Temperature').format(
-            convert_temperature_remarks(matches[0], matches[1]),
-            convert_temperature_remarks(matches[2], matches[3])
-        ))
-        return self._pattern.sub('', code, 1), remark
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, maximum=convert_temperature_remarks(matches[0], matches[1]),
+                           minimum=convert_temperature_remarks(matches[2], matches[3]))
 
+    def translate(self, values: dict) -> str:
+        return _('Remark.Hourly.Maximum.Minimum.Temperature').format(values['maximum'], values['minimum'])
 
-class HourlyMaximumTemperatureCommand(Command):
-    regex = r'^1([01])(\d{3})\b'
 
-    def __init__(self):
-        self._pattern = re.compile(HourlyMaximumTemperatureCommand.regex)
+class HourlyMaximumTemperatureCommand(Command):
+    regex = r'1([01])(\d{3})\b'
+    leading_chars = '1'
+    kind = 'hourly_maximum_temperature'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Hourly.Maximum.Temperature').format(
-            convert_temperature_remarks(matches[0], matches[1])
-        ))
-        return self._pattern.sub('', code, 1), remark
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, temperature=convert_temperature_remarks(matches[0], matches[1]))
 
+    def translate(self, values: dict) -> str:
+        return _('Remark.Hourly.Maximum.Temperature').format(values['temperature'])
 
-class HourlyMinimumTemperatureCommand(Command):
-    regex = r'^2([01])(\d{3})\b'
 
-    def __init__(self):
-        self._pattern = re.compile(HourlyMinimumTemperatureCommand.regex)
+class HourlyMinimumTemperatureCommand(Command):
+    regex = r'2([01])(\d{3})\b'
+    leading_chars = '2'
+    kind = 'hourly_minimum_temperature'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Hourly.Minimum.Temperature').format(
-            convert_temperature_remarks(matches[0], matches[1])
-        ))
-        return self._pattern.sub('', code, 1), remark
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, temperature=convert_temperature_remarks(matches[0], matches[1]))
 
+    def translate(self, values: dict) -> str:
+        return _('Remark.Hourly.Minimum.Temperature').format(values['temperature'])
 
-class HourlyPrecipitationAmountCommand(Command):
-    regex = r'^P(\d{4})\b'
 
-    def __init__(self):
-        self._pattern = re.compile(HourlyPrecipitationAmountCommand.regex)
+class HourlyPrecipitationAmountCommand(Command):
+    regex = r'P(\d{4})\b'
+    leading_chars = 'P'
+    kind = 'hourly_precipitation_amount'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Precipitation.Amount.Hourly').format(
-            int(matches[0])
-        ))
-        return self._pattern.sub('', code, 1), remark
+    def parse_record(self, match) -> RemarkRecord:
+        return self.record(match, amount=int(match.group(1)))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.Precipitation.Amount.Hourly').format(values['amount'])
 
 
 class HourlyPressureCommand(Command):
-    regex = r'^5(\d)(\d{3})\b'
+    regex = r'5(\d)(\d{3})\b'
+    leading_chars = '5'
+    kind = 'hourly_pressure'
 
     barometer_tendency = {
         0: 'Remark.Barometer.0',
@@ -159,586 +241,670 @@ class HourlyPressureCommand(Command):
         7: 'Remark.Barometer.7',
         8: 'Remark.Barometer.8'
     }
-
-    def __init__(self):
-        self._pattern = re.compile(HourlyPressureCommand.regex)
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(
-            _(HourlyPressureCommand.barometer_tendency[int(matches[0])])
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        tendency = int(matches[0])
+        checked_code('', HourlyPressureCommand.barometer_tendency[tendency])
+        return self.record(match, tendency=tendency, pressure_change=float(matches[1]) / 10)
+
+    def translate(self, values: dict) -> str:
+        return (
+            _(HourlyPressureCommand.barometer_tendency[values['tendency']])
             + ' '
-            + _('Remark.Pressure.Tendency').format(float(matches[1]) / 10)
+            + _('Remark.Pressure.Tendency').format(values['pressure_change'])
         )
-        return self._pattern.sub('', code, 1), remark
 
 
 class HourlyTemperatureDewPointCommand(Command):
-    regex = r'^T([01])(\d{3})(([01])(\d{3}))?'
-
-    def __init__(self):
-        self._pattern = re.compile(HourlyTemperatureDewPointCommand.regex)
+    regex = r'T([01])(\d{3})(([01])(\d{3}))?'
+    leading_chars = 'T'
+    kind = 'hourly_temperature'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        if matches[2] is None:
-            remark.append(_('Remark.Hourly.Temperature').format(convert_temperature_remarks(matches[0], matches[1])))
-        else:
-            remark.append(_('Remark.Hourly.Temperature.Dew.Point').format(
-                convert_temperature_remarks(matches[0], matches[1]),
-                convert_temperature_remarks(matches[3], matches[4])
-            ))
-        return self._pattern.sub('', code, 1), remark
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        dew_point = None if matches[2] is None else convert_temperature_remarks(matches[3], matches[4])
+        return self.record(match, temperature=convert_temperature_remarks(matches[0], matches[1]), dew_point=dew_point)
 
+    def translate(self, values: dict) -> str:
+        if values['dew_point'] is None:
+            return _('Remark.Hourly.Temperature').format(values['temperature'])
+        return _('Remark.Hourly.Temperature.Dew.Point').format(values['temperature'], values['dew_point'])
 
-class IceAccretionCommand(Command):
-    regex = r'^l(\d)(\d{3})\b'
 
-    def __init__(self):
-        self._pattern = re.compile(IceAccretionCommand.regex)
+class IceAccretionCommand(Command):
+    regex = r'l(\d)(\d{3})\b'
+    leading_chars = 'l'
+    kind = 'ice_accretion'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Ice.Accretion.Amount').format(int(matches[1]), int(matches[0])))
-        return self._pattern.sub('', code, 1), remark
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, amount=int(matches[1]), hours=int(matches[0]))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.Ice.Accretion.Amount').format(values['amount'], values['hours'])
 
 
 class ObscurationCommand(Command):
-    regex = r'^([A-Z]{2}) ([A-Z]{3})(\d{3})'
+    regex = r'([A-Z]{2}) ([A-Z]{3})(\d{3})'
+    leading_chars = UPPERCASE
+    kind = 'obscuration'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(ObscurationCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, layer=checked_code(CLOUD_QUANTITY, matches[1]), height=100 * int(matches[2]),
+                           phenomenon=checked_code(PHENOMENON, matches[0]))
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        layer = _(CLOUD_QUANTITY + matches[1])
-        height = 100 * int(matches[2])
-        detail = _(PHENOMENON + matches[0])
-        remark.append(_('Remark.Obscuration').format(layer, height, detail))
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.Obscuration').format(_(CLOUD_QUANTITY + values['layer']), values['height'],
+                                              _(PHENOMENON + values['phenomenon']))
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class PrecipitationAmount24HourCommand(Command):
-    regex = r'^7(\d{4})\b'
-
-    def __init__(self):
-        self._pattern = re.compile(PrecipitationAmount24HourCommand.regex)
+    regex = r'7(\d{4})\b'
+    leading_chars = '7'
+    kind = 'precipitation_amount_24_hours'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Precipitation.Amount.24').format(convert_precipitation_amount(matches[0])))
-        return self._pattern.sub('', code, 1), remark
+    def parse_record(self, match) -> RemarkRecord:
+        return self.record(match, amount=convert_precipitation_amount(match.group(1)))
 
+    def translate(self, values: dict) -> str:
+        return _('Remark.Precipitation.Amount.24').format(values['amount'])
 
-class PrecipitationAmount36HourCommand(Command):
-    regex = r'^([36])(\d{4})\b'
 
-    def __init__(self):
-        self._pattern = re.compile(PrecipitationAmount36HourCommand.regex)
+class PrecipitationAmount36HourCommand(Command):
+    regex = r'([36])(\d{4})\b'
+    leading_chars = '36'
+    kind = 'precipitation_amount_3_6_hours'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Precipitation.Amount.3.6').
-                      format(matches[0], convert_precipitation_amount(matches[1])))
-        return self._pattern.sub('', code, 1), remark
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, hours=int(matches[0]), amount=convert_precipitation_amount(matches[1]))
 
+    def translate(self, values: dict) -> str:
+        return _('Remark.Precipitation.Amount.3.6').format(values['hours'], values['amount'])
 
-class PrecipitationBegCommand(Command):
-    regex = r'^(([A-Z]{2})?([A-Z]{2})B(\d{2})?(\d{2}))'
 
-    def __init__(self) -> None:
-        super().__init__()
-        self._pattern = re.compile(PrecipitationBegCommand.regex)
-
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Precipitation.Beg').format(
-            '' if matches[1] is None else _(DESCRIPTIVE + matches[1]),
-            _(PHENOMENON + matches[2]),
-            empty_if_none(matches[3]),
-            matches[4]
-        ))
-        return self._pattern.sub('', code, 1), remark
+class PrecipitationBegCommand(Command):
+    regex = r'(([A-Z]{2})?([A-Z]{2})B(\d{2})?(\d{2}))'
+    leading_chars = UPPERCASE
+    kind = 'precipitation_beginning'
+    _pattern = LazyPattern()
+
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, descriptive=None if matches[1] is None else checked_code(DESCRIPTIVE, matches[1]),
+                           phenomenon=checked_code(PHENOMENON, matches[2]),
+                           start_hour=int_or_none(matches[3]), start_minute=int(matches[4]))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.Precipitation.Beg').format(
+            '' if values['descriptive'] is None else _(DESCRIPTIVE + values['descriptive']),
+            _(PHENOMENON + values['phenomenon']),
+            two_digits(values['start_hour']),
+            two_digits(values['start_minute'])
+        )
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class PrecipitationBegEndCommand(Command):
-    regex = r'^(([A-Z]{2})?([A-Z]{2})B(\d{2})?(\d{2})E(\d{2})?(\d{2}))'
-
-    def __init__(self):
-        self._pattern = re.compile(PrecipitationBegEndCommand.regex)
-
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Precipitation.Beg.End').format(
-            '' if matches[1] is None else _(DESCRIPTIVE + matches[1]),
-            _(PHENOMENON + matches[2]),
-            empty_if_none(matches[3]),
-            matches[4],
-            empty_if_none(matches[5]),
-            matches[6]
-        ))
-        return self._pattern.sub('', code, 1), remark
+    regex = r'(([A-Z]{2})?([A-Z]{2})B(\d{2})?(\d{2})E(\d{2})?(\d{2}))'
+    leading_chars = UPPERCASE
+    kind = 'precipitation_beginning_ending'
+    _pattern = LazyPattern()
+
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, descriptive=None if matches[1] is None else checked_code(DESCRIPTIVE, matches[1]),
+                           phenomenon=checked_code(PHENOMENON, matches[2]),
+                           start_hour=int_or_none(matches[3]), start_minute=int(matches[4]),
+                           end_hour=int_or_none(matches[5]), end_minute=int(matches[6]))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.Precipitation.Beg.End').format(
+            '' if values['descriptive'] is None else _(DESCRIPTIVE + values['descriptive']),
+            _(PHENOMENON + values['phenomenon']),
+            two_digits(values['start_hour']),
+            two_digits(values['start_minute']),
+            two_digits(values['end_hour']),
+            two_digits(values['end_minute'])
+        )
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class PrecipitationEndCommand(Command):
-    regex = r'^(([A-Z]{2})?([A-Z]{2})E(\d{2})?(\d{2}))'
-
-    def __init__(self):
-        self._pattern = re.compile(PrecipitationEndCommand.regex)
+    regex = r'(([A-Z]{2})?([A-Z]{2})E(\d{2})?(\d{2}))'
+    leading_chars = UPPERCASE
+    kind = 'precipitation_ending'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Precipitation.End').format(
-            '' if matches[1] is None else _(DESCRIPTIVE + matches[1]),
-            _(PHENOMENON + matches[2]),
-            empty_if_none(matches[3]),
-            matches[4]
-        ))
-        return self._pattern.sub('', code, 1), remark
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, descriptive=None if matches[1] is None else checked_code(DESCRIPTIVE, matches[1]),
+                           phenomenon=checked_code(PHENOMENON, matches[2]),
+                           end_hour=int_or_none(matches[3]), end_minute=int(matches[4]))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.Precipitation.End').format(
+            '' if values['descriptive'] is None else _(DESCRIPTIVE + values['descriptive']),
+            _(PHENOMENON + values['phenomenon']),
+            two_digits(values['end_hour']),
+            two_digits(values['end_minute'])
+        )
 
 
 class PrevailingVisibilityCommand(Command):
-    regex = r'^VIS ((\d)*( )?(\d?/?\d))V((\d)*( )?(\d?/?\d))'
+    regex = r'VIS ((\d)*( )?(\d?/?\d))V((\d)*( )?(\d?/?\d))'
+    leading_chars = 'V'
+    kind = 'variable_prevailing_visibility'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(PrevailingVisibilityCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, minimum=matches[0], maximum=matches[4])
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Variable.Prevailing.Visibility').format(
-            matches[0], matches[4])
-        )
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.Variable.Prevailing.Visibility').format(values['minimum'], values['maximum'])
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class SeaLevelPressureCommand(Command):
-    regex = r'^SLP(\d{2})(\d)'
+    regex = r'SLP(\d{2})(\d)'
+    leading_chars = 'S'
+    kind = 'sea_level_pressure'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(SeaLevelPressureCommand.regex)
-
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
         pressure = '9' if matches[0].startswith('9') else '10'
         pressure += matches[0] + '.' + matches[1]
-        remark.append(_('Remark.Sea.Level.Pressure').format(pressure))
-        return self._pattern.sub('', code, 1), remark
+        return self.record(match, pressure=float(pressure))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.Sea.Level.Pressure').format(values['pressure'])
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class SecondLocationVisibilityCommand(Command):
-    regex = r'^VIS ((\d)*( )?(\d?/?\d)) (\w+)'
+    regex = r'VIS ((\d)*( )?(\d?/?\d)) (\w+)'
+    leading_chars = 'V'
+    kind = 'second_location_visibility'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(SecondLocationVisibilityCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, visibility=matches[0], location=matches[4])
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Second.Location.Visibility').format(
-            matches[0], matches[4])
-        )
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.Second.Location.Visibility').format(values['visibility'], values['location'])
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class SectorVisibilityCommand(Command):
-    regex = r'^VIS ([A-Z]{1,2}) ((\d)*( )?(\d?/?\d))'
+    regex = r'VIS ([A-Z]{1,2}) ((\d)*( )?(\d?/?\d))'
+    leading_chars = 'V'
+    kind = 'sector_visibility'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(SectorVisibilityCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, direction=checked_code(CONVERTER, matches[0]), visibility=matches[1])
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Sector.Visibility').format(
-            _(CONVERTER + matches[0]),
-            matches[1]
-        ))
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.Sector.Visibility').format(_(CONVERTER + values['direction']), values['visibility'])
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class SmallHailSizeCommand(Command):
-    regex = r'^GR LESS THAN ((\d )?(\d/\d)?)'
+    regex = r'GR LESS THAN ((\d )?(\d/\d)?)'
+    leading_chars = 'G'
+    kind = 'small_hail_size'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(SmallHailSizeCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        return self.record(match, size=match.group(1))
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Hail.LesserThan').format(matches[0]))
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.Hail.LesserThan').format(values['size'])
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class SnowDepthCommand(Command):
-    regex = r'^4/(\d{3})'
-
-    def __init__(self):
-        self._pattern = re.compile(SnowDepthCommand.regex)
+    regex = r'4/(\d{3})'
+    leading_chars = '4'
+    kind = 'snow_depth'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Snow.Depth').format(int(matches[0])))
-        return self._pattern.sub('', code, 1), remark
+    def parse_record(self, match) -> RemarkRecord:
+        return self.record(match, depth=int(match.group(1)))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.Snow.Depth').format(values['depth'])
 
 
 class SnowIncreaseCommand(Command):
-    regex = r'^SNINCR (\d+)/(\d+)'
+    regex = r'SNINCR (\d+)/(\d+)'
+    leading_chars = 'S'
+    kind = 'snow_increase'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(SnowIncreaseCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, increase=matches[0], depth=matches[1])
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Snow.Increasing.Rapidly').format(matches[0], matches[1]))
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.Snow.Increasing.Rapidly').format(values['increase'], values['depth'])
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class SnowPelletsCommand(Command):
-    regex = r'^GS (LGT|MOD|HVY)'
+    regex = r'GS (LGT|MOD|HVY)'
+    leading_chars = 'G'
+    kind = 'snow_pellets'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(SnowPelletsCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        return self.record(match, intensity=checked_code(REMARK, match.group(1)))
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Snow.Pellets').format(_(REMARK + matches[0])))
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.Snow.Pellets').format(_(REMARK + values['intensity']))
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class SunshineDurationCommand(Command):
-    regex = r'^98(\d{3})'
+    regex = r'98(\d{3})'
+    leading_chars = '9'
+    kind = 'sunshine_duration'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(SunshineDurationCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        return self.record(match, duration=int(match.group(1)))
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Sunshine.Duration').format(int(matches[0])))
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.Sunshine.Duration').format(values['duration'])
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class SurfaceVisibilityCommand(Command):
-    regex = r'^SFC VIS ((\d)*( )?(\d?/?\d))'
+    regex = r'SFC VIS ((\d)*( )?(\d?/?\d))'
+    leading_chars = 'S'
+    kind = 'surface_visibility'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(SurfaceVisibilityCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        return self.record(match, visibility=match.group(1))
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Surface.Visibility').format(matches[0]))
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.Surface.Visibility').format(values['visibility'])
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class ThunderStormLocationCommand(Command):
-    regex = r'^TS ([A-Z]{2})'
+    regex = r'TS ([A-Z]{2})'
+    leading_chars = 'T'
+    kind = 'thunderstorm_location'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(ThunderStormLocationCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        return self.record(match, location=checked_code(CONVERTER, match.group(1)))
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Thunderstorm.Location').format(_(CONVERTER + matches[0])))
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.Thunderstorm.Location').format(_(CONVERTER + values['location']))
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class ThunderStormLocationMovingCommand(Command):
-    regex = r'^TS ([A-Z]{2}) MOV ([A-Z]{2})'
-
-    def __init__(self):
-        self._pattern = re.compile(ThunderStormLocationMovingCommand.regex)
-
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Thunderstorm.Location.Moving').format(
-            _(CONVERTER + matches[0]), _(CONVERTER + matches[1])
-        ))
-        return self._pattern.sub('', code, 1), remark
+    regex = r'TS ([A-Z]{2}) MOV ([A-Z]{2})'
+    leading_chars = 'T'
+    kind = 'thunderstorm_location_moving'
+    _pattern = LazyPattern()
+
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, location=checked_code(CONVERTER, matches[0]),
+                           moving=checked_code(CONVERTER, matches[1]))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.Thunderstorm.Location.Moving').format(
+            _(CONVERTER + values['location']), _(CONVERTER + values['moving'])
+        )
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class TornadicActivityBegCommand(Command):
-    regex = r'^(TORNADO|FUNNEL CLOUD|WATERSPOUT) (B(\d{2})?(\d{2}))( (\d+)? ([A-Z]{1,2})?)?'
-
-    def __init__(self):
-        self._pattern = re.compile(TornadicActivityBegCommand.regex)
-
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Tornadic.Activity.Beginning').format(
-            _(REMARK + matches[0].replace(' ', '')),
-            empty_if_none(matches[2]),
-            matches[3],
-            matches[5],
-            _(CONVERTER + matches[6])
-        ))
-        return self._pattern.sub('', code, 1), remark
+    regex = r'(TORNADO|FUNNEL CLOUD|WATERSPOUT) (B(\d{2})?(\d{2}))( (\d+)? ([A-Z]{1,2})?)?'
+    leading_chars = 'TFW'
+    kind = 'tornadic_activity_beginning'
+    _pattern = LazyPattern()
+
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, activity=checked_code(REMARK, matches[0].replace(' ', '')),
+                           start_hour=int_or_none(matches[2]), start_minute=int(matches[3]),
+                           distance=matches[5], direction=checked_code(CONVERTER, matches[6]))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.Tornadic.Activity.Beginning').format(
+            _(REMARK + values['activity']),
+            two_digits(values['start_hour']),
+            two_digits(values['start_minute']),
+            values['distance'],
+            _(CONVERTER + values['direction'])
+        )
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class TornadicActivityBegEndCommand(Command):
-    regex = r'^(TORNADO|FUNNEL CLOUD|WATERSPOUT) (B(\d{2})?(\d{2}))(E(\d{2})?(\d{2}))( (\d+)? ([A-Z]{1,2})?)?'
-
-    def __init__(self):
-        self._pattern = re.compile(TornadicActivityBegEndCommand.regex)
-
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Tornadic.Activity.BegEnd').format(
-            _(REMARK + matches[0].replace(' ', '')),
-            empty_if_none(matches[2]),
-            matches[3],
-            empty_if_none(matches[5]),
-            matches[6],
-            matches[8],
-            _(CONVERTER + matches[9])
-        ))
-        return self._pattern.sub('', code, 1), remark
+    regex = r'(TORNADO|FUNNEL CLOUD|WATERSPOUT) (B(\d{2})?(\d{2}))(E(\d{2})?(\d{2}))( (\d+)? ([A-Z]{1,2})?)?'
+    leading_chars = 'TFW'
+    kind = 'tornadic_activity_beginning_ending'
+    _pattern = LazyPattern()
+
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, activity=checked_code(REMARK, matches[0].replace(' ', '')),
+                           start_hour=int_or_none(matches[2]), start_minute=int(matches[3]),
+                           end_hour=int_or_none(matches[5]), end_minute=int(matches[6]),
+                           distance=matches[8], direction=checked_code(CONVERTER, matches[9]))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.Tornadic.Activity.BegEnd').format(
+            _(REMARK + values['activity']),
+            two_digits(values['start_hour']),
+            two_digits(values['start_minute']),
+            two_digits(values['end_hour']),
+            two_digits(values['end_minute']),
+            values['distance'],
+            _(CONVERTER + values['direction'])
+        )
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class TornadicActivityEndCommand(Command):
-    regex = r'^(TORNADO|FUNNEL CLOUD|WATERSPOUT) (E(\d{2})?(\d{2}))( (\d+)? ([A-Z]{1,2})?)?'
-
-    def __init__(self):
-        self._pattern = re.compile(TornadicActivityEndCommand.regex)
-
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Tornadic.Activity.Ending').format(
-            _(REMARK + matches[0].replace(' ', '')),
-            empty_if_none(matches[2]),
-            matches[3],
-            matches[5],
-            _(CONVERTER + matches[6])
-        ))
-        return self._pattern.sub('', code, 1), remark
+    regex = r'(TORNADO|FUNNEL CLOUD|WATERSPOUT) (E(\d{2})?(\d{2}))( (\d+)? ([A-Z]{1,2})?)?'
+    leading_chars = 'TFW'
+    kind = 'tornadic_activity_ending'
+    _pattern = LazyPattern()
+
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, activity=checked_code(REMARK, matches[0].replace(' ', '')),
+                           end_hour=int_or_none(matches[2]), end_minute=int(matches[3]),
+                           distance=matches[5], direction=checked_code(CONVERTER, matches[6]))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.Tornadic.Activity.Ending').format(
+            _(REMARK + values['activity']),
+            two_digits(values['end_hour']),
+            two_digits(values['end_minute']),
+            values['distance'],
+            _(CONVERTER + values['direction'])
+        )
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class TowerVisibilityCommand(Command):
-    regex = r'^TWR VIS ((\d)*( )?(\d?/?\d))'
+    regex = r'TWR VIS ((\d)*( )?(\d?/?\d))'
+    leading_chars = 'T'
+    kind = 'tower_visibility'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(TowerVisibilityCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        return self.record(match, visibility=match.group(1))
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Tower.Visibility').format(matches[0]))
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.Tower.Visibility').format(values['visibility'])
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class VariableSkyCommand(Command):
-    regex = r'^([A-Z]{3}) V ([A-Z]{3})'
-
-    def __init__(self):
-        self._pattern = re.compile(VariableSkyCommand.regex)
-
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Variable.Sky.Condition').format(
-            _(CLOUD_QUANTITY + matches[0]),
-            _(CLOUD_QUANTITY + matches[1])
-        ))
-        return self._pattern.sub('', code, 1), remark
+    regex = r'([A-Z]{3}) V ([A-Z]{3})'
+    leading_chars = UPPERCASE
+    kind = 'variable_sky'
+    _pattern = LazyPattern()
+
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, first_layer=checked_code(CLOUD_QUANTITY, matches[0]),
+                           second_layer=checked_code(CLOUD_QUANTITY, matches[1]))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.Variable.Sky.Condition').format(
+            _(CLOUD_QUANTITY + values['first_layer']),
+            _(CLOUD_QUANTITY + values['second_layer'])
+        )
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class VariableSkyHeightCommand(Command):
-    regex = r'^([A-Z]{3})(\d{3}) V ([A-Z]{3})'
-
-    def __init__(self):
-        self._pattern = re.compile(VariableSkyHeightCommand.regex)
-
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Variable.Sky.Condition.Height').format(
-            100 * int(matches[1]),
-            _(CLOUD_QUANTITY + matches[0]),
-            _(CLOUD_QUANTITY + matches[2])
-        ))
-        return self._pattern.sub('', code, 1), remark
+    regex = r'([A-Z]{3})(\d{3}) V ([A-Z]{3})'
+    leading_chars = UPPERCASE
+    kind = 'variable_sky_height'
+    _pattern = LazyPattern()
+
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, height=100 * int(matches[1]), first_layer=checked_code(CLOUD_QUANTITY, matches[0]),
+                           second_layer=checked_code(CLOUD_QUANTITY, matches[2]))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.Variable.Sky.Condition.Height').format(
+            values['height'],
+            _(CLOUD_QUANTITY + values['first_layer']),
+            _(CLOUD_QUANTITY + values['second_layer'])
+        )
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class VirgaDirectionCommand(Command):
-    regex = r'^VIRGA ([A-Z]{2})'
+    regex = r'VIRGA ([A-Z]{2})'
+    leading_chars = 'V'
+    kind = 'virga_direction'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(VirgaDirectionCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        return self.record(match, direction=checked_code(CONVERTER, match.group(1)))
 
-    def execute(self, code: str, remark: list) -> tuple:
-        match = self._pattern.search(code).groups()
-        remark.append(_('Remark.Virga.Direction').format(_(CONVERTER + match[0])))
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.Virga.Direction').format(_(CONVERTER + values['direction']))
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class WaterEquivalentSnowCommand(Command):
-    regex = r'^933(\d{3})\b'
-
-    def __init__(self):
-        self._pattern = re.compile(WaterEquivalentSnowCommand.regex)
+    regex = r'933(\d{3})\b'
+    leading_chars = '9'
+    kind = 'water_equivalent_snow'
+    _pattern = LazyPattern()
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.Water.Equivalent.Snow.Ground').format(
-            float(matches[0]) / 10
-        ))
-        return self._pattern.sub('', code, 1), remark
-
+    def parse_record(self, match) -> RemarkRecord:
+        return self.record(match, amount=float(match.group(1)) / 10)
 
-class WindPeakCommand(Command):
-    regex = r'^PK WND (\d{3})(\d{2,3})/(\d{2})?(\d{2})'
+    def translate(self, values: dict) -> str:
+        return _('Remark.Water.Equivalent.Snow.Ground').format(values['amount'])
 
-    def __init__(self):
-        self._pattern = re.compile(WindPeakCommand.regex)
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.PeakWind').format(
-            matches[0],
-            matches[1],
-            empty_if_none(matches[2]),
-            matches[3]
-        ))
-        return self._pattern.sub('', code, 1), remark
+class WindPeakCommand(Command):
+    regex = r'PK WND (\d{3})(\d{2,3})/(\d{2})?(\d{2})'
+    leading_chars = 'P'
+    kind = 'peak_wind'
+    _pattern = LazyPattern()
+
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, direction=int(matches[0]), speed=int(matches[1]),
+                           hour=int_or_none(matches[2]), minute=int(matches[3]))
+
+    def translate(self, values: dict) -> str:
+        return _('Remark.PeakWind').format(
+            f'{values["direction"]:03d}',
+            two_digits(values['speed']),
+            two_digits(values['hour']),
+            two_digits(values['minute'])
+        )
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class WindShiftCommand(Command):
-    regex = r'^WSHFT (\d{2})?(\d{2})'
+    regex = r'WSHFT (\d{2})?(\d{2})'
+    leading_chars = 'W'
+    kind = 'wind_shift'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(WindShiftCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, hour=int_or_none(matches[0]), minute=int(matches[1]))
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.WindShift').format(
-            empty_if_none(matches[0]),
-            matches[1]
-        ))
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.WindShift').format(two_digits(values['hour']), two_digits(values['minute']))
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class WindShiftFropaCommand(Command):
-    regex = r'^WSHFT (\d{2})?(\d{2}) FROPA'
+    regex = r'WSHFT (\d{2})?(\d{2}) FROPA'
+    leading_chars = 'W'
+    kind = 'wind_shift_frontal_passage'
+    _pattern = LazyPattern()
 
-    def __init__(self):
-        self._pattern = re.compile(WindShiftFropaCommand.regex)
+    def parse_record(self, match) -> RemarkRecord:
+        matches = match.groups()
+        return self.record(match, hour=int_or_none(matches[0]), minute=int(matches[1]))
 
-    def execute(self, code: str, remark: list) -> tuple:
-        matches = self._pattern.search(code).groups()
-        remark.append(_('Remark.WindShift.FROPA').format(
-            empty_if_none(matches[0]),
-            matches[1]
-        ))
-        return self._pattern.sub('', code, 1), remark
+    def translate(self, values: dict) -> str:
+        return _('Remark.WindShift.FROPA').format(two_digits(values['hour']), two_digits(values['minute']))
 
     def can_parse(self, code: str) -> any:
         return self._pattern.match(code)
 
 
 class DefaultCommand(Command):
+    """
+    Keeps a word no other command decodes, translated when it is a known remark keyword.
+    Its records are of kind 'token'.
+    """
+    regex = r'[^ ]*'
+    kind = 'token'
+    _pattern = LazyPattern()
+
     def can_parse(self, code: str) -> any:
         return True
 
     def execute(self, code: str, remark: list) -> tuple:
-        rmk_split = code.split(' ', 1)
-        try:
-            rem = _(REMARK + rmk_split[0])
-            remark.append(rem)
-        except TranslationError:
-            remark.append(rmk_split[0])
-        return '' if len(rmk_split) == 1 else rmk_split[1], remark
+        return code[self.execute_at(code, 0, remark):], remark
+
+    def execute_at(self, code: str, pos: int, remark: list) -> int:
+        """
+        Translates the word starting at the offset pos, or keeps it as is when it has no translation.
+        :param code: the remark
+        :param pos: the offset of the word
+        :param remark: the list of decoded remarks to update
+        :return: the offset following the space after the word
+        """
+        record, end = self.parse_record_at(code, pos)
+        remark.append(self.translate(record.values))
+        return end
+
+    def parse_record_at(self, code: str, pos: int) -> tuple:
+        """
+        Decodes the word starting at the offset pos, without translation.
+        :param code: the remark
+        :param pos: the offset of the word
+        :return: tuple (the record of the word, the offset following the space after the word)
+        """
+        end = code.find(' ', pos)
+        if end == -1:
+            end = len(code)
+        word = code[pos:end]
+        return RemarkRecord(DefaultCommand.kind, {'token': word}, word), end + 1
+
+    def parse_record(self, match) -> RemarkRecord:
+        return self.record(match, token=match.group(0))
+
+    def translate(self, values: dict) -> str:
+        return translate(REMARK + values['token'], values['token'])
 
 
 class RemarkCommandSupplier:
 
     def __init__(self):
         self.default_command = DefaultCommand()
-        self._command_list = [WindPeakCommand(),
+        self._command_list = (WindPeakCommand(),
                               WindShiftFropaCommand(),
                               WindShiftCommand(),
                               TowerVisibilityCommand(),
@@ -777,10 +943,30 @@ class RemarkCommandSupplier:
                               SnowDepthCommand(),
                               SunshineDurationCommand(),
                               WaterEquivalentSnowCommand()
-                              ]
+                              )
+        self._dispatch_table = build_dispatch_table(self._command_list)
+        self._commands_by_kind = {command.kind: command for command in self._command_list + (self.default_command,)}
 
     def get(self, code: str) -> Command:
-        for command in self._command_list:
-            if command.can_parse(code):
-                return command
-        return self.default_command
+        return self.classify(code)[0] or self.default_command
+
+    def get_by_kind(self, kind: str) -> Command:
+        """
+        :param kind: the kind of a RemarkRecord
+        :return: the command translating the records of this kind
+        """
+        return self._commands_by_kind[kind]
+
+    def classify(self, code: str, pos: int = 0) -> tuple:
+        """
+        Finds the command able to decode the group starting at the offset pos.
+        Only the commands indexed under the first character of the group are tried.
+        :param code: the remark
+        :param pos: the offset of the group
+        :return: tuple (command, match) or (None, None) if only the default command applies
+        """
+        for command in self._dispatch_table.get(code[pos:pos + 1], ()):
+            match = command.match(code, pos)
+            if match:
+                return command, match
+        return None, None
@@ -1,14 +1,12 @@
-import re
-
+from metar_taf_parser.command.dispatch import LazyPattern, build_dispatch_table, classify
 from metar_taf_parser.model.enum import IcingIntensity, TurbulenceIntensity, LengthUnit
 from metar_taf_parser.model.model import ITafGroups, Icing, Turbulence
 
 
 class IcingCommand:
     regex = r'^6(\d)(\d{3})(\d)$'
-
-    def __init__(self):
-        self._pattern = re.compile(IcingCommand.regex)
+    leading_chars = '6'
+    _pattern = LazyPattern()
 
     def can_parse(self, input: str):
         return self._pattern.search(input)
@@ -20,7 +18,10 @@ class IcingCommand:
         :param input: string
         :return:
         """
-        matches = self._pattern.search(input).groups()
+        self.execute_match(itaf, self._pattern.search(input))
+
+    def execute_match(self, itaf: ITafGroups, match):
+        matches = match.groups()
         icing = Icing()
         icing.intensity = IcingIntensity(matches[0])
         icing.base_height = 100 * int(matches[1])
@@ -31,9 +32,8 @@ class IcingCommand:
 
 class TurbulenceCommand:
     regex = r"^5(\d|'X')(\d{3})(\d)$"
-
-    def __init__(self):
-        self._pattern = re.compile(TurbulenceCommand.regex)
+    leading_chars = '5'
+    _pattern = LazyPattern()
 
     def can_parse(self, input: str):
         return self._pattern.search(input)
@@ -45,7 +45,10 @@ class TurbulenceCommand:
         :param input: string
         :return:
         """
-        matches = self._pattern.search(input).groups()
+        self.execute_match(itaf, self._pattern.search(input))
+
+    def execute_match(self, itaf: ITafGroups, match):
+        matches = match.groups()
         turbulence = Turbulence()
         turbulence.intensity = TurbulenceIntensity(matches[0])
         turbulence.base_height = 100 * int(matches[1])
@@ -56,9 +59,16 @@ class TurbulenceCommand:
 
 class TAFCommandSupplier:
     def __init__(self):
-        self._commands = [IcingCommand(), TurbulenceCommand()]
+        self._commands = (IcingCommand(), TurbulenceCommand())
+        self._dispatch_table = build_dispatch_table(self._commands)
 
     def get(self, input: str):
-        for command in self._commands:
-            if command.can_parse(input):
-                return command
+        return self.classify(input)[0]
+
+    def classify(self, input: str):
+        """
+        Finds the command able to parse the token with a single lookup on its first character.
+        :param input: the token to parse
+        :return: tuple (command, match), (None, None) if no command can parse the token
+        """
+        return classify(self._dispatch_table, input)
@@ -38,25 +38,72 @@ def convert_precipitation_amount(amount: str):
 
 
 SM_TO_KM = 1.609344
+# Knots in one meter per second and in one kilometer per hour.
+MPS_TO_KT = 3600 / 1852
+KMH_TO_KT = 1000 / 1852
+
+
+def convert_distance(raw_distance: str):
+    """
+    Converts a distance written with a whole part, a fraction or both, e.g. '3', '1/4' or '1 1/2'.
+    A leading 'P', 'M' or '>' is ignored, see visibility_bound.
+    :param raw_distance: The raw distance string (no unit suffix expected)
+    :return: The distance as a float, or None if not parsable
+    """
+    match = re.search(r'(?:(\d+)\s+)?(\d+)/(\d+)|(\d+)', raw_distance)
+    if not match:
+        return None
+    whole, numerator, denominator, value = match.groups()
+    if value is not None:
+        return float(value)
+    if int(denominator) == 0:
+        return None
+    return int(whole or 0) + int(numerator) / int(denominator)
+
+
+def visibility_bound(raw_visibility: str) -> int:
+    """
+    :param raw_visibility: The raw visibility string, e.g. 'P6', 'M1/4' or '>10000'
+    :return: 1 when the visibility is greater than the distance, -1 when it is lower, 0 otherwise
+    """
+    if raw_visibility.startswith(('P', '>')):
+        return 1
+    if raw_visibility.startswith('M'):
+        return -1
+    return 0
 
 
 def convert_visibility_to_km(raw_visibility: str, unit_shortcut: str):
     """
     Converts the visibility to a value in km using the provided unit shortcut.
-    :param raw_visibility: The raw visibility string (no unit suffix expected)
+    :param raw_visibility: The raw visibility string (no unit suffix expected), e.g. '1 1/2'
     :param unit_shortcut: The unit shortcut ('M', 'SM', 'KM', 'FT')
     :return: The visibility in km as a float, or None if not parsable
     """
-    cleaned = raw_visibility.replace('>', '')
-    match = re.search(r'(\d+)', cleaned)
-    if not match:
+    value = convert_distance(raw_visibility)
+    if value is None:
         return None
-    value = int(match.group(1))
     shortcut = unit_shortcut.upper()
     if shortcut == 'SM':
         return value * SM_TO_KM
     elif shortcut == 'KM':
-        return float(value)
+        return value
     elif shortcut == 'M':
         return value / 1000.0
     return None
+
+
+def convert_speed_to_knots(speed: int, unit: str):
+    """
+    Converts a wind speed to knots.
+    :param speed: The speed
+    :param unit: The speed unit ('KT', 'MPS' or 'KM/H'), None for knots
+    :return: The speed in knots as a float, or None if the unit is unknown
+    """
+    if unit is None or unit == 'KT':
+        return float(speed)
+    elif unit == 'MPS':
+        return speed * MPS_TO_KT
+    elif unit == 'KM/H':
+        return speed * KMH_TO_KT
+    return None
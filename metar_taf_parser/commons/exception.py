@@ -5,6 +5,7 @@ class TranslationError(Exception):
         message -- explanation of the error
     """
     def __init__(self, translation: str, message: str):
+        super().__init__(translation, message)
         self.message = message
         self.translation = translation
 
@@ -1,55 +1,98 @@
 import functools
-import gettext
-import locale
 import os
 import threading
 from contextlib import contextmanager
-from typing import Optional
 
 from metar_taf_parser.commons.exception import TranslationError
 
 localedir = os.path.join(os.path.abspath(os.path.dirname(__file__)), '../locale')
 
-SUPPORTED_LOCALES = {
-    name for name in os.listdir(localedir)
-    if os.path.isdir(os.path.join(localedir, name))
-}
-
 DEFAULT_LOCALE = 'en'
 
-# Map 2-letter prefix -> best-matching dir (exact 2-letter dirs win over hyphenated variants)
-_PREFIX_MAP: dict = {}
-for _loc_name in SUPPORTED_LOCALES:
-    _prefix = _loc_name[:2]
-    if _prefix not in _PREFIX_MAP or _loc_name == _prefix:
-        _PREFIX_MAP[_prefix] = _loc_name
 
+@functools.lru_cache(maxsize=None)
+def _supported_locales() -> tuple:
+    """List the locale directories once, on first use rather than at import.
 
-def _resolve(loc: Optional[str]) -> str:
+    Returns the set of directory names and the map of 2-letter prefix -> best-matching dir
+    (exact 2-letter dirs win over hyphenated variants).
+    """
+    names = {
+        name for name in os.listdir(localedir)
+        if os.path.isdir(os.path.join(localedir, name))
+    }
+    prefixes = {}
+    for name in names:
+        prefix = name[:2]
+        if prefix not in prefixes or name == prefix:
+            prefixes[prefix] = name
+    return names, prefixes
+
+
+def __getattr__(name: str):
+    # SUPPORTED_LOCALES is computed when it is first read.
+    if name == 'SUPPORTED_LOCALES':
+        return _supported_locales()[0]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def _resolve(loc: str) -> str:
     """Normalize a user-supplied locale string to an actual SUPPORTED_LOCALES dir name."""
     if not loc:
         return DEFAULT_LOCALE
-    if loc in SUPPORTED_LOCALES:
+    supported, prefixes = _supported_locales()
+    if loc in supported:
         return loc
     # zh_CN -> zh-CN
     hyphen = loc.replace('_', '-')
-    if hyphen in SUPPORTED_LOCALES:
+    if hyphen in supported:
         return hyphen
     # zh -> zh-CN, fr_FR -> fr (via 2-letter prefix)
     prefix = loc[:2]
-    if prefix in _PREFIX_MAP:
-        return _PREFIX_MAP[prefix]
+    if prefix in prefixes:
+        return prefixes[prefix]
     return DEFAULT_LOCALE
 
 
 @functools.lru_cache(maxsize=None)
-def get_translation(loc: str) -> gettext.NullTranslations:
-    """Return a cached gettext translation for *loc*, with English as fallback chain."""
+def get_translation(loc: str):
+    """Return a cached gettext translation for *loc*, with English as fallback chain.
+
+    gettext is imported on the first call, the parsers only need it to translate.
+    """
+    import gettext
+
     languages = ['en'] if loc == DEFAULT_LOCALE else [loc, 'en']
     return gettext.translation('messages', localedir=localedir, languages=languages, fallback=True)
 
 
+@functools.lru_cache(maxsize=None)
+def _message_ids() -> tuple:
+    """Return the messages of the messages.pot template, read once.
+
+    Every catalog translates a subset of them.
+    """
+    prefix = 'msgid "'
+    with open(os.path.join(localedir, 'messages.pot'), encoding='utf-8') as file:
+        return tuple(line.rstrip()[len(prefix):-1] for line in file if line.startswith(prefix))
+
+
+@functools.lru_cache(maxsize=None)
+def get_table(loc: str) -> dict:
+    """Return every message of *loc* with its translation, in a plain dict.
+
+    The table is built once per locale by translating each message of the template
+    with the gettext translation, English filling the gaps. Like ``_()``, a translation
+    equal to its message counts as missing, so a lookup returning ``None`` is a miss.
+    """
+    gettext = get_translation(loc).gettext
+    table = {message: gettext(message) for message in _message_ids() if message}
+    return {message: value for message, value in table.items() if value != message}
+
+
 def _detect_system_locale() -> str:
+    import locale
+
     try:
         sys_loc = locale.getlocale()
         if sys_loc and sys_loc[0] and len(sys_loc[0]) >= 2:
@@ -59,13 +102,26 @@ def _detect_system_locale() -> str:
     return DEFAULT_LOCALE
 
 
-_default_locale: str = _detect_system_locale()
+# Detected on the first call of get_locale() without a locale set for the thread.
+_default_locale: str = None
 _thread_local = threading.local()
 
 
+def _detect_default_locale() -> str:
+    global _default_locale
+    _default_locale = _detect_system_locale()
+    return _default_locale
+
+
 def get_locale() -> str:
     """Return the active locale for the current thread."""
-    return getattr(_thread_local, 'locale', _default_locale)
+    # Reading the per-thread dict avoids the cost of getattr() on a missing attribute.
+    return _thread_local.__dict__.get('locale') or _default_locale or _detect_default_locale()
+
+
+def get_thread_locale() -> str:
+    """Return the locale set for the current thread, or None when it uses the module default."""
+    return _thread_local.__dict__.get('locale')
 
 
 def set_locale(loc: str) -> None:
@@ -105,7 +161,13 @@ def _(message: str, locale=None) -> str:  # noqa: A002
     key is absent from English too.
     """
     loc = _resolve(locale) if locale else get_locale()
-    translation = get_translation(loc).gettext(message)
-    if translation == message:
+    translation = get_table(loc).get(message)
+    if translation is None:
         raise TranslationError(translation=message, message='Missing translation')
     return translation
+
+
+def translate(message: str, default=None, locale=None):  # noqa: A002
+    """Translate *message* like ``_()`` but return *default* instead of raising on a miss."""
+    loc = _resolve(locale) if locale else get_locale()
+    return get_table(loc).get(message, default)
@@ -1,178 +1,104 @@
 import abc
-import datetime
-from typing import Optional
+import weakref
 
+from metar_taf_parser.commons.i18n import get_locale, get_thread_locale
 from metar_taf_parser.model.enum import Descriptive, Flag, WeatherChangeType, TimeIndicator, IcingIntensity, TurbulenceIntensity
 
 
-class Country:
+def _code(member) -> str:
+    """
+    :return: the code of an enum member, e.g. 'OVC' for CloudQuantity.OVC, or None
+    """
+    return None if member is None else member.value
 
-    def __init__(self, name):
-        self._name = name
 
-    def _get_name(self):
-        """ Return the name of the country """
-        return self._name
+def _to_dict(obj) -> dict:
+    return None if obj is None else obj.to_dict()
+
+
+class Country:
+    __slots__ = ('name',)
 
-    def _set_name(self, value):
-        """ Setter for the name """
-        self._name = value
+    def __init__(self, name):
+        self.name = name
 
     def __repr__(self):
         return f'Country[name={self.name}]'
 
-    name = property(_get_name, _set_name)
+    def to_dict(self) -> dict:
+        return {'name': self.name}
 
 
 class Wind:
-    def __init__(self):
-        self._speed = None
-        self._direction = None
-        self._degrees = None
-        self._gust = None
-        self._min_variation = None
-        self._max_variation = None
-        self._unit = None
-
-    def _get_speed(self):
-        return self._speed
-
-    def _set_speed(self, value):
-        self._speed = value
-
-    def _get_direction(self):
-        return self._direction
-
-    def _set_direction(self, value):
-        self._direction = value
-
-    def _get_degrees(self):
-        return self._degrees
-
-    def _set_degrees(self, value):
-        self._degrees = value
-
-    def _get_gust(self):
-        return self._gust
-
-    def _set_gust(self, value):
-        self._gust = value
-
-    def _get_min_variation(self):
-        return self._min_variation
-
-    def _set_min_variation(self, value):
-        self._min_variation = value
-
-    def _get_max_variation(self):
-        return self._max_variation
-
-    def _set_max_variation(self, value):
-        self._max_variation = value
-
-    def _get_unit(self):
-        return self._unit
+    __slots__ = ('speed', 'direction', 'degrees', 'gust', 'min_variation', 'max_variation', 'unit', '__weakref__')
 
-    def _set_unit(self, value):
-        self._unit = value
+    def __init__(self):
+        self.speed = None
+        self.direction = None
+        self.degrees = None
+        self.gust = None
+        self.min_variation = None
+        self.max_variation = None
+        self.unit = None
 
     def __repr__(self):
         return f'Wind[speed={self.speed}, direction={self.direction}, gust={self.gust}, degrees={self.degrees}, '\
             f'unit={self.unit}, min_variation={self.min_variation}, max_variation={self.max_variation}]'
 
-    speed = property(_get_speed, _set_speed)
-    direction = property(_get_direction, _set_direction)
-    gust = property(_get_gust, _set_gust)
-    degrees = property(_get_degrees, _set_degrees)
-    unit = property(_get_unit, _set_unit)
-    min_variation = property(_get_min_variation, _set_min_variation)
-    max_variation = property(_get_max_variation, _set_max_variation)
+    def to_dict(self) -> dict:
+        """
+        Converts the object to a dict of JSON compatible values.
+        Enum members are replaced by their code and times by their ISO format.
+        :return: dict
+        """
+        return {'speed': self.speed, 'direction': self.direction, 'degrees': self.degrees, 'gust': self.gust,
+                'min_variation': self.min_variation, 'max_variation': self.max_variation, 'unit': self.unit}
 
 
 class WindShear(Wind):
+    __slots__ = ('height', 'height_unit')
+
     def __init__(self):
         super().__init__()
-        self._height = None
-        self._height_unit = None
-
-    def _get_height(self):
-        return self._height
-
-    def _set_height(self, value):
-        self._height = value
-
-    def _get_height_unit(self):
-        return self._height_unit
-
-    def _set_height_unit(self, value):
-        self._height_unit = value
+        self.height = None
+        self.height_unit = None
 
     def __repr__(self):
         return f'WindShear[height={self.height}, height_unit={self.height_unit}' + super().__repr__() + ']'
 
-    height = property(_get_height, _set_height)
-    height_unit = property(_get_height_unit, _set_height_unit)
+    def to_dict(self) -> dict:
+        result = super().to_dict()
+        result['height'] = self.height
+        result['height_unit'] = _code(self.height_unit)
+        return result
 
 
 class Visibility:
-    def __init__(self):
-        self._distance = None
-        self._min_distance = None
-        self._min_direction = None
-        self._unit = None
-
-    def _get_distance(self):
-        return self._distance
-
-    def _set_distance(self, value):
-        self._distance = value
-
-    def _get_min_distance(self):
-        return self._min_distance
+    __slots__ = ('distance', 'min_distance', 'min_direction', 'unit', '__weakref__')
 
-    def _set_min_distance(self, value):
-        self._min_distance = value
-
-    def _get_min_direction(self):
-        return self._min_direction
-
-    def _set_min_direction(self, value):
-        self._min_direction = value
-
-    def _get_unit(self):
-        return self._unit
-
-    def _set_unit(self, value):
-        self._unit = value
+    def __init__(self):
+        self.distance = None
+        self.min_distance = None
+        self.min_direction = None
+        self.unit = None
 
     def __repr__(self):
         return f'Visibility[distance={self.distance}, min_distance={self.min_distance}, '\
             f'min_direction={self.min_direction}, unit={self.unit}]'
 
-    distance = property(_get_distance, _set_distance)
-    min_distance = property(_get_min_distance, _set_min_distance)
-    min_direction = property(_get_min_direction, _set_min_direction)
-    unit = property(_get_unit, _set_unit)
+    def to_dict(self) -> dict:
+        return {'distance': self.distance, 'min_distance': self.min_distance, 'min_direction': self.min_direction,
+                'unit': _code(self.unit)}
 
 
 class WeatherCondition:
+    __slots__ = ('intensity', 'descriptive', '_phenomenons', '__weakref__')
+
     def __init__(self):
-        self._intensity = None
-        self._descriptive = None
+        self.intensity = None
+        self.descriptive = None
         self._phenomenons = []
 
-    def _get_intensity(self):
-        return self._intensity
-
-    def _set_intensity(self, value):
-        self._intensity = value
-
-    def _get_descriptive(self):
-        return self._descriptive
-
-    def _set_descriptive(self, value):
-        self._descriptive = value
-
     def _get_phenomenons(self):
         return self._phenomenons
 
@@ -180,246 +106,121 @@ class WeatherCondition:
         self._phenomenons.append(phenomenon)
 
     def is_valid(self):
-        return len(self._phenomenons) != 0 or self._descriptive == Descriptive.THUNDERSTORM
+        return len(self._phenomenons) != 0 or self.descriptive == Descriptive.THUNDERSTORM
 
     def __repr__(self):
         return f'WeatherCondition[intensity={self.intensity}, descriptive={self.descriptive}, phenomenons={self.phenomenons}]'
 
-    intensity = property(_get_intensity, _set_intensity)
-    descriptive = property(_get_descriptive, _set_descriptive)
+    def to_dict(self) -> dict:
+        return {'intensity': _code(self.intensity), 'descriptive': _code(self.descriptive),
+                'phenomenons': [phenomenon.value for phenomenon in self._phenomenons]}
+
     phenomenons = property(_get_phenomenons)
 
 
 class TemperatureDated:
-    def __init__(self):
-        self._temperature = None
-        self._day = None
-        self._hour = None
-
-    def _get_temperature(self):
-        return self._temperature
-
-    def _set_temperature(self, value):
-        self._temperature = value
+    __slots__ = ('temperature', 'day', 'hour')
 
-    def _get_day(self):
-        return self._day
-
-    def _set_day(self, value):
-        self._day = value
-
-    def _get_hour(self):
-        return self._hour
-
-    def _set_hour(self, value):
-        self._hour = value
+    def __init__(self):
+        self.temperature = None
+        self.day = None
+        self.hour = None
 
     def __repr__(self):
         return f'TemperatureDated[temperature={self.temperature}, day={self.day}, hour={self.hour}]'
 
-    temperature = property(_get_temperature, _set_temperature)
-    day = property(_get_day, _set_day)
-    hour = property(_get_hour, _set_hour)
+    def to_dict(self) -> dict:
+        return {'temperature': self.temperature, 'day': self.day, 'hour': self.hour}
 
 
 class RunwayInfo:
+    __slots__ = ('name', 'min_range', 'max_range', 'unit', 'trend', 'indicator', 'deposit_type', 'coverage',
+                 'thickness', 'braking_capacity')
 
     def __init__(self):
-        self._name = None
-        self._min_range = None
-        self._max_range = None
-        self._unit = None
-        self._trend = None
-        self._indicator = None
-        self._deposit_type = None
-        self._coverage = None
-        self._thickness = None
-        self._braking_capacity = None
-
-    def _get_name(self):
-        return self._name
-
-    def _set_name(self, value):
-        self._name = value
-
-    def _get_min_range(self):
-        return self._min_range
-
-    def _set_min_range(self, value):
-        self._min_range = value
-
-    def _get_max_range(self):
-        return self._max_range
-
-    def _set_max_range(self, value):
-        self._max_range = value
-
-    def _get_unit(self):
-        return self._unit
-
-    def _set_unit(self, value):
-        self._unit = value
-
-    def _get_trend(self):
-        return self._trend
-
-    def _set_trend(self, value):
-        self._trend = value
-
-    def _get_indicator(self):
-        return self._indicator
-
-    def _set_indicator(self, value: str):
-        self._indicator = value
-
-    def _get_deposit_type(self):
-        return self._deposit_type
-
-    def _set_deposit_type(self, value):
-        self._deposit_type = value
-
-    def _get_coverage(self):
-        return self._coverage
-
-    def _set_coverage(self, value):
-        self._coverage = value
-
-    def _get_thickness(self):
-        return self._thickness
-
-    def _set_thickness(self, value):
-        self._thickness = value
-
-    def _get_braking_capacity(self):
-        return self._braking_capacity
-
-    def _set_braking_capacity(self, value):
-        self._braking_capacity = value
+        self.name = None
+        self.min_range = None
+        self.max_range = None
+        self.unit = None
+        self.trend = None
+        self.indicator = None
+        self.deposit_type = None
+        self.coverage = None
+        self.thickness = None
+        self.braking_capacity = None
 
     def __repr__(self):
         return f'RunwayInfo[name={self.name}, min_range={self.min_range}, max_range={self.max_range}, unit={self.unit}, '\
             f'trend={self.trend}, indicator={self.indicator}, deposit_type={self.deposit_type}, '\
-            f'coverage={self.coverage}, thickness={self.thickness}, braking_capacity={self.braking_capacity}]'\
+            f'coverage={self.coverage}, thickness={self.thickness}, braking_capacity={self.braking_capacity}]'
 
-    name = property(_get_name, _set_name)
-    min_range = property(_get_min_range, _set_min_range)
-    max_range = property(_get_max_range, _set_max_range)
-    unit = property(_get_unit, _set_unit)
-    trend = property(_get_trend, _set_trend)
-    indicator = property(_get_indicator, _set_indicator)
-    deposit_type = property(_get_deposit_type, _set_deposit_type)
-    coverage = property(_get_coverage, _set_coverage)
-    thickness = property(_get_thickness, _set_thickness)
-    braking_capacity = property(_get_braking_capacity, _set_braking_capacity)
+    def to_dict(self) -> dict:
+        return {'name': self.name, 'min_range': self.min_range, 'max_range': self.max_range, 'unit': _code(self.unit),
+                'trend': self.trend, 'indicator': self.indicator, 'deposit_type': _code(self.deposit_type),
+                'coverage': _code(self.coverage), 'thickness': self.thickness,
+                'braking_capacity': self.braking_capacity}
 
 
 class Cloud:
+    __slots__ = ('height', 'quantity', 'type', 'unit', '__weakref__')
 
     def __init__(self):
-        self._height = None
-        self._quantity = None
-        self._type = None
-        self._unit = None
-
-    def _get_height(self):
-        return self._height
-
-    def _set_height(self, value):
-        self._height = value
-
-    def _get_quantity(self):
-        return self._quantity
-
-    def _set_quantity(self, value):
-        self._quantity = value
-
-    def _set_type(self, value):
-        self._type = value
-
-    def _get_type(self):
-        return self._type
-
-    def _get_unit(self):
-        return self._unit
-
-    def _set_unit(self, value):
-        self._unit = value
+        self.height = None
+        self.quantity = None
+        self.type = None
+        self.unit = None
 
     def __repr__(self):
         return f'Cloud[height={self.height}, quantity={self.quantity}, type={self.type}, unit={self.unit}]'
 
-    height = property(_get_height, _set_height)
-    quantity = property(_get_quantity, _set_quantity)
-    type = property(_get_type, _set_type)
-    unit = property(_get_unit, _set_unit)
+    def to_dict(self) -> dict:
+        return {'height': self.height, 'quantity': _code(self.quantity), 'type': _code(self.type),
+                'unit': _code(self.unit)}
 
 
 class AbstractWeatherLayer(abc.ABC):
+    __slots__ = ('base_height', 'depth', 'unit')
 
     def __init__(self):
-        self._base_height = 0
-        self._depth = 0
-        self._unit = None
-
-    def _get_base_height(self):
-        return self._base_height
-
-    def _set_base_height(self, base_height: int):
-        self._base_height = base_height
-
-    def _get_depth(self):
-        return self._depth
-
-    def _set_depth(self, depth: int):
-        self._depth = depth
+        self.base_height = 0
+        self.depth = 0
+        self.unit = None
 
-    def _get_unit(self):
-        return self._unit
-
-    def _set_unit(self, unit):
-        self._unit = unit
-
-    base_height = property(_get_base_height, _set_base_height)
-    depth = property(_get_depth, _set_depth)
-    unit = property(_get_unit, _set_unit)
+    def to_dict(self) -> dict:
+        return {'intensity': _code(self.intensity), 'base_height': self.base_height, 'depth': self.depth,
+                'unit': _code(self.unit)}
 
 
 class Icing(AbstractWeatherLayer):
+    __slots__ = ('intensity',)
+
     def __init__(self):
         super().__init__()
-        self._intensity: Optional[IcingIntensity] = None
-
-    def _get_intensity(self):
-        return self._intensity
-
-    def _set_intensity(self, intensity: IcingIntensity):
-        self._intensity = intensity
+        self.intensity: IcingIntensity = None
 
     def __repr__(self):
         return f'Icing[intensity={self.intensity}, base_height={self.base_height}, depth={self.depth}, unit={self.unit}]'
 
-    intensity = property(_get_intensity, _set_intensity)
-
 
 class Turbulence(AbstractWeatherLayer):
+    __slots__ = ('intensity',)
 
     def __init__(self):
         super().__init__()
-        self._intensity: Optional[TurbulenceIntensity] = None
-
-    def _get_intensity(self):
-        return self._intensity
-
-    def _set_intensity(self, intensity: TurbulenceIntensity):
-        self._intensity = intensity
+        self.intensity: TurbulenceIntensity = None
 
     def __repr__(self):
         return f'Turbulence[intensity={self.intensity}, base_height={self.base_height}, depth={self.depth}, unit={self.unit}]'
 
-    intensity = property(_get_intensity, _set_intensity)
 
+class _TafGroupsMixin:
+    """
+    Turbulence and icing groups shared by TAF and TAFTrend.
+    The mixin has no slots of its own: a class can only have one base with a non-empty slot layout,
+    so TAF and TAFTrend declare _turbulence and _icings next to their other slots.
+    """
+    __slots__ = ()
 
-class ITafGroups:
     def __init__(self):
         self._turbulence = []
         self._icings = []
@@ -439,72 +240,146 @@ class ITafGroups:
     def __repr__(self):
         return f'turbulence={self.turbulence}, icings={self.icings}'
 
+    def _taf_groups_to_dict(self, result: dict) -> dict:
+        result['turbulence'] = [turbulence.to_dict() for turbulence in self._turbulence]
+        result['icings'] = [icing.to_dict() for icing in self._icings]
+        return result
+
     turbulence = property(_get_turbulence)
     icings = property(_get_icings)
 
 
-class AbstractWeatherContainer(abc.ABC):
+class ITafGroups(_TafGroupsMixin, abc.ABC):
+    """
+    Standalone turbulence and icing groups. TAF and TAFTrend are registered as virtual subclasses.
+    """
+    __slots__ = ('_turbulence', '_icings')
 
-    def __init__(self):
-        self._wind = None
-        self._visibility = None
-        self._vertical_visibility = None
-        self._vertical_visibility_unit = None
-        self._wind_shear = None
-        self._cavok = None
-        self._remark = None
-        self._remarks = []
-        self._clouds = []
-        self._weather_conditions = []
 
-    def _get_wind(self):
-        return self._wind
+class RemarkRecord:
+    """
+    A group of the remark decoded without translation.
+    kind identifies the group, values holds its fields and text is the group as written in the message.
+    """
+    __slots__ = ('kind', 'values', 'text')
 
-    def _set_wind(self, value: Wind):
-        self._wind = value
+    def __init__(self, kind: str, values: dict, text: str):
+        self.kind = kind
+        self.values = values
+        self.text = text
 
-    def _get_visibility(self):
-        return self._visibility
+    def __eq__(self, other):
+        return isinstance(other, RemarkRecord) and (self.kind, self.values, self.text) == \
+            (other.kind, other.values, other.text)
 
-    def _set_visibility(self, value: Visibility):
-        self._visibility = value
+    def __repr__(self):
+        return f'RemarkRecord[kind={self.kind}, values={self.values}, text={self.text}]'
 
-    def _get_vertical_visibility(self):
-        return self._vertical_visibility
+    def to_dict(self) -> dict:
+        return {'kind': self.kind, 'values': self.values, 'text': self.text}
 
-    def _set_vertical_visibility(self, value: int):
-        self._vertical_visibility = value
 
-    def _get_vertical_visibility_unit(self):
-        return self._vertical_visibility_unit
+class _LazyRemark:
+    __slots__ = ('raw_remark', 'locale', '_decoder', '_translator', '_records', '_translations')
 
-    def _set_vertical_visibility_unit(self, value):
-        self._vertical_visibility_unit = value
+    def __init__(self, raw_remark: str, decoder, translator, locale: str = None):
+        self.raw_remark = raw_remark
+        self.locale = locale
+        self._decoder = decoder
+        self._translator = translator
+        self._records = None
+        self._translations = {}
 
-    def _get_wind_shear(self):
-        return self._wind_shear
+    def get_records(self) -> list:
+        if self._records is None:
+            self._records = self._decoder(self.raw_remark)
+        return self._records
 
-    def _set_wind_shear(self, value: WindShear):
-        self._wind_shear = value
+    def get_translation(self, locale: str) -> tuple:
+        """
+        :return: tuple (the list of remarks, the remarks joined with spaces) in the locale
+        """
+        translation = self._translations.get(locale)
+        if translation is None:
+            remarks = self._translator(self.get_records(), locale)
+            translation = self._translations[locale] = (remarks, str.join(' ', remarks))
+        return translation
 
-    def _get_cavok(self):
-        return self._cavok
 
-    def _set_cavok(self, value: bool):
-        self._cavok = value
+class AbstractWeatherContainer(abc.ABC):
+    __slots__ = ('wind', 'visibility', 'vertical_visibility', 'vertical_visibility_unit', 'wind_shear', 'cavok',
+                 '_remark', '_remarks', '_remark_records', '_lazy_remark', '_clouds', '_weather_conditions')
+
+    def __init__(self):
+        self.wind = None
+        self.visibility = None
+        self.vertical_visibility = None
+        self.vertical_visibility_unit = None
+        self.wind_shear = None
+        self.cavok = None
+        self._remark = None
+        self._remarks = []
+        self._remark_records = None
+        self._lazy_remark = None
+        self._clouds = []
+        self._weather_conditions = []
 
     def _get_remark(self):
+        if self._lazy_remark is not None:
+            return self._decode_remark()[1]
         return self._remark
 
     def _set_remark(self, value: str):
+        self._lazy_remark = None
+        self._remark_records = None
         self._remark = value
 
     def _get_remarks(self):
+        if self._lazy_remark is not None:
+            return self._decode_remark()[0]
         return self._remarks
 
     def _set_remarks(self, remarks: list):
+        self._lazy_remark = None
+        self._remark_records = None
         self._remarks = remarks
 
+    def _get_raw_remark(self):
+        return self._lazy_remark.raw_remark if self._lazy_remark is not None else None
+
+    def _get_remark_records(self):
+        if self._lazy_remark is not None:
+            return self._lazy_remark.get_records()
+        return self._remark_records
+
+    def set_decoded_remark(self, records: list, remarks: list):
+        """
+        Stores a remark decoded and translated during the parsing.
+        :param records: the list of RemarkRecord of the remark
+        :param remarks: the records translated with the active locale
+        :return: None
+        """
+        self.remarks = remarks
+        self.remark = str.join(' ', remarks)
+        self._remark_records = records
+
+    def set_raw_remark(self, raw_remark: str, decoder, translator, locale: str = None):
+        """
+        Stores the remark undecoded. It is decoded into records on the first access of remark, remarks
+        or remark_records, and translated with the locale set for the thread at the time of the access,
+        else with the locale given here, else with the default locale. The translations are cached per locale.
+        :param raw_remark: the remark part of the message, after the RMK token
+        :param decoder: function called with the raw remark, returning the list of RemarkRecord
+        :param translator: function called with the records and the locale, returning the list of remarks
+        :param locale: the locale the message was parsed with, None for the default locale
+        :return: None
+        """
+        self._lazy_remark = _LazyRemark(raw_remark, decoder, translator, locale)
+
+    def _decode_remark(self):
+        lazy_remark = self._lazy_remark
+        return lazy_remark.get_translation(get_thread_locale() or lazy_remark.locale or get_locale())
+
     def _get_clouds(self):
         return self._clouds
 
@@ -526,74 +401,54 @@ class AbstractWeatherContainer(abc.ABC):
             f'wind_shear={self.wind_shear}, cavok={self.cavok}, remark={self.remark}, '\
             f'clouds={self.clouds}, weather_conditions={self.weather_conditions}'
 
-    wind = property(_get_wind, _set_wind)
-    visibility = property(_get_visibility, _set_visibility)
-    vertical_visibility = property(_get_vertical_visibility, _set_vertical_visibility)
-    vertical_visibility_unit = property(_get_vertical_visibility_unit, _set_vertical_visibility_unit)
-    wind_shear = property(_get_wind_shear, _set_wind_shear)
-    cavok = property(_get_cavok, _set_cavok)
+    def to_dict(self) -> dict:
+        """
+        Converts the object to a dict of JSON compatible values.
+        Enum members are replaced by their code and times by their ISO format.
+        Lazy remarks are decoded with the active locale.
+        :return: dict
+        """
+        return {'wind': _to_dict(self.wind), 'visibility': _to_dict(self.visibility),
+                'vertical_visibility': self.vertical_visibility,
+                'vertical_visibility_unit': _code(self.vertical_visibility_unit),
+                'wind_shear': _to_dict(self.wind_shear), 'cavok': self.cavok, 'remark': self.remark,
+                'remarks': list(self.remarks), 'clouds': [cloud.to_dict() for cloud in self._clouds],
+                'weather_conditions': [condition.to_dict() for condition in self._weather_conditions]}
+
     remark = property(_get_remark, _set_remark)
     remarks = property(_get_remarks, _set_remarks)
+    raw_remark = property(_get_raw_remark)
+    remark_records = property(_get_remark_records)
     clouds = property(_get_clouds)
     weather_conditions = property(_get_weather_conditions)
 
 
 class AbstractValidity(abc.ABC):
+    __slots__ = ('start_day', 'start_hour')
 
-    def _get_start_day(self):
-        return self._start_day
-
-    def _set_start_day(self, value: int):
-        self._start_day = value
-
-    def _get_start_hour(self):
-        return self._start_hour
-
-    def _set_start_hour(self, value: int):
-        self._start_hour = value
+    def __init__(self):
+        self.start_day = None
+        self.start_hour = None
 
     def __repr__(self):
         return f'start_day={self.start_day}, start_hour={self.start_hour}'
 
-    start_day = property(_get_start_day, _set_start_day)
-    start_hour = property(_get_start_hour, _set_start_hour)
+    def to_dict(self) -> dict:
+        return {'start_day': self.start_day, 'start_hour': self.start_hour}
 
 
 class AbstractWeatherCode(AbstractWeatherContainer):
+    __slots__ = ('day', 'time', 'message', 'station', '_flags', '_trends')
 
     def __init__(self):
         super().__init__()
-        self._day = None
-        self._time = None
-        self._message = None
-        self._station = None
+        self.day = None
+        self.time = None
+        self.message = None
+        self.station = None
         self._flags = set()
         self._trends = []
 
-    def _get_day(self):
-        return self._day
-
-    def _set_day(self, value: int):
-        self._day = value
-
-    def _get_time(self):
-        return self._time
-
-    def _set_time(self, value: datetime.time):
-        self._time = value
-
-    def _get_message(self):
-        return self._message
-
-    def _set_message(self, value: str):
-        self._message = value
-
-    def _get_station(self):
-        return self._station
-
-    def _set_station(self, value: str):
-        self._station = value
-
     def _get_trends(self):
         return self._trends
 
@@ -622,10 +477,16 @@ class AbstractWeatherCode(AbstractWeatherContainer):
         return (f'day={self.day}, time={self.time}, message={self.message}, station={self.station}, '
                 f'trends={self.trends}, flags={self.flags}, ' + super().__repr__())
 
-    day = property(_get_day, _set_day)
-    time = property(_get_time, _set_time)
-    message = property(_get_message, _set_message)
-    station = property(_get_station, _set_station)
+    def to_dict(self) -> dict:
+        result = super().to_dict()
+        result['day'] = self.day
+        result['time'] = None if self.time is None else self.time.isoformat()
+        result['message'] = self.message
+        result['station'] = self.station
+        result['flags'] = sorted(flag.value for flag in self._flags)
+        result['trends'] = [trend.to_dict() for trend in self._trends]
+        return result
+
     trends = property(_get_trends)
     flags = property(_get_flags)
     amendment = property(_is_amendment)
@@ -636,39 +497,16 @@ class AbstractWeatherCode(AbstractWeatherContainer):
 
 
 class Metar(AbstractWeatherCode):
+    __slots__ = ('temperature', 'dew_point', 'altimeter', 'nosig', '_runways_info')
 
     def __init__(self):
         super().__init__()
-        self._temperature = None
-        self._dew_point = None
-        self._altimeter = None
-        self._nosig = False
+        self.temperature = None
+        self.dew_point = None
+        self.altimeter = None
+        self.nosig = False
         self._runways_info = []
 
-    def _get_temperature(self):
-        return self._temperature
-
-    def _set_temperature(self, input: int):
-        self._temperature = input
-
-    def _get_dew_point(self):
-        return self._dew_point
-
-    def _set_dew_point(self, value: int):
-        self._dew_point = value
-
-    def _get_altimeter(self):
-        return self._altimeter
-
-    def _set_altimeter(self, value: int):
-        self._altimeter = value
-
-    def _is_nosig(self):
-        return self._nosig
-
-    def _set_nosig(self, value: bool):
-        self._nosig = value
-
     def _get_runways_info(self):
         return self._runways_info
 
@@ -678,39 +516,27 @@ class Metar(AbstractWeatherCode):
     def __repr__(self):
         return 'Metar[' + super().__repr__() + f', temperature={self.temperature}, dew_point={self.dew_point}, altimeter={self.altimeter}, nosig={self.nosig}, runways_info={self.runways_info}]'
 
-    temperature = property(_get_temperature, _set_temperature)
-    dew_point = property(_get_dew_point, _set_dew_point)
-    altimeter = property(_get_altimeter, _set_altimeter)
-    nosig = property(_is_nosig, _set_nosig)
+    def to_dict(self) -> dict:
+        result = super().to_dict()
+        result['temperature'] = self.temperature
+        result['dew_point'] = self.dew_point
+        result['altimeter'] = self.altimeter
+        result['nosig'] = self.nosig
+        result['runways_info'] = [runway_info.to_dict() for runway_info in self._runways_info]
+        return result
+
     runways_info = property(_get_runways_info)
 
 
-class TAF(ITafGroups, AbstractWeatherCode):
+class TAF(_TafGroupsMixin, AbstractWeatherCode):
+    __slots__ = ('_turbulence', '_icings', 'validity', 'max_temperature', 'min_temperature')
 
     def __init__(self):
-        ITafGroups.__init__(self)
+        _TafGroupsMixin.__init__(self)
         AbstractWeatherCode.__init__(self)
-        self._validity = None
-        self._max_temperature = None
-        self._min_temperature = None
-
-    def _get_validity(self):
-        return self._validity
-
-    def _set_validity(self, value: AbstractValidity):
-        self._validity = value
-
-    def _get_min_temperature(self):
-        return self._min_temperature
-
-    def _set_min_temperature(self, value: TemperatureDated):
-        self._min_temperature = value
-
-    def _get_max_temperature(self):
-        return self._max_temperature
-
-    def _set_max_temperature(self, value: TemperatureDated):
-        self._max_temperature = value
+        self.validity = None
+        self.max_temperature = None
+        self.min_temperature = None
 
     def becmgs(self):
         return list(filter(lambda trend: trend.type == WeatherChangeType.BECMG, self.trends))
@@ -728,14 +554,19 @@ class TAF(ITafGroups, AbstractWeatherCode):
         return list(filter(lambda trend: trend.type == WeatherChangeType.FM, self.trends))
 
     def __repr__(self):
-        return 'TAF[' + AbstractWeatherCode.__repr__(self) + ITafGroups.__repr__(self) + f', validity={self.validity}, max_temperature={self.max_temperature}, min_temperature={self.min_temperature}]'
+        return 'TAF[' + AbstractWeatherCode.__repr__(self) + _TafGroupsMixin.__repr__(self) + f', validity={self.validity}, max_temperature={self.max_temperature}, min_temperature={self.min_temperature}]'
 
-    validity = property(_get_validity, _set_validity)
-    max_temperature = property(_get_max_temperature, _set_max_temperature)
-    min_temperature = property(_get_min_temperature, _set_min_temperature)
+    def to_dict(self) -> dict:
+        result = AbstractWeatherCode.to_dict(self)
+        result['validity'] = _to_dict(self.validity)
+        result['max_temperature'] = _to_dict(self.max_temperature)
+        result['min_temperature'] = _to_dict(self.min_temperature)
+        return self._taf_groups_to_dict(result)
 
 
 class AbstractTrend(AbstractWeatherContainer):
+    __slots__ = ('_type',)
+
     def __init__(self, weather_change_type: WeatherChangeType):
         super().__init__()
         self._type = weather_change_type
@@ -746,30 +577,35 @@ class AbstractTrend(AbstractWeatherContainer):
     def __repr__(self):
         return super().__repr__() + f', type={self.type}'
 
+    def to_dict(self) -> dict:
+        result = super().to_dict()
+        result['type'] = _code(self._type)
+        return result
+
     type = property(_get_type)
 
 
 class MetarTrendTime:
+    __slots__ = ('_type', 'time')
+
     def __init__(self, time_indicator: TimeIndicator):
         self._type = time_indicator
+        self.time = None
 
     def _get_type(self):
         return self._type
 
-    def _get_time(self):
-        return self._time
-
-    def _set_time(self, value: datetime.time):
-        self._time = value
-
     def __repr__(self):
         return f'MetarTrendTime[type={self.type}, time={self.time}]'
 
+    def to_dict(self) -> dict:
+        return {'type': _code(self._type), 'time': None if self.time is None else self.time.isoformat()}
+
     type = property(_get_type)
-    time = property(_get_time, _set_time)
 
 
 class MetarTrend(AbstractTrend):
+    __slots__ = ('_times',)
 
     def __init__(self, weather_change_type: WeatherChangeType):
         super().__init__(weather_change_type)
@@ -784,72 +620,209 @@ class MetarTrend(AbstractTrend):
     def __repr__(self):
         return 'MetarTrend[' + super().__repr__() + f', times={self.times}'
 
+    def to_dict(self) -> dict:
+        result = super().to_dict()
+        result['times'] = [trend_time.to_dict() for trend_time in self._times]
+        return result
+
     times = property(_get_times)
 
 
-class TAFTrend(AbstractTrend, ITafGroups):
+class TAFTrend(AbstractTrend, _TafGroupsMixin):
+    __slots__ = ('_turbulence', '_icings', 'validity', 'probability')
+
     def __init__(self, weather_change_type: WeatherChangeType):
-        ITafGroups.__init__(self)
+        _TafGroupsMixin.__init__(self)
         AbstractTrend.__init__(self, weather_change_type)
-        self._probability = None
-
-    def _get_validity(self):
-        return self._validity
-
-    def _set_validity(self, value: AbstractValidity):
-        self._validity = value
-
-    def _get_probability(self):
-        return self._probability
-
-    def _set_probability(self, prob: int):
-        self._probability = prob
+        self.validity = None
+        self.probability = None
 
     def __repr__(self):
-        return 'TAFTrend[' + ITafGroups.__repr__(self) + ', ' + AbstractTrend.__repr__(self) + f', validity={self.validity}, probability={self.probability}'
+        return 'TAFTrend[' + _TafGroupsMixin.__repr__(self) + ', ' + AbstractTrend.__repr__(self) + f', validity={self.validity}, probability={self.probability}'
 
-    probability = property(_get_probability, _set_probability)
-    validity = property(_get_validity, _set_validity)
+    def to_dict(self) -> dict:
+        result = AbstractTrend.to_dict(self)
+        result['validity'] = _to_dict(self.validity)
+        result['probability'] = self.probability
+        return self._taf_groups_to_dict(result)
 
 
 class Validity(AbstractValidity):
+    __slots__ = ('end_hour', 'end_day')
 
     def __init__(self):
         super().__init__()
-        self._end_hour = None
-
-    def _get_end_hour(self):
-        return self._end_hour
-
-    def _set_end_hour(self, value: int):
-        self._end_hour = value
-
-    def _get_end_day(self):
-        return self._end_day
-
-    def _set_end_day(self, value: int):
-        self._end_day = value
+        self.end_hour = None
+        self.end_day = None
 
     def __repr__(self):
         return 'Validity[' + super().__repr__() + ', end_day={end_day}, end_hour={end_hour}]'.format(end_hour=self.end_hour, end_day=self.end_day)
 
-    end_hour = property(_get_end_hour, _set_end_hour)
-    end_day = property(_get_end_day, _set_end_day)
+    def to_dict(self) -> dict:
+        result = super().to_dict()
+        result['end_day'] = self.end_day
+        result['end_hour'] = self.end_hour
+        return result
 
 
 class FMValidity(AbstractValidity):
+    __slots__ = ('start_minutes',)
 
     def __init__(self):
         super().__init__()
-        self._start_minutes = None
-
-    def _get_start_minutes(self):
-        return self._start_minutes
-
-    def _set_start_minutes(self, value: int):
-        self._start_minutes = value
+        self.start_minutes = None
 
     def __repr__(self):
         return 'FMValidity[' + super().__repr__() + f', strart_minutes={self.start_minutes}]'
 
-    start_minutes = property(_get_start_minutes, _set_start_minutes)
+    def to_dict(self) -> dict:
+        result = super().to_dict()
+        result['start_minutes'] = self.start_minutes
+        return result
+
+
+ITafGroups.register(TAF)
+ITafGroups.register(TAFTrend)
+
+
+class _Frozen:
+    """
+    Base of the frozen variants of the model classes, see freeze.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{_MODEL_CLASSES[type(self)].__name__} is frozen, {name} cannot be set')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{_MODEL_CLASSES[type(self)].__name__} is frozen, {name} cannot be deleted')
+
+    def __reduce_ex__(self, protocol):
+        return _unpickle_frozen, (_MODEL_CLASSES[type(self)], {
+            slot: getattr(self, slot) for slot in type(self)._frozen_slots if hasattr(self, slot)
+        })
+
+
+class _FrozenValue(_Frozen):
+    """
+    Base of the frozen variants of the value classes: Wind, WindShear, Visibility, WeatherCondition and Cloud.
+    They are equal when their fields are equal and can be used as dict keys, see interned.
+    """
+    __slots__ = ()
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, slot, None) for slot in type(self)._frozen_slots)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self):
+        return hash((type(self), self._values()))
+
+
+def _slot_names(cls) -> tuple:
+    return tuple(slot for klass in reversed(cls.__mro__) for slot in getattr(klass, '__slots__', ())
+                 if slot != '__weakref__')
+
+
+def _frozen_class(cls):
+    base = _FrozenValue if cls in _VALUE_CLASSES else _Frozen
+    return type(cls)(f'Frozen{cls.__name__}', (base, cls), {
+        '__slots__': (), '__module__': __name__, '_frozen_slots': _slot_names(cls)
+    })
+
+
+def _unpickle_frozen(cls, state: dict):
+    obj = cls.__new__(cls)
+    for slot, value in state.items():
+        setattr(obj, slot, value)
+    obj.__class__ = _FROZEN_CLASSES[cls]
+    return obj
+
+
+def _freeze_value(value, intern: bool):
+    if isinstance(value, list):
+        return tuple(freeze(item, intern) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return freeze(value, intern)
+
+
+def freeze(obj, intern: bool = False):
+    """
+    Makes a model object and the objects it holds read-only, in place.
+    Setting an attribute of a frozen object raises an AttributeError, its lists become tuples and
+    its sets frozensets. A lazy remark is still decoded on access.
+    :param obj: the object to freeze, e.g. a Metar or a TAF
+    :param intern: True to replace the winds, visibilities, weather conditions and clouds by their
+        interned instance, see interned
+    :return: the object, which can be shared safely, or its interned instance
+    """
+    frozen_class = _FROZEN_CLASSES.get(type(obj))
+    if frozen_class is not None:
+        for slot in frozen_class._frozen_slots:
+            value = getattr(obj, slot, None)
+            frozen = _freeze_value(value, intern)
+            if frozen is not value:
+                setattr(obj, slot, frozen)
+        obj.__class__ = frozen_class
+    if intern and isinstance(obj, _FrozenValue):
+        return _INTERNED.setdefault((type(obj), obj._values()), obj)
+    return obj
+
+
+def interned(obj):
+    """
+    Returns the shared instance of a wind, wind shear, visibility, weather condition or cloud.
+    The object is frozen and the first object equal to it becomes the instance returned for all
+    the others, so identical groups of thousands of reports are held once in memory.
+    The table only holds weak references: an instance is forgotten once no report, cache or
+    memo uses it any more. Other objects are only frozen.
+    :param obj: the object to intern
+    :return: the interned frozen object
+    """
+    return freeze(obj, True)
+
+
+def clear_interned():
+    """
+    Forgets the interned objects. The objects already shared stay valid.
+    :return: None
+    """
+    _INTERNED.clear()
+
+
+def thaw(obj):
+    """
+    Copies a frozen object into an object that can be modified. The copy is shallow: the objects it
+    holds stay frozen, its tuples and frozensets are copied into lists and sets.
+    :param obj: the frozen object
+    :return: the new object
+    """
+    cls = _MODEL_CLASSES[type(obj)]
+    result = cls.__new__(cls)
+    for slot in type(obj)._frozen_slots:
+        if hasattr(obj, slot):
+            value = getattr(obj, slot)
+            if isinstance(value, tuple):
+                value = list(value)
+            elif isinstance(value, frozenset):
+                value = set(value)
+            setattr(result, slot, value)
+    return result
+
+
+def is_frozen(obj) -> bool:
+    return type(obj) in _MODEL_CLASSES
+
+
+_VALUE_CLASSES = (Wind, WindShear, Visibility, WeatherCondition, Cloud)
+# (frozen class, field values) -> interned instance, kept alive by its users only.
+_INTERNED = weakref.WeakValueDictionary()
+_FROZEN_CLASSES = {cls: _frozen_class(cls) for cls in (
+    Country, Wind, WindShear, Visibility, WeatherCondition, TemperatureDated, RunwayInfo, Cloud, Icing, Turbulence,
+    Metar, TAF, MetarTrendTime, MetarTrend, TAFTrend, Validity, FMValidity
+)}
+_MODEL_CLASSES = {frozen_class: cls for cls, frozen_class in _FROZEN_CLASSES.items()}
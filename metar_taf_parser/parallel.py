@@ -0,0 +1,158 @@
+"""
+Parses large batches of METAR or TAF messages on several processes.
+
+Messages are sent to the workers in chunks. Each worker builds its parser once, in the
+pool initializer, and parses a chunk with parse_many. The results of a chunk come back
+as a single pickle payload so class references, enum members and attribute names are
+shared by the whole chunk. The raw message is left out of the payload because the
+caller already holds it. It is set back on the result after unpickling.
+"""
+import os
+import pickle
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from metar_taf_parser.parser.parser import MetarParser, TAFParser, ParseFailure, ON_ERROR_COLLECT, ON_ERROR_RAISE, \
+    ON_ERROR_SKIP, _ON_ERROR_MODES
+
+METAR = 'metar'
+TAF = 'taf'
+_PARSERS = {METAR: MetarParser, TAF: TAFParser}
+
+# Parser of the worker process, built by _init_worker.
+_parser = None
+
+
+def _init_worker(kind: str, lazy_remarks: bool):
+    global _parser
+    _parser = _PARSERS[kind](lazy_remarks)
+
+
+def _parse_chunk(messages: list, locale: str, on_error: str) -> bytes:
+    """
+    Parses a chunk of messages in a worker process.
+    :param messages: the messages of the chunk
+    :param locale: the locale of the translated remarks
+    :param on_error: 'collect' or 'raise'
+    :return: the pickled tuple (results, errors). Indexes of the errors are relative to the chunk.
+    """
+    results, errors = _parser.parse_many(messages, locale, on_error)
+    for result in results:
+        if result is not None:
+            result.message = None
+    return pickle.dumps((results, errors), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _iter_chunks(messages, chunk_size: int):
+    """
+    Splits an iterable of messages into lists.
+    :return: generator of tuples (index of the first message, list of messages)
+    """
+    iterator = iter(messages)
+    start = 0
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield start, chunk
+        start += len(chunk)
+        chunk = list(islice(iterator, chunk_size))
+
+
+class ParallelParser:
+    """
+    Parses METAR or TAF messages with a pool of worker processes.
+    Use it as a context manager or call close() to stop the workers.
+    """
+
+    def __init__(self, kind: str = METAR, max_workers: int = None, chunk_size: int = 500, locale: str = None,
+                 on_error: str = ON_ERROR_COLLECT, lazy_remarks: bool = False):
+        """
+        :param kind: 'metar' or 'taf'
+        :param max_workers: number of worker processes, defaults to the number of CPUs
+        :param chunk_size: number of messages sent to a worker at once
+        :param locale: Optional locale string for translated remarks (e.g. 'fr', 'de').
+        :param on_error: 'collect', 'skip' or 'raise', see AbstractParser.parse_many
+        :param lazy_remarks: True to decode the remarks on first access, see AbstractParser
+        """
+        if kind not in _PARSERS:
+            raise ValueError(f'kind must be one of {tuple(_PARSERS)}, got {kind!r}')
+        if on_error not in _ON_ERROR_MODES:
+            raise ValueError(f'on_error must be one of {_ON_ERROR_MODES}, got {on_error!r}')
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._locale = locale
+        self._on_error = on_error
+        self._executor = ProcessPoolExecutor(max_workers=self._max_workers, initializer=_init_worker, initargs=(kind, lazy_remarks))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Stops the worker processes.
+        :return: None
+        """
+        self._executor.shutdown()
+
+    def imap(self, messages, ordered: bool = True):
+        """
+        Parses the messages and streams the results.
+        At most two chunks per worker are in flight, so the input can be a lazy iterable of any size.
+        :param messages: Iterable of messages to parse
+        :param ordered: True to yield the results in the order of the input, False to yield them as chunks complete
+        :return: generator of tuples (index, result). With on_error='collect', the result of a failed
+            message is a ParseFailure. With on_error='skip', failed messages are not yielded.
+        """
+        worker_on_error = ON_ERROR_RAISE if self._on_error == ON_ERROR_RAISE else ON_ERROR_COLLECT
+        pending = deque()
+        for start, chunk in _iter_chunks(messages, self._chunk_size):
+            pending.append((self._executor.submit(_parse_chunk, chunk, self._locale, worker_on_error), start, chunk))
+            if len(pending) >= 2 * self._max_workers:
+                yield from self._collect(pending, ordered)
+        while pending:
+            yield from self._collect(pending, ordered)
+
+    def parse_many(self, messages):
+        """
+        Parses a batch of messages on the worker processes.
+        :param messages: Iterable of messages to parse
+        :return: tuple (results, errors) as returned by AbstractParser.parse_many
+        """
+        results = []
+        errors = []
+        for index, result in self.imap(messages):
+            if isinstance(result, ParseFailure):
+                errors.append(result)
+                result = None
+            results.append(result)
+        return results, errors
+
+    def _collect(self, pending: deque, ordered: bool):
+        """
+        Waits for at least one chunk and yields its results.
+        :param pending: deque of tuples (future, start, chunk) in submission order
+        :param ordered: whether to wait for the oldest chunk
+        :return: generator of tuples (index, result)
+        """
+        if ordered:
+            done = [pending.popleft()]
+        else:
+            finished, _ = wait([item[0] for item in pending], return_when=FIRST_COMPLETED)
+            done = [item for item in pending if item[0] in finished]
+            for item in done:
+                pending.remove(item)
+        for future, start, chunk in done:
+            yield from self._decode(future.result(), start, chunk)
+
+    def _decode(self, payload: bytes, start: int, chunk: list):
+        results, errors = pickle.loads(payload)
+        failures = {failure.index: failure.error for failure in errors}
+        for offset, result in enumerate(results):
+            if result is not None:
+                result.message = chunk[offset]
+                yield start + offset, result
+            elif offset in failures and self._on_error != ON_ERROR_SKIP:
+                yield start + offset, ParseFailure(start + offset, failures[offset])
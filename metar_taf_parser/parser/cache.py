@@ -0,0 +1,106 @@
+"""
+Bounded cache of parse results, see the cache parameter of MetarParser and TAFParser.
+
+The entries are evicted in least recently used order when the cache is full, and after ttl
+seconds when a ttl is given. The cached results are frozen (see metar_taf_parser.model.model.freeze)
+so they can be returned to every caller of the same message without copy.
+"""
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+DEFAULT_MAXSIZE = 4096
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'expirations', 'size', 'maxsize'])
+
+
+def normalize_message(message: str) -> str:
+    """
+    Normalizes the layout of a message, e.g. to store or compare messages: the whitespaces, line
+    breaks included, are collapsed and the trailing '=' is removed. The parsers do not use it for the
+    cache keys, since collapsing the whitespaces can change the tokens, see AbstractParser._message_key.
+    :param message: the raw message
+    :return: the normalized message
+    """
+    return ' '.join(message.split()).rstrip('=').rstrip()
+
+
+class ParseCache:
+    """
+    LRU cache with an optional time to live, safe to use from several threads.
+    """
+    __slots__ = ('maxsize', 'ttl', '_clock', '_entries', '_lock', 'hits', 'misses', 'evictions', 'expirations')
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = None, clock=time.monotonic):
+        """
+        :param maxsize: maximum number of entries
+        :param ttl: number of seconds an entry is kept, None to keep it until it is evicted
+        :param clock: function returning the current time in seconds
+        """
+        if maxsize < 1:
+            raise ValueError(f'maxsize must be at least 1, got {maxsize}')
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        :param key: the key of the entry
+        :return: the value of the entry or None when it is missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires = entry
+            if expires is not None and expires <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Adds an entry, evicting the least recently used one when the cache is full.
+        :param key: the key of the entry
+        :param value: the value, it must not be None
+        :return: None
+        """
+        expires = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            entries = self._entries
+            entries[key] = (value, expires)
+            entries.move_to_end(key)
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Removes all the entries. The counters are kept.
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        """
+        :return: CacheInfo with the counters, the number of entries and the maximum size
+        """
+        return CacheInfo(self.hits, self.misses, self.evictions, self.expirations, len(self._entries), self.maxsize)
+
+    def __repr__(self):
+        return f'ParseCache[{self.info()}]'
@@ -1,17 +1,21 @@
 import abc
+import functools
 import re
+from collections import namedtuple
 from datetime import time
+from itertools import islice
 
 from metar_taf_parser.command.common import CommandSupplier
+from metar_taf_parser.command.dispatch import shared_supplier
 from metar_taf_parser.command.metar import CommandSupplier as MetarCommandSupplier
-from metar_taf_parser.command.remark import RemarkCommandSupplier
-from metar_taf_parser.command.taf import TAFCommandSupplier
 from metar_taf_parser.commons import converter
 from metar_taf_parser.commons.exception import TranslationError
-from metar_taf_parser.commons.i18n import translation_locale
+from metar_taf_parser.commons.i18n import get_locale, get_thread_locale, translation_locale
 from metar_taf_parser.model.enum import Flag, Intensity, Descriptive, Phenomenon, TimeIndicator, WeatherChangeType, LengthUnit
 from metar_taf_parser.model.model import WeatherCondition, Visibility, Metar, TemperatureDated, \
-    AbstractWeatherContainer, TAF, TAFTrend, MetarTrend, Validity, FMValidity, MetarTrendTime
+    AbstractWeatherContainer, TAF, TAFTrend, MetarTrend, Validity, FMValidity, MetarTrendTime, freeze, \
+    interned, thaw
+from metar_taf_parser.parser.cache import ParseCache
 
 
 def parse_delivery_time(abstract_weather_code, time_string):
@@ -23,36 +27,126 @@ def parse_delivery_time(abstract_weather_code, time_string):
     :param time_string: The string representing the delivery time
     :return: None
     """
+    day, hour, minute, is_delivery_time = _parse_delivery_time_fields(time_string)
+    abstract_weather_code.day = day
+    abstract_weather_code.time = time(hour, minute)
+    return is_delivery_time
+
+
+def _parse_delivery_time_fields(time_string):
+    """
+    :param time_string: The string representing the delivery time
+    :return: tuple (day, hour, minute, False if it is a validity time)
+    """
     if len(time_string) > 6 and "/" in time_string:
         # This is a validity string, not a delivery time.
-        abstract_weather_code.day = int(time_string[0:2])
-        abstract_weather_code.time = time(hour=int(time_string[2:4]))
-        return False
-    else:
-        abstract_weather_code.day = int(time_string[0:2])
-        abstract_weather_code.time = time(int(time_string[2:4]), int(time_string[4:6]))
-        return True
+        return int(time_string[0:2]), int(time_string[2:4]), 0, False
+    return int(time_string[0:2]), int(time_string[2:4]), int(time_string[4:6]), True
+
+
+# Visibility of a CAVOK message in km and its bound, the distance is '>10000' meters.
+CAVOK_VISIBILITY_KM = 10.0
+CAVOK_VISIBILITY_BOUND = 1
+
+ON_ERROR_COLLECT = 'collect'
+ON_ERROR_RAISE = 'raise'
+ON_ERROR_SKIP = 'skip'
+_ON_ERROR_MODES = (ON_ERROR_COLLECT, ON_ERROR_RAISE, ON_ERROR_SKIP)
+
+ParseFailure = namedtuple('ParseFailure', ['index', 'error'])
+ParseFailure.__doc__ = 'Failure of a message in a batch: index of the message in the input and the exception raised.'
+
+_FLAGS = {flag.value: flag for flag in Flag}
+_INTENSITIES = {intensity.value: intensity for intensity in Intensity}
+_DESCRIPTIVES = {descriptive.value: descriptive for descriptive in Descriptive}
+_PHENOMENONS = {phenomenon.value: phenomenon for phenomenon in Phenomenon}
 
 
 def _parse_flags(abstract_weather_code, flag_string):
-    try:
-        abstract_weather_code.flags.add(Flag(flag_string))
-        return True
-    except ValueError:
+    flag = _FLAGS.get(flag_string)
+    if flag is None:
         return False
+    abstract_weather_code.flags.add(flag)
+    return True
 
 
-def parse_remark(container: AbstractWeatherContainer, line: list, index: int):
+@functools.lru_cache(maxsize=1024)
+def _decode_weather_condition(weather_str: str):
+    """
+    Decodes a weather condition token in a single left to right pass: an optional intensity,
+    an optional descriptive and then the phenomenons. Descriptive and phenomenon codes are
+    all two characters long, so each step is a single dict lookup.
+    The result only holds enum members, it is cached by token.
+    :param weather_str: The token to decode
+    :return: tuple (intensity, descriptive, phenomenons) or None if the token is not a valid weather condition
+    """
+    index = 0
+    intensity = _INTENSITIES.get(weather_str[:1])
+    if intensity is None:
+        intensity = _INTENSITIES.get(weather_str[:2])
+    if intensity is not None:
+        index = len(intensity.value)
+
+    descriptive = _DESCRIPTIVES.get(weather_str[index:index + 2])
+    if descriptive is not None:
+        index += 2
+
+    phenomenons = []
+    while index < len(weather_str):
+        phenomenon = _PHENOMENONS.get(weather_str[index:index + 2])
+        if phenomenon is None:
+            return None
+        phenomenons.append(phenomenon)
+        index += 2
+
+    if not phenomenons and descriptive != Descriptive.THUNDERSTORM:
+        return None
+    return intensity, descriptive, tuple(phenomenons)
+
+
+def parse_remark(container: AbstractWeatherContainer, line: list, index: int, lazy: bool = False):
     """
     This function parses the array containing the remark and concat the array into a string
     :param container: the metar, taf or taf trend to update
     :param line: The array containing the current line tokens
     :param index: the index starting the remark ie token RMK
+    :param lazy: True to store the remark and decode it on first access of remark, remarks or remark_records,
+        False to decode it into remark_records and translate it now
     :return: None
     """
-    remarks = RemarkParser().parse(str.join(' ', line[index + 1:]))
-    container.remarks = remarks
-    container.remark = str.join(' ', remarks)
+    raw_remark = str.join(' ', line[index + 1:])
+    if lazy:
+        container.set_raw_remark(raw_remark, _decode_remark_records, _translate_remark_records, get_thread_locale())
+        return
+    records = _remark_parser().parse_records(raw_remark)
+    container.set_decoded_remark(records, _remark_parser().translate(records))
+
+
+@functools.lru_cache(maxsize=None)
+def _remark_parser() -> 'RemarkParser':
+    """
+    :return: the RemarkParser shared by the parsers, it holds no state
+    """
+    return RemarkParser()
+
+
+def _decode_remark_records(raw_remark: str) -> list:
+    """
+    Decodes a remark stored by parse_remark with lazy=True.
+    :param raw_remark: the remark part of the message
+    :return: the list of RemarkRecord
+    """
+    return _remark_parser().parse_records(raw_remark)
+
+
+def _translate_remark_records(records: list, locale: str) -> list:
+    """
+    Translates the records of a remark stored by parse_remark with lazy=True.
+    :param records: the list of RemarkRecord
+    :param locale: the locale of the translated remarks
+    :return: the list of remarks
+    """
+    return _remark_parser().translate(records, locale)
 
 
 def _parse_temperature(input: str):
@@ -99,6 +193,83 @@ def _parse_from_validity(input: str):
     return validity
 
 
+_add_weather_condition = AbstractWeatherContainer.add_weather_condition
+_match_span = re.Match.span
+
+
+def _decode_message(input) -> str:
+    """
+    :param input: a message as str, or as bytes, bytearray or memoryview holding ASCII text
+    :return: the message as str
+    :raise UnicodeDecodeError: when the bytes are not ASCII
+    """
+    if isinstance(input, str):
+        return input
+    return str(input, 'ascii')
+
+
+# Segmentation of the TAF messages, see TAFParser._extract_lines_tokens. A token is a group of characters other
+# than whitespace and '=', or a visibility such as 1 1/2SM. It starts a new line when it is a PROB, TEMPO, INTER,
+# BECMG or FM group preceded by a whitespace, except the TEMPO of PROB30 TEMPO and the FM of FMAB followed by a
+# whitespace.
+_LINE_STARTS = ('PROB', 'TEMPO', 'INTER', 'BECMG', 'FM')
+_PROB_WORD_PATTERN = re.compile(r'PROB\d\d')
+_FM_WORD_PATTERN = re.compile(r'FM[A-Z]{2}')
+_FRACTION_PATTERN = re.compile(r'\d/\dSM')
+# Messages with a '=' inside or with whitespaces other than space and line feed are scanned by the regex.
+_SCAN_PATTERN = re.compile(r'[^\S \n]|=')
+_WHITESPACE_PATTERN = re.compile(r'\s{2,}|\n')
+_TAF_TOKEN_PATTERN = re.compile(
+    r'(\s(?:(?=TEMPO)(?<!\sPROB\d\d\s)|(?=INTER|BECMG|PROB|FM(?![A-Z]{2}\s))))?'
+    r'((?<=\s)\d\s\d/\dSM[^\s=]*|[^\s=]+)'
+)
+
+
+def _split_taf_words(text: str) -> list:
+    """
+    Splits a message containing no '=' and no whitespace other than space and line feed into lines of tokens.
+    :param text: the message
+    :return: a list of lines, each line being the list of its tokens.
+    """
+    words = text.split()
+    # The first word starts neither a line nor a visibility unless it is preceded by a whitespace.
+    start = 0 if text[:1].isspace() else 1
+    line = words[:start]
+    lines = [line]
+    previous = ''
+    for word in words[start:]:
+        if word.startswith(_LINE_STARTS) and not (word.startswith('TEMPO') and _PROB_WORD_PATTERN.fullmatch(previous)) \
+                and not _FM_WORD_PATTERN.fullmatch(word):
+            line = [word]
+            lines.append(line)
+        elif len(previous) == 1 and previous.isdecimal() and _FRACTION_PATTERN.match(word):
+            line[-1] = f'{previous} {word}'
+        else:
+            line.append(word)
+        previous = word
+    # FMAB starts a line when nothing follows it.
+    if start < len(words) and not text[-1].isspace() and _FM_WORD_PATTERN.fullmatch(words[-1]):
+        lines.append([line.pop()])
+    return lines
+
+
+def _scan_taf_tokens(text: str) -> list:
+    """
+    Splits any message into lines of tokens with a regex.
+    :param text: the message
+    :return: a list of lines, each line being the list of its tokens.
+    """
+    line = []
+    lines = [line]
+    for new_line, token in _TAF_TOKEN_PATTERN.findall(_WHITESPACE_PATTERN.sub(' ', text)):
+        if new_line:
+            line = [token]
+            lines.append(line)
+        else:
+            line.append(token)
+    return lines
+
+
 class AbstractParser(abc.ABC):
     """
     Abstract class.
@@ -108,45 +279,135 @@ class AbstractParser(abc.ABC):
     TEMPO = 'TEMPO'
     BECMG = 'BECMG'
     RMK = 'RMK'
+    # A token is a group of characters other than whitespace and '=', or a visibility such as 1 1/2SM.
+    TOKEN_REGEX = r'[^\s=]+(?:(?<=\s\d)\s\d/\dSM[^\s=]*)?'
+    # Deprecated, kept for the code splitting messages itself: the separators of the tokens, for re.split.
+    # The parsers match TOKEN_REGEX instead, which gives the same tokens without the empty strings.
     TOKENIZE_REGEX = r'\s((?=\d\/\dSM)(?<!\s\d\s)|(?!\d\/\dSM))|='
     INTENSITY_REGEX = r'^(-|\+|VC|RE)'
     CAVOK = 'CAVOK'
 
-    def __init__(self):
-        self._common_supplier = CommandSupplier()
-        self._tokenize_regex_pattern = re.compile(AbstractParser.TOKENIZE_REGEX)
-        self._intensity_regex_pattern = re.compile(AbstractParser.INTENSITY_REGEX)
+    def __init__(self, lazy_remarks: bool = False, cache: ParseCache = None, token_memo: ParseCache = None):
+        """
+        :param lazy_remarks: True to keep the remark part of the messages undecoded until remark or remarks
+            is read. The remarks are then translated with the locale active at the time of the access, or
+            else with the locale the message was parsed with.
+            In both modes, the remarks decoded without translation are available in remark_records.
+        :param cache: Optional ParseCache. A message already parsed, or differing from one only by its
+            whitespaces or its trailing '=', is then returned from the cache. The results are frozen and
+            shared by all the callers, a result only differing by its message is a shallow copy.
+        :param token_memo: Optional ParseCache keeping the decoded wind, cloud and weather condition tokens,
+            and the match of the other tokens. A repeated token is then added to the report without being
+            parsed again. The winds, clouds and weather conditions decoded this way are frozen and shared
+            by the reports.
+        """
+        self._common_supplier = shared_supplier(CommandSupplier)
+        self._lazy_remarks = lazy_remarks
+        self._cache = cache
+        self._token_memo = token_memo
+        self._token_pattern = re.compile(AbstractParser.TOKEN_REGEX)
+
+    def _get_cache(self):
+        return self._cache
+
+    cache = property(_get_cache)
 
     @abc.abstractmethod
     def parse(self, input: str):
         pass
 
+    @abc.abstractmethod
+    def _parse(self, input: str):
+        """
+        Parses a message using the locale already active for the thread.
+        :param input: The message to parse
+        :return: the parsed object
+        """
+        pass
+
+    def _parse_cached(self, input: str):
+        """
+        Parses a message through the cache, using the locale already active for the thread.
+        The locale is part of the key when the remarks are translated during the parsing, and the locale
+        set for the thread when they are lazy, since the lazy remarks keep it.
+        :param input: The message to parse
+        :return: the frozen parsed object, with the message as given
+        """
+        key = (type(self), self._message_key(input), get_thread_locale() if self._lazy_remarks else get_locale())
+        result = self._cache.get(key)
+        if result is None:
+            result = self._parse(input)
+            if result is not None:
+                self._cache.put(key, freeze(result, intern=True))
+        elif result.message != input:
+            # Same tokens with another layout: share everything but the message.
+            result = thaw(result)
+            result.message = input
+            freeze(result)
+        return result
+
+    def _message_key(self, input: str) -> tuple:
+        """
+        :param input: The message to parse
+        :return: the tokens of the message, the part of the cache key identifying it: the messages differing
+            only by their whitespaces or their trailing '=' share a result, but not those whose tokens differ
+        """
+        return tuple(self.tokenize(input))
+
+    def parse_many(self, inputs, locale: str = None, on_error: str = ON_ERROR_COLLECT):
+        """
+        Parses a batch of messages. The locale is set once for the whole batch.
+        :param inputs: Iterable of messages to parse, as str or as ASCII bytes, bytearray or memoryview
+        :param locale: Optional locale string for translated remarks (e.g. 'fr', 'de').
+        :param on_error: What to do when a message cannot be parsed.
+            'collect': the result is None and a ParseFailure is added to the errors,
+            'skip': the message is left out of the results,
+            'raise': the exception is propagated.
+        :return: tuple (results, errors) where errors is a list of ParseFailure
+        """
+        if on_error not in _ON_ERROR_MODES:
+            raise ValueError(f'on_error must be one of {_ON_ERROR_MODES}, got {on_error!r}')
+        results = []
+        errors = []
+        parse = self._parse if self._cache is None else self._parse_cached
+        with translation_locale(locale):
+            for index, input in enumerate(inputs):
+                try:
+                    results.append(parse(_decode_message(input)))
+                except Exception as error:
+                    if on_error == ON_ERROR_RAISE:
+                        raise
+                    if on_error == ON_ERROR_COLLECT:
+                        results.append(None)
+                        errors.append(ParseFailure(index, error))
+        return results, errors
+
     def _parse_weather_condition(self, weather_str: str):
         """
-        Parses a string into a weather condition. The result is not necessarily valid
+        Parses a string into a weather condition.
         :param weather_str: The input to parse
-        :return: WeatherCondition object
+        :return: WeatherCondition object or None if the input is not a valid weather condition
         """
+        decoded = _decode_weather_condition(weather_str)
+        if decoded is None:
+            return None
         weather_condition = WeatherCondition()
-        if self._intensity_regex_pattern.match(weather_str):
-            match = self._intensity_regex_pattern.findall(weather_str)[0]
-            weather_condition.intensity = Intensity(match)
-            weather_str = weather_str[len(match):]
-
-        for name, member in Descriptive.__members__.items():
-            if member.value in weather_str:
-                weather_condition.descriptive = member
-                weather_str = weather_str[len(member.value):]
-
-        previous_token = ''
-        while weather_str != '' and weather_str != previous_token:
-            previous_token = weather_str
-            for name, member in Phenomenon.__members__.items():
-                if re.match(r'^' + member.value, weather_str):
-                    weather_condition.add_phenomenon(member)
-                    weather_str = weather_str[len(member.value):]
-
-        return weather_condition if weather_str == '' and weather_condition.is_valid() else None
+        weather_condition.intensity = decoded[0]
+        weather_condition.descriptive = decoded[1]
+        for phenomenon in decoded[2]:
+            weather_condition.add_phenomenon(phenomenon)
+        return weather_condition
+
+    def _decode_token(self, input: str) -> tuple:
+        """
+        Decodes a token for the token memo.
+        :param input: The token to decode
+        :return: tuple (apply, value) where apply(container, value) does what general_parse does with the token
+        """
+        apply, value = self._common_supplier.decode(input)
+        if apply is None:
+            return _add_weather_condition, interned(self._parse_weather_condition(input))
+        return apply, value
 
     def tokenize(self, input: str):
         """
@@ -154,7 +415,15 @@ class AbstractParser(abc.ABC):
         :param input: The metar or TAF as string
         :return: List of tokens
         """
-        return list(filter(None, self._tokenize_regex_pattern.split(input)))
+        return self._token_pattern.findall(input)
+
+    def tokenize_spans(self, input: str):
+        """
+        Finds the tokens of the message without copying them.
+        :param input: The metar or TAF as string
+        :return: iterator of the (start, end) spans of the tokens in input, found as the iteration goes
+        """
+        return map(_match_span, self._token_pattern.finditer(input))
 
     def general_parse(self, abstract_weather_container: AbstractWeatherContainer, input: str):
         """
@@ -171,9 +440,17 @@ class AbstractParser(abc.ABC):
             abstract_weather_container.visibility.unit = LengthUnit.METERS
             return True
 
-        command = self._common_supplier.get(input)
+        token_memo = self._token_memo
+        if token_memo is not None:
+            entry = token_memo.get(input)
+            if entry is None:
+                entry = self._decode_token(input)
+                token_memo.put(input, entry)
+            return entry[0](abstract_weather_container, entry[1])
+
+        command, match = self._common_supplier.classify(input)
         if command:
-            return command.execute(abstract_weather_container, input)
+            return command.execute_match(abstract_weather_container, match)
 
         return abstract_weather_container.add_weather_condition(self._parse_weather_condition(input))
 
@@ -185,9 +462,9 @@ class MetarParser(AbstractParser):
     AT = 'AT'
     TL = 'TL'
 
-    def __init__(self):
-        super().__init__()
-        self._metar_command_supplier = MetarCommandSupplier()
+    def __init__(self, lazy_remarks: bool = False, cache: ParseCache = None, token_memo: ParseCache = None):
+        super().__init__(lazy_remarks, cache, token_memo)
+        self._metar_command_supplier = shared_supplier(MetarCommandSupplier)
 
     def _parse_trend(self, index: int, trend: MetarTrend, trend_parts: list):
         """
@@ -212,37 +489,73 @@ class MetarParser(AbstractParser):
     def parse(self, input: str, locale: str = None):
         """
         Parses an message and returns a METAR
-        :param input: The message to parse
+        :param input: The message to parse, as str or as ASCII bytes, bytearray or memoryview
         :param locale: Optional BCP-47/locale string for translated remarks (e.g. 'fr', 'de').
         :return: METAR
         """
+        input = _decode_message(input)
         with translation_locale(locale):
-            metar = Metar()
-
-            metar_tab = self.tokenize(input)
-            metar.station = metar_tab[0]
-
-            metar.message = input
+            if self._cache is not None:
+                return self._parse_cached(input)
+            return self._parse(input)
+
+    def _parse(self, input: str):
+        metar = Metar()
+
+        metar_tab = self.tokenize(input)
+        metar.station = metar_tab[0]
+
+        metar.message = input
+
+        parse_delivery_time(metar, metar_tab[1])
+        index = 2
+        while index < len(metar_tab):
+            if not super().general_parse(metar, metar_tab[index]) and not _parse_flags(metar, metar_tab[index]):
+                if 'NOSIG' == metar_tab[index]:
+                    metar.nosig = True
+                elif AbstractParser.TEMPO == metar_tab[index] or AbstractParser.BECMG == metar_tab[index]:
+                    trend = MetarTrend(WeatherChangeType[metar_tab[index]])
+                    index = self._parse_trend(index, trend, metar_tab)
+                    metar.add_trend(trend)
+                elif AbstractParser.RMK == metar_tab[index]:
+                    parse_remark(metar, metar_tab, index, self._lazy_remarks)
+                    break
+                else:
+                    command, match = self._metar_command_supplier.classify(metar_tab[index])
+                    if command:
+                        command.execute_match(metar, match)
+            index = index + 1
+        return metar
 
-            parse_delivery_time(metar, metar_tab[1])
-            index = 2
-            while index < len(metar_tab):
-                if not super().general_parse(metar, metar_tab[index]) and not _parse_flags(metar, metar_tab[index]):
-                    if 'NOSIG' == metar_tab[index]:
-                        metar.nosig = True
-                    elif AbstractParser.TEMPO == metar_tab[index] or AbstractParser.BECMG == metar_tab[index]:
-                        trend = MetarTrend(WeatherChangeType[metar_tab[index]])
-                        index = self._parse_trend(index, trend, metar_tab)
-                        metar.add_trend(trend)
-                    elif AbstractParser.RMK == metar_tab[index]:
-                        parse_remark(metar, metar_tab, index)
-                        break
-                    else:
-                        command = self._metar_command_supplier.get(metar_tab[index])
-                        if command:
-                            command.execute(metar, metar_tab[index])
-                index = index + 1
-            return metar
+    def parse_into(self, input: str, sink):
+        """
+        Parses a message and writes its fields into a sink instead of building a Metar.
+        The tokens are classified like in parse. The weather conditions, flags, trends and remarks are
+        not written to the sink, so the parsing stops at the first trend or at the remark, and the tokens
+        after it are not even looked for.
+        :param input: The message to parse, as str or as ASCII bytes, bytearray or memoryview
+        :param sink: the MetarSink receiving the fields, see metar_taf_parser.columns
+        :return: None
+        """
+        input = _decode_message(input)
+        spans = self.tokenize_spans(input)
+        station_time = [input[start:end] for start, end in islice(spans, 2)]
+        sink.begin(station_time[0])
+        sink.set_time(*_parse_delivery_time_fields(station_time[1])[:3])
+        for start, end in spans:
+            token = input[start:end]
+            if AbstractParser.TEMPO == token or AbstractParser.BECMG == token or AbstractParser.RMK == token:
+                break
+            if AbstractParser.CAVOK == token:
+                sink.set_visibility(CAVOK_VISIBILITY_KM, CAVOK_VISIBILITY_BOUND)
+                continue
+            command, match = self._common_supplier.classify(token)
+            if (command and command.write_match(sink, match)) or _decode_weather_condition(token) is not None:
+                continue
+            command, match = self._metar_command_supplier.classify(token)
+            if command:
+                command.write_match(sink, match)
+        sink.end()
 
 
 class TAFParser(AbstractParser):
@@ -254,10 +567,16 @@ class TAFParser(AbstractParser):
     TX = 'TX'
     TN = 'TN'
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, lazy_remarks: bool = False, cache: ParseCache = None, token_memo: ParseCache = None):
+        # The TAF and remark commands are imported by the parsers needing them, not with this module.
+        from metar_taf_parser.command.taf import TAFCommandSupplier
+
+        super().__init__(lazy_remarks, cache, token_memo)
         self._validity_pattern = re.compile(r'^\d{4}/\d{4}$')
-        self._taf_command_supplier = TAFCommandSupplier()
+        self._taf_command_supplier = shared_supplier(TAFCommandSupplier)
+
+    def _message_key(self, input: str) -> tuple:
+        return tuple(map(tuple, self._extract_lines_tokens(input)))
 
     def _parse_initial_taf(self, input: str):
         taf = TAF()
@@ -282,54 +601,58 @@ class TAFParser(AbstractParser):
     def parse(self, input: str, locale: str = None):
         """
         Parses a message into a TAF
-        :param input: the message to parse
+        :param input: the message to parse, as str or as ASCII bytes, bytearray or memoryview
         :param locale: Optional locale string for translated remarks (e.g. 'fr', 'de').
         :return: a TAF object or None if the message is invalid
         """
+        input = _decode_message(input)
         with translation_locale(locale):
-            taf, lines, index = self._parse_initial_taf(input)
-
-            for i in range(index + 1, len(lines[0])):
-                token = lines[0][i]
-                command = self._taf_command_supplier.get(token)
-                if AbstractParser.RMK == token:
-                    parse_remark(taf, lines[0], i)
-                    break
-                elif token.startswith(TAFParser.TX):
-                    taf.max_temperature = _parse_temperature(token)
-                elif token.startswith(TAFParser.TN):
-                    taf.min_temperature = _parse_temperature(token)
-                elif command:
-                    command.execute(taf, token)
-                else:
-                    _parse_flags(taf, token)
-                    self.general_parse(taf, token)
+            if self._cache is not None:
+                return self._parse_cached(input)
+            return self._parse(input)
+
+    def _parse(self, input: str):
+        taf, lines, index = self._parse_initial_taf(input)
+
+        for i in range(index + 1, len(lines[0])):
+            token = lines[0][i]
+            command, match = self._taf_command_supplier.classify(token)
+            if AbstractParser.RMK == token:
+                parse_remark(taf, lines[0], i, self._lazy_remarks)
+                break
+            elif token.startswith(TAFParser.TX):
+                taf.max_temperature = _parse_temperature(token)
+            elif token.startswith(TAFParser.TN):
+                taf.min_temperature = _parse_temperature(token)
+            elif command:
+                command.execute_match(taf, match)
+            else:
+                _parse_flags(taf, token)
+                self.general_parse(taf, token)
 
-            # Handle the other lines
-            for line in lines[1:]:
-                self._parse_line(taf, line)
+        # Handle the other lines
+        for line in lines[1:]:
+            self._parse_line(taf, line)
 
-            return taf
+        return taf
 
     def _extract_lines_tokens(self, taf_code: str):
         """
-        Format the message as a multiple line code so each line can be parsed
+        Splits the message into lines of tokens in a single pass: each token is appended to the current line
+        or starts a new one when it is a PROB, TEMPO, INTER, BECMG or FM group other than the TEMPO of
+        PROB30 TEMPO. The TX and TN groups of the last line belong to the first one.
         :param taf_code: The base message
-        :return: a list of string representing the lines of the message.
+        :return: a list of lines, each line being the list of its tokens.
         """
-        single_line = taf_code.replace('\n', ' ')
-        clean_line = re.sub(r'\s{2,}', ' ', single_line)
-        lines = re.sub(r'\s(PROB\d{2}\sTEMPO|TEMPO|INTER|BECMG|FM(?![A-Z]{2}\s)|PROB)', r'\n\g<1>', clean_line).splitlines()
-        lines_token = [self.tokenize(line) for line in lines]
-
-        if len(lines_token) > 1:
-            last_line = lines_token[len(lines) - 1]
-            temperatures = list(filter(lambda x: x.startswith(TAFParser.TX) or x.startswith(TAFParser.TN), last_line))
-
+        text = taf_code.rstrip('=')
+        lines = _scan_taf_tokens(text) if _SCAN_PATTERN.search(text) else _split_taf_words(text)
+        if len(lines) > 1:
+            last_line = lines[-1]
+            temperatures = [token for token in last_line if token.startswith((TAFParser.TX, TAFParser.TN))]
             if temperatures:
-                lines_token[0] = lines_token[0] + temperatures
-                lines_token[len(lines) - 1] = list(filter(lambda x: not x.startswith(TAFParser.TX) and not x.startswith(TAFParser.TN), last_line))
-        return lines_token
+                lines[0] += temperatures
+                lines[-1] = [token for token in last_line if not token.startswith((TAFParser.TX, TAFParser.TN))]
+        return lines
 
     def _parse_line(self, taf: 'TAF', line_tokens: list):
         """
@@ -362,12 +685,12 @@ class TAFParser(AbstractParser):
         :return: None
         """
         for i in range(index, len(line)):
-            command = self._taf_command_supplier.get(line[i])
+            command, match = self._taf_command_supplier.classify(line[i])
 
             if command:
-                command.execute(trend, line[i])
+                command.execute_match(trend, match)
             elif AbstractParser.RMK == line[i]:
-                parse_remark(trend, line, i)
+                parse_remark(trend, line, i, self._lazy_remarks)
                 break
             elif self._validity_pattern.search(line[i]):
                 trend.validity = _parse_validity(line[i])
@@ -377,16 +700,68 @@ class TAFParser(AbstractParser):
 
 class RemarkParser:
     def __init__(self):
-        self._supplier = RemarkCommandSupplier()
+        from metar_taf_parser.command.remark import RemarkCommandSupplier
+
+        self._supplier = shared_supplier(RemarkCommandSupplier)
 
     def parse(self, code: str, locale: str = None) -> list:
+        classify = self._supplier.classify
+        default_command = self._supplier.default_command
         with translation_locale(locale):
-            rmk_str = code
             rmk_list = []
-
-            while rmk_str:
+            pos = 0
+            end = len(code)
+            while pos < end:
+                command, match = classify(code, pos)
                 try:
-                    (rmk_str, rmk_list) = self._supplier.get(rmk_str).execute(rmk_str, rmk_list)
+                    if command:
+                        pos = command.execute_match(match, rmk_list)
+                    else:
+                        pos = default_command.execute_at(code, pos, rmk_list)
                 except TranslationError:
-                    (rmk_str, rmk_list) = self._supplier.default_command.execute(rmk_str, rmk_list)
+                    pos = default_command.execute_at(code, pos, rmk_list)
             return rmk_list
+
+    def parse_records(self, code: str) -> list:
+        """
+        Decodes a remark into records, without translation.
+        The records translated with translate() give the same remarks as parse().
+        :param code: the remark part of the message
+        :return: list of RemarkRecord
+        """
+        classify = self._supplier.classify
+        default_command = self._supplier.default_command
+        records = []
+        pos = 0
+        end = len(code)
+        while pos < end:
+            command, match = classify(code, pos)
+            record = None
+            if command:
+                try:
+                    record = command.parse_record(match)
+                    pos = match.end()
+                except TranslationError:
+                    pass
+            if record is None:
+                record, pos = default_command.parse_record_at(code, pos)
+            records.append(record)
+        return records
+
+    def translate(self, records: list, locale: str = None) -> list:
+        """
+        Translates records decoded by parse_records.
+        A record without translation in the locale is kept as written in the message.
+        :param records: list of RemarkRecord
+        :param locale: Optional locale string for translated remarks (e.g. 'fr', 'de').
+        :return: the list of remarks
+        """
+        get_by_kind = self._supplier.get_by_kind
+        with translation_locale(locale):
+            remarks = []
+            for record in records:
+                try:
+                    remarks.append(get_by_kind(record.kind).translate(record.values))
+                except TranslationError:
+                    remarks.append(record.text)
+            return remarks
@@ -0,0 +1,208 @@
+"""
+Reads METAR and TAF messages lazily from text dumps.
+
+The file is read in large chunks and only the messages of the current chunk are kept in
+memory, so the memory used does not depend on the size of the file.
+Messages are split the same way the parsers tokenize them:
+
+- a METAR ends at the end of its line or at a '=', so a dump can hold one METAR per line
+  or several METARs terminated by '=' on the same line;
+- a TAF ends at a '=', at a blank line or when a line starts with 'TAF', so multi-line
+  bulletins are joined back into a single message.
+"""
+import codecs
+import mmap
+import os
+from itertools import islice
+
+from metar_taf_parser.parser.parser import MetarParser, TAFParser, ParseFailure, ON_ERROR_COLLECT, ON_ERROR_RAISE, \
+    _ON_ERROR_MODES
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_BATCH_SIZE = 256
+
+
+def _read_chunks(source, chunk_size: int, use_mmap: bool, encoding: str):
+    """
+    Reads a file in chunks of text.
+    :param source: path of the file, file object opened in text or binary mode, or bytes, bytearray or memoryview
+    :param chunk_size: number of characters or bytes read at once
+    :param use_mmap: True to memory-map the file, only used when source is a path
+    :param encoding: encoding of the file when it is read as bytes
+    :return: generator of strings
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        with memoryview(source) as buffer:
+            yield from _decode_buffer_chunks(buffer.cast('B'), chunk_size, encoding)
+    elif not isinstance(source, (str, os.PathLike)):
+        yield from _read_file_chunks(source, chunk_size, encoding)
+    elif use_mmap:
+        with open(source, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield from _decode_buffer_chunks(mapped, chunk_size, encoding)
+    else:
+        with open(source, encoding=encoding, buffering=chunk_size) as file:
+            yield from _read_file_chunks(file, chunk_size, encoding)
+
+
+def _decode_buffer_chunks(buffer, chunk_size: int, encoding: str):
+    """
+    Decodes a buffer chunk by chunk, so the whole buffer is never copied at once.
+    :param buffer: mmap or memoryview of bytes
+    :return: generator of strings
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for start in range(0, len(buffer), chunk_size):
+        yield decoder.decode(buffer[start:start + chunk_size])
+    yield decoder.decode(b'', final=True)
+
+
+def _read_file_chunks(file, chunk_size: int, encoding: str):
+    decoder = None
+    chunk = file.read(chunk_size)
+    while chunk:
+        if isinstance(chunk, bytes):
+            decoder = decoder or codecs.getincrementaldecoder(encoding)()
+            chunk = decoder.decode(chunk)
+        yield chunk
+        chunk = file.read(chunk_size)
+    if decoder:
+        yield decoder.decode(b'', final=True)
+
+
+def _iter_lines(chunks):
+    """
+    Splits chunks of text into lines, without the line endings.
+    A chunk without line ending is cut after its last '=', so the messages of a text without line
+    breaks are not accumulated: the split messages are the same, since a '=' ends a message.
+    :param chunks: iterable of strings
+    :return: generator of strings
+    """
+    pending = []
+    for chunk in chunks:
+        *lines, last = chunk.split('\n')
+        if not lines:
+            head, terminator, last = chunk.rpartition('=')
+            lines = [head + terminator] if terminator else []
+        if lines:
+            pending.append(lines[0])
+            yield ''.join(pending)
+            yield from islice(lines, 1, None)
+            pending.clear()
+        pending.append(last)
+    remainder = ''.join(pending)
+    if remainder:
+        yield remainder
+
+
+def split_metars(lines):
+    """
+    Splits lines of text into METAR messages.
+    :param lines: iterable of strings
+    :return: generator of messages
+    """
+    for line in lines:
+        for part in line.split('='):
+            message = part.strip()
+            if message:
+                yield message
+
+
+def split_tafs(lines):
+    """
+    Splits lines of text into TAF messages. The lines of a message are joined with '\\n'.
+    :param lines: iterable of strings
+    :return: generator of messages
+    """
+    parts = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.split(' ', 1)[0] == TAFParser.TAF:
+            yield from _flush(parts)
+        if not line:
+            continue
+        *terminated, last = line.split('=')
+        for part in terminated:
+            parts.append(part)
+            yield from _flush(parts)
+        parts.append(last)
+    yield from _flush(parts)
+
+
+def _flush(parts: list):
+    message = '\n'.join(part.strip() for part in parts if part.strip())
+    parts.clear()
+    if message:
+        yield message
+
+
+def _iter_parsed(parser, messages, locale: str, on_error: str, batch_size: int):
+    """
+    Parses messages by batches with parse_many.
+    :return: generator of parsed objects. With on_error='collect', a ParseFailure is yielded in place
+        of the messages that cannot be parsed. Its index is the position of the message in the file.
+    """
+    if on_error not in _ON_ERROR_MODES:
+        raise ValueError(f'on_error must be one of {_ON_ERROR_MODES}, got {on_error!r}')
+    return _parse_batches(parser, messages, locale, on_error, batch_size)
+
+
+def _parse_batches(parser, messages, locale: str, on_error: str, batch_size: int):
+    worker_on_error = ON_ERROR_RAISE if on_error == ON_ERROR_RAISE else ON_ERROR_COLLECT
+    messages = iter(messages)
+    start = 0
+    batch = list(islice(messages, batch_size))
+    while batch:
+        results, errors = parser.parse_many(batch, locale, worker_on_error)
+        failures = {failure.index: failure.error for failure in errors}
+        for offset, result in enumerate(results):
+            if result is not None:
+                yield result
+            elif offset in failures and on_error == ON_ERROR_COLLECT:
+                yield ParseFailure(start + offset, failures[offset])
+        start += len(batch)
+        batch = list(islice(messages, batch_size))
+
+
+def iter_metars(source, locale: str = None, on_error: str = ON_ERROR_RAISE, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                use_mmap: bool = False, encoding: str = 'utf-8', batch_size: int = DEFAULT_BATCH_SIZE,
+                lazy_remarks: bool = False):
+    """
+    Reads and parses the METAR messages of a file.
+    :param source: path of the file, file object opened in text or binary mode, or bytes, bytearray or memoryview
+        holding the content of a file, e.g. a receive buffer
+    :param locale: Optional locale string for translated remarks (e.g. 'fr', 'de').
+    :param on_error: 'raise', 'skip' or 'collect', see AbstractParser.parse_many.
+        With 'collect', a ParseFailure is yielded in place of the messages that cannot be parsed.
+    :param chunk_size: number of characters or bytes read at once
+    :param use_mmap: True to memory-map the file, only used when source is a path
+    :param encoding: encoding of the file
+    :param batch_size: number of messages parsed with the same locale context
+    :param lazy_remarks: True to decode the remarks on first access, see AbstractParser
+    :return: generator of Metar objects
+    """
+    lines = _iter_lines(_read_chunks(source, chunk_size, use_mmap, encoding))
+    return _iter_parsed(MetarParser(lazy_remarks), split_metars(lines), locale, on_error, batch_size)
+
+
+def iter_tafs(source, locale: str = None, on_error: str = ON_ERROR_RAISE, chunk_size: int = DEFAULT_CHUNK_SIZE,
+              use_mmap: bool = False, encoding: str = 'utf-8', batch_size: int = DEFAULT_BATCH_SIZE,
+              lazy_remarks: bool = False):
+    """
+    Reads and parses the TAF messages of a file.
+    :param source: path of the file, file object opened in text or binary mode, or bytes, bytearray or memoryview
+        holding the content of a file, e.g. a receive buffer
+    :param locale: Optional locale string for translated remarks (e.g. 'fr', 'de').
+    :param on_error: 'raise', 'skip' or 'collect', see AbstractParser.parse_many.
+        With 'collect', a ParseFailure is yielded in place of the messages that cannot be parsed.
+    :param chunk_size: number of characters or bytes read at once
+    :param use_mmap: True to memory-map the file, only used when source is a path
+    :param encoding: encoding of the file
+    :param batch_size: number of messages parsed with the same locale context
+    :param lazy_remarks: True to decode the remarks on first access, see AbstractParser
+    :return: generator of TAF objects
+    """
+    lines = _iter_lines(_read_chunks(source, chunk_size, use_mmap, encoding))
+    return _iter_parsed(TAFParser(lazy_remarks), split_tafs(lines), locale, on_error, batch_size)
@@ -0,0 +1,504 @@
+"""
+Compact binary encoding of Metar and TAF objects.
+
+The encoding is driven by a schema listing the fields of each model class with their type:
+
+- integers are zigzag varints, a time is the varint of its minutes of the day;
+- enum members are the varint of their position in the enum;
+- the values of a remark record are written with a tag byte giving their type, a float as 8 bytes;
+- strings are the varint index of the string in a table stored before the objects, so a
+  station or a unit repeated in a batch is written once;
+- each object starts with a varint bitmask of its fields that are set, the fields that are
+  None or empty are not written at all.
+
+A payload starts with MAGIC and the VERSION of the schema. Any change of the schema, including
+a new member in one of the enums, requires a new VERSION.
+
+write_reports and read_reports store a sequence of reports in a file, by blocks sharing the
+same string table.
+
+write_ndjson writes the reports as JSON instead, one object per line, for the tools that cannot
+read the binary encoding. The objects are the to_dict of the reports and cannot be read back into
+Metar or TAF.
+"""
+import json
+import os
+import struct
+from datetime import time
+from operator import attrgetter
+
+from metar_taf_parser.model.enum import CloudQuantity, CloudType, DepositCoverage, DepositType, Descriptive, Flag, \
+    IcingIntensity, Intensity, LengthUnit, Phenomenon, TimeIndicator, TurbulenceIntensity, WeatherChangeType
+from metar_taf_parser.model.model import Cloud, FMValidity, Icing, Metar, MetarTrend, MetarTrendTime, RemarkRecord, \
+    RunwayInfo, TAF, TAFTrend, TemperatureDated, Turbulence, Validity, Visibility, WeatherCondition, Wind, WindShear, \
+    _MODEL_CLASSES
+from metar_taf_parser.parser.parser import _decode_remark_records, _translate_remark_records
+
+MAGIC = b'MTP'
+VERSION = 2
+DEFAULT_BLOCK_SIZE = 1024
+
+_BLOCK_LENGTH = struct.Struct('<I')
+_FLOAT = struct.Struct('<d')
+
+# The kinds from _LIST on are collections, they are not written when empty.
+_INT, _STR, _BOOL, _TIME, _ENUM, _OBJECT, _CHOICE, _VALUE, _LIST, _SET, _DICT = range(11)
+# Tags of the types of a _VALUE.
+_NONE_VALUE, _FALSE_VALUE, _TRUE_VALUE, _INT_VALUE, _FLOAT_VALUE, _STR_VALUE = range(6)
+
+
+class _Schema:
+    """
+    Fields of a model class: a tuple of (reader, writer, kind) where reader returns the value of the
+    field, writer stores it on a new object and kind describes its type.
+    """
+    __slots__ = ('cls', 'factory', 'fields')
+
+    def __init__(self, cls, factory, fields: list):
+        self.cls = cls
+        self.factory = factory
+        self.fields = tuple((reader if callable(reader) else attrgetter(reader), _writer(writer), kind)
+                            for reader, writer, kind in fields)
+
+
+def _writer(writer):
+    if callable(writer):
+        return writer
+    return lambda obj, value: setattr(obj, writer, value)
+
+
+def _enum(enum_class) -> tuple:
+    members = tuple(enum_class)
+    return _ENUM, members, {member: index for index, member in enumerate(members)}
+
+
+def _set_raw_remark(container, raw_remark: str):
+    container.set_raw_remark(raw_remark, _decode_remark_records, _translate_remark_records)
+
+
+def _get_lazy_remark_locale(container):
+    lazy_remark = container._lazy_remark
+    return None if lazy_remark is None else lazy_remark.locale
+
+
+def _set_lazy_remark_locale(container, locale: str):
+    container._lazy_remark.locale = locale
+
+
+def _field(name: str, kind: tuple) -> tuple:
+    return name, name, kind
+
+
+def _private(name: str, kind: tuple) -> tuple:
+    """
+    A field read with its public property and written to its private slot.
+    """
+    return name, '_' + name, kind
+
+
+_INT_KIND = (_INT,)
+_STR_KIND = (_STR,)
+_BOOL_KIND = (_BOOL,)
+_TIME_KIND = (_TIME,)
+_LENGTH_UNIT_KIND = _enum(LengthUnit)
+
+_SCHEMAS = {}
+
+
+def _register(cls, fields: list, factory=None) -> tuple:
+    """
+    Adds the schema of a model class.
+    :return: the kind of the fields holding an object of the class
+    """
+    _SCHEMAS[cls] = _Schema(cls, factory or cls, fields)
+    return _OBJECT, cls
+
+
+_WIND_FIELDS = [
+    _field('speed', _INT_KIND), _field('direction', _STR_KIND), _field('degrees', _INT_KIND),
+    _field('gust', _INT_KIND), _field('min_variation', _INT_KIND), _field('max_variation', _INT_KIND),
+    _field('unit', _STR_KIND)
+]
+_LAYER_FIELDS = [_field('base_height', _INT_KIND), _field('depth', _INT_KIND), _field('unit', _LENGTH_UNIT_KIND)]
+
+_WIND_KIND = _register(Wind, _WIND_FIELDS)
+_WIND_SHEAR_KIND = _register(WindShear, _WIND_FIELDS + [
+    _field('height', _INT_KIND), _field('height_unit', _LENGTH_UNIT_KIND)
+])
+_VISIBILITY_KIND = _register(Visibility, [
+    _field('distance', _STR_KIND), _field('min_distance', _INT_KIND), _field('min_direction', _STR_KIND),
+    _field('unit', _LENGTH_UNIT_KIND)
+])
+_WEATHER_CONDITION_KIND = _register(WeatherCondition, [
+    _field('intensity', _enum(Intensity)), _field('descriptive', _enum(Descriptive)),
+    _private('phenomenons', (_LIST, _enum(Phenomenon)))
+])
+_TEMPERATURE_DATED_KIND = _register(TemperatureDated, [
+    _field('temperature', _INT_KIND), _field('day', _INT_KIND), _field('hour', _INT_KIND)
+])
+_RUNWAY_INFO_KIND = _register(RunwayInfo, [
+    _field('name', _STR_KIND), _field('min_range', _INT_KIND), _field('max_range', _INT_KIND),
+    _field('unit', _LENGTH_UNIT_KIND), _field('trend', _STR_KIND), _field('indicator', _STR_KIND),
+    _field('deposit_type', _enum(DepositType)), _field('coverage', _enum(DepositCoverage)),
+    _field('thickness', _STR_KIND), _field('braking_capacity', _STR_KIND)
+])
+_CLOUD_KIND = _register(Cloud, [
+    _field('height', _INT_KIND), _field('quantity', _enum(CloudQuantity)), _field('type', _enum(CloudType)),
+    _field('unit', _LENGTH_UNIT_KIND)
+])
+_ICING_KIND = _register(Icing, _LAYER_FIELDS + [_field('intensity', _enum(IcingIntensity))])
+_TURBULENCE_KIND = _register(Turbulence, _LAYER_FIELDS + [_field('intensity', _enum(TurbulenceIntensity))])
+_VALIDITY_KIND = _register(Validity, [
+    _field('start_day', _INT_KIND), _field('start_hour', _INT_KIND), _field('end_day', _INT_KIND),
+    _field('end_hour', _INT_KIND)
+])
+_register(FMValidity, [
+    _field('start_day', _INT_KIND), _field('start_hour', _INT_KIND), _field('start_minutes', _INT_KIND)
+])
+_METAR_TREND_TIME_KIND = _register(MetarTrendTime, [
+    _private('type', _enum(TimeIndicator)), _field('time', _TIME_KIND)
+], lambda: MetarTrendTime(None))
+
+_REMARK_RECORD_KIND = _register(RemarkRecord, [
+    _field('kind', _STR_KIND), _field('values', (_DICT, (_VALUE,))), _field('text', _STR_KIND)
+], lambda: RemarkRecord(None, {}, None))
+
+# The remark is either decoded, in _remark, _remarks and _remark_records, or kept raw by a parser with
+# lazy_remarks=True, with the locale of the parsing. The locale follows raw_remark, which creates the lazy remark.
+_CONTAINER_FIELDS = [
+    _field('wind', _WIND_KIND), _field('visibility', _VISIBILITY_KIND), _field('vertical_visibility', _INT_KIND),
+    _field('vertical_visibility_unit', _LENGTH_UNIT_KIND), _field('wind_shear', _WIND_SHEAR_KIND),
+    _field('cavok', _BOOL_KIND), _field('_remark', _STR_KIND), _field('_remarks', (_LIST, _STR_KIND)),
+    _field('_remark_records', (_LIST, _REMARK_RECORD_KIND)), ('raw_remark', _set_raw_remark, _STR_KIND),
+    (_get_lazy_remark_locale, _set_lazy_remark_locale, _STR_KIND), _private('clouds', (_LIST, _CLOUD_KIND)),
+    _private('weather_conditions', (_LIST, _WEATHER_CONDITION_KIND))
+]
+_TREND_FIELDS = _CONTAINER_FIELDS + [_private('type', _enum(WeatherChangeType))]
+_TAF_GROUPS_FIELDS = [_private('turbulence', (_LIST, _TURBULENCE_KIND)), _private('icings', (_LIST, _ICING_KIND))]
+_CODE_FIELDS = _CONTAINER_FIELDS + [
+    _field('day', _INT_KIND), _field('time', _TIME_KIND), _field('message', _STR_KIND), _field('station', _STR_KIND),
+    _private('flags', (_SET, _enum(Flag)))
+]
+
+_METAR_TREND_KIND = _register(MetarTrend, _TREND_FIELDS + [
+    _private('times', (_LIST, _METAR_TREND_TIME_KIND))
+], lambda: MetarTrend(None))
+_TAF_TREND_KIND = _register(TAFTrend, _TREND_FIELDS + _TAF_GROUPS_FIELDS + [
+    _field('validity', (_CHOICE, (Validity, FMValidity))), _field('probability', _INT_KIND)
+], lambda: TAFTrend(None))
+_register(Metar, _CODE_FIELDS + [
+    _private('trends', (_LIST, _METAR_TREND_KIND)), _field('temperature', _INT_KIND), _field('dew_point', _INT_KIND),
+    _field('altimeter', _INT_KIND), _field('nosig', _BOOL_KIND), _private('runways_info', (_LIST, _RUNWAY_INFO_KIND))
+])
+_register(TAF, _CODE_FIELDS + _TAF_GROUPS_FIELDS + [
+    _private('trends', (_LIST, _TAF_TREND_KIND)), _field('validity', _VALIDITY_KIND),
+    _field('max_temperature', _TEMPERATURE_DATED_KIND), _field('min_temperature', _TEMPERATURE_DATED_KIND)
+])
+
+# Classes of the reports, the index of the class is written before each report.
+_REPORT_CLASSES = (Metar, TAF)
+
+# Frozen objects, e.g. the results of a parser with a cache, are written like the objects they were made from.
+_SCHEMAS.update((frozen_class, _SCHEMAS[cls]) for frozen_class, cls in _MODEL_CLASSES.items() if cls in _SCHEMAS)
+
+
+def _model_class(obj):
+    cls = type(obj)
+    return _MODEL_CLASSES.get(cls, cls)
+
+
+class _Encoder:
+    __slots__ = ('buffer', 'strings')
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.strings = {}
+
+    def write_uint(self, value: int):
+        buffer = self.buffer
+        while value > 0x7f:
+            buffer.append(value & 0x7f | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    def write_report(self, report):
+        self.write_uint(_REPORT_CLASSES.index(_model_class(report)))
+        self.write_object(report, _SCHEMAS[type(report)])
+
+    def write_object(self, obj, schema: _Schema):
+        present = []
+        mask = 0
+        for index, (reader, writer, kind) in enumerate(schema.fields):
+            value = reader(obj)
+            if value is None or (kind[0] >= _LIST and not value):
+                continue
+            mask |= 1 << index
+            present.append((kind, value))
+        self.write_uint(mask)
+        for kind, value in present:
+            self.write_value(kind, value)
+
+    def write_value(self, kind: tuple, value):
+        code = kind[0]
+        if code == _INT:
+            self.write_uint(value << 1 if value >= 0 else (-value << 1) - 1)
+        elif code == _STR:
+            strings = self.strings
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            self.write_uint(index)
+        elif code == _ENUM:
+            self.write_uint(kind[2][value])
+        elif code == _OBJECT:
+            self.write_object(value, _SCHEMAS[kind[1]])
+        else:
+            self.write_other(kind, value)
+
+    def write_other(self, kind: tuple, value):
+        code = kind[0]
+        if code == _BOOL:
+            self.buffer.append(1 if value else 0)
+        elif code == _TIME:
+            self.write_uint(value.hour * 60 + value.minute)
+        elif code == _CHOICE:
+            self.write_uint(kind[1].index(_model_class(value)))
+            self.write_object(value, _SCHEMAS[type(value)])
+        elif code == _VALUE:
+            self.write_tagged(value)
+        elif code == _DICT:
+            self.write_uint(len(value))
+            for key, item in value.items():
+                self.write_value(_STR_KIND, key)
+                self.write_value(kind[1], item)
+        else:
+            self.write_uint(len(value))
+            for item in value:
+                self.write_value(kind[1], item)
+
+    def write_tagged(self, value):
+        if value is None or isinstance(value, bool):
+            self.buffer.append(_NONE_VALUE if value is None else _TRUE_VALUE if value else _FALSE_VALUE)
+        elif isinstance(value, int):
+            self.buffer.append(_INT_VALUE)
+            self.write_value(_INT_KIND, value)
+        elif isinstance(value, float):
+            self.buffer.append(_FLOAT_VALUE)
+            self.buffer += _FLOAT.pack(value)
+        else:
+            self.buffer.append(_STR_VALUE)
+            self.write_value(_STR_KIND, value)
+
+    def string_table(self) -> bytes:
+        table = _Encoder()
+        table.write_uint(len(self.strings))
+        for string in self.strings:
+            encoded = string.encode('utf-8')
+            table.write_uint(len(encoded))
+            table.buffer += encoded
+        return bytes(table.buffer)
+
+
+class _Decoder:
+    __slots__ = ('data', 'pos', 'strings')
+
+    def __init__(self, data, pos: int = 0):
+        self.data = data
+        self.pos = pos
+        self.strings = ()
+
+    def read_uint(self) -> int:
+        data = self.data
+        pos = self.pos
+        byte = data[pos]
+        pos += 1
+        value = byte & 0x7f
+        shift = 7
+        while byte & 0x80:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7f) << shift
+            shift += 7
+        self.pos = pos
+        return value
+
+    def read_string_table(self):
+        strings = []
+        for _ in range(self.read_uint()):
+            length = self.read_uint()
+            strings.append(bytes(self.data[self.pos:self.pos + length]).decode('utf-8'))
+            self.pos += length
+        self.strings = strings
+
+    def read_report(self):
+        cls = _REPORT_CLASSES[self.read_uint()]
+        return self.read_object(_SCHEMAS[cls])
+
+    def read_object(self, schema: _Schema):
+        obj = schema.factory()
+        mask = self.read_uint()
+        index = 0
+        fields = schema.fields
+        while mask:
+            if mask & 1:
+                reader, writer, kind = fields[index]
+                writer(obj, self.read_value(kind))
+            mask >>= 1
+            index += 1
+        return obj
+
+    def read_value(self, kind: tuple):
+        code = kind[0]
+        if code == _INT:
+            value = self.read_uint()
+            return -((value + 1) >> 1) if value & 1 else value >> 1
+        if code == _STR:
+            return self.strings[self.read_uint()]
+        if code == _ENUM:
+            return kind[1][self.read_uint()]
+        if code == _OBJECT:
+            return self.read_object(_SCHEMAS[kind[1]])
+        return self.read_other(kind)
+
+    def read_other(self, kind: tuple):
+        code = kind[0]
+        if code == _BOOL:
+            self.pos += 1
+            return self.data[self.pos - 1] == 1
+        if code == _TIME:
+            return time(*divmod(self.read_uint(), 60))
+        if code == _CHOICE:
+            return self.read_object(_SCHEMAS[kind[1][self.read_uint()]])
+        if code == _VALUE:
+            return self.read_tagged()
+        if code == _DICT:
+            return {self.read_value(_STR_KIND): self.read_value(kind[1]) for _ in range(self.read_uint())}
+        items = [self.read_value(kind[1]) for _ in range(self.read_uint())]
+        return set(items) if code == _SET else items
+
+    def read_tagged(self):
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag == _INT_VALUE:
+            return self.read_value(_INT_KIND)
+        if tag == _FLOAT_VALUE:
+            self.pos += _FLOAT.size
+            return _FLOAT.unpack_from(self.data, self.pos - _FLOAT.size)[0]
+        if tag == _STR_VALUE:
+            return self.read_value(_STR_KIND)
+        return None if tag == _NONE_VALUE else tag == _TRUE_VALUE
+
+
+def _check_header(data, pos: int = 0) -> int:
+    if bytes(data[pos:pos + len(MAGIC)]) != MAGIC:
+        raise ValueError('Not an encoded report')
+    version = data[pos + len(MAGIC)]
+    if version != VERSION:
+        raise ValueError(f'Unsupported encoding version {version}, expected {VERSION}')
+    return pos + len(MAGIC) + 1
+
+
+def to_bytes(report) -> bytes:
+    """
+    Encodes a report.
+    :param report: Metar or TAF
+    :return: the encoded report
+    """
+    encoder = _Encoder()
+    encoder.write_report(report)
+    return MAGIC + bytes((VERSION,)) + encoder.string_table() + bytes(encoder.buffer)
+
+
+def from_bytes(data):
+    """
+    Decodes a report encoded by to_bytes.
+    :param data: bytes-like object
+    :return: Metar or TAF
+    :raise ValueError: when the data is not an encoded report or was encoded with another version
+    """
+    decoder = _Decoder(data, _check_header(data))
+    decoder.read_string_table()
+    return decoder.read_report()
+
+
+def _encode_block(reports: list) -> bytes:
+    encoder = _Encoder()
+    encoder.write_uint(len(reports))
+    for report in reports:
+        encoder.write_report(report)
+    return encoder.string_table() + bytes(encoder.buffer)
+
+
+def write_reports(target, reports, block_size: int = DEFAULT_BLOCK_SIZE) -> int:
+    """
+    Writes reports to a file. The reports are encoded by blocks sharing the same string table.
+    :param target: path of the file or file object opened in binary mode
+    :param reports: iterable of Metar or TAF
+    :param block_size: number of reports per block
+    :return: the number of reports written
+    """
+    if isinstance(target, (str, bytes, os.PathLike)):
+        with open(target, 'wb') as file:
+            return write_reports(file, reports, block_size)
+    target.write(MAGIC + bytes((VERSION,)))
+    count = 0
+    block = []
+    for report in reports:
+        block.append(report)
+        if len(block) == block_size:
+            count += _write_block(target, block)
+    return count + _write_block(target, block)
+
+
+def _write_block(file, block: list) -> int:
+    count = len(block)
+    if count:
+        encoded = _encode_block(block)
+        file.write(_BLOCK_LENGTH.pack(len(encoded)))
+        file.write(encoded)
+        block.clear()
+    return count
+
+
+def read_reports(source):
+    """
+    Reads the reports of a file written by write_reports.
+    :param source: path of the file or file object opened in binary mode
+    :return: generator of Metar or TAF
+    :raise ValueError: when the file was not written by write_reports or was written with another version
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, 'rb') as file:
+            yield from read_reports(file)
+        return
+    _check_header(source.read(len(MAGIC) + 1))
+    header = source.read(_BLOCK_LENGTH.size)
+    while header:
+        decoder = _Decoder(source.read(_BLOCK_LENGTH.unpack(header)[0]))
+        decoder.read_string_table()
+        for _ in range(decoder.read_uint()):
+            yield decoder.read_report()
+        header = source.read(_BLOCK_LENGTH.size)
+
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, check_circular=False, separators=(',', ':'))
+
+
+def write_ndjson(target, reports) -> int:
+    """
+    Writes reports to a file as newline delimited JSON: the to_dict of each report on its own line.
+    The reports are written as they come, so a generator such as iter_metars is never held in memory.
+    :param target: path of the file or file object opened in text mode
+    :param reports: iterable of Metar or TAF
+    :return: the number of reports written
+    """
+    if isinstance(target, (str, bytes, os.PathLike)):
+        with open(target, 'w', encoding='utf-8') as file:
+            return write_ndjson(file, reports)
+    encode = _JSON_ENCODER.encode
+    write = target.write
+    count = 0
+    for report in reports:
+        write(encode(report.to_dict()) + '\n')
+        count += 1
+    return count
@@ -9,9 +9,10 @@ from metar_taf_parser.command.common import (
     VerticalVisibilityCommand,
     WindCommand,
     WindShearCommand,
+    WindVariationCommand,
 )
 from metar_taf_parser.model.enum import CloudQuantity, CloudType, LengthUnit
-from metar_taf_parser.model.model import TAF, Metar
+from metar_taf_parser.model.model import TAF, Metar, freeze, is_frozen
 
 
 class CommonTestCase(unittest.TestCase):
@@ -193,6 +194,45 @@ class CommonTestCase(unittest.TestCase):
         self.assertEqual(240, ws.degrees)
         self.assertEqual(45, ws.speed)
 
+    def test_supplier_decode(self):
+        supplier = CommandSupplier()
+        metar = Metar()
+
+        for token in ('BKN040CB', '27010KT', 'WS020/24045KT'):
+            with self.subTest(token=token):
+                apply, value = supplier.decode(token)
+
+                self.assertTrue(is_frozen(value))
+                self.assertTrue(apply(metar, value))
+        self.assertIs(value, metar.wind_shear)
+        self.assertEqual(CloudType.CB, metar.clouds[0].type)
+        self.assertEqual(270, metar.wind.degrees)
+
+    def test_supplier_decode_keeps_the_match_of_other_commands(self):
+        apply, match = CommandSupplier().decode('9999')
+        metar = Metar()
+
+        self.assertTrue(apply(metar, match))
+        self.assertEqual('>10000', metar.visibility.distance)
+        self.assertEqual((None, None), CommandSupplier().decode('-RA'))
+
+    def test_supplier_decode_invalid_cloud(self):
+        apply, value = CommandSupplier().decode('ABC')
+
+        self.assertIsNone(value)
+        self.assertFalse(apply(Metar(), value))
+
+    def test_wind_variation_copies_a_frozen_wind(self):
+        metar = Metar()
+        metar.wind = freeze(WindCommand().parse_wind('27010KT'))
+        shared = metar.wind
+
+        WindVariationCommand().execute(metar, '240V300')
+
+        self.assertIsNot(shared, metar.wind)
+        self.assertIsNone(shared.min_variation)
+        self.assertEqual((240, 300, 10), (metar.wind.min_variation, metar.wind.max_variation, metar.wind.speed))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,90 @@
+import re
+import unittest
+
+from metar_taf_parser.command.common import CommandSupplier, WindCommand, CloudCommand
+from metar_taf_parser.command.dispatch import LazyPattern, build_dispatch_table, classify, shared_supplier
+from metar_taf_parser.command.metar import CommandSupplier as MetarCommandSupplier, TemperatureCommand
+
+TOKENS = [
+    'LFPG', '170830Z', '00000KT', 'VRB08KT', '27010G25KT', '05009MPS', '030V113', '9999', '0800', '1100NDV',
+    '3000NE', '1100w', '6SM', '1 1/2SM', 'P6SM', 'M1/4SM', '1/2SM', 'VV002', 'VV///', 'FEW020', 'BKN040CB',
+    'SCT026///', 'OVC//////', 'NSC', 'SKC', 'CAVOK', 'WS020/24045KT', 'R26/0600U', 'R26L/0550V700U',
+    'R01L/P0600FT', 'R16/290155', 'M02/M02', '15/12', 'Q1013', 'A3006', '-RA', '+TSRAGR', 'NOSIG', 'TEMPO',
+    'BECMG', 'RMK', 'AUTO', 'FM1200', 'TX15/0612Z', '620304', '520004', 'SM', '',
+]
+
+
+def _linear_scan(commands, token):
+    for command in commands:
+        if command.can_parse(token):
+            return command
+    return None
+
+
+class DispatchTestCase(unittest.TestCase):
+
+    def test_build_dispatch_table_keeps_order(self):
+        wind = WindCommand()
+        temperature = TemperatureCommand()
+        table = build_dispatch_table([wind, temperature])
+
+        self.assertEqual((wind, temperature), table['0'])
+        self.assertEqual((temperature,), table['M'])
+        self.assertEqual((wind,), table['V'])
+
+    def test_classify_returns_match(self):
+        command = CloudCommand()
+        table = build_dispatch_table([command])
+
+        (res, match) = classify(table, 'BKN040CB')
+
+        self.assertIs(command, res)
+        self.assertEqual(('BKN', '040CB', '040', 'CB'), match.groups())
+
+    def test_classify_unknown_token(self):
+        table = build_dispatch_table([CloudCommand()])
+
+        self.assertEqual((None, None), classify(table, '+RA'))
+        self.assertEqual((None, None), classify(table, ''))
+
+    def test_common_supplier_same_as_linear_scan(self):
+        supplier = CommandSupplier()
+        for token in TOKENS:
+            with self.subTest(token):
+                self.assertIs(_linear_scan(supplier._commands, token), supplier.get(token))
+
+    def test_shared_supplier(self):
+        supplier = shared_supplier(MetarCommandSupplier)
+
+        self.assertIsInstance(supplier, MetarCommandSupplier)
+        self.assertIs(supplier, shared_supplier(MetarCommandSupplier))
+        self.assertIsNot(supplier, shared_supplier(CommandSupplier))
+
+    def test_metar_supplier_same_as_linear_scan(self):
+        supplier = MetarCommandSupplier()
+        for token in TOKENS:
+            with self.subTest(token):
+                self.assertIs(_linear_scan(supplier._commands, token), supplier.get(token))
+
+
+class LazyPatternTestCase(unittest.TestCase):
+
+    def test_pattern_compiled_on_first_access(self):
+        class StubCommand:
+            regex = r'^(\d{4})$'
+            other_regex = r'^abc$'
+            _pattern = LazyPattern()
+            _other_pattern = LazyPattern('other_regex', re.IGNORECASE)
+
+        self.assertIsInstance(StubCommand.__dict__['_pattern'], LazyPattern)
+
+        pattern = StubCommand()._pattern
+
+        self.assertIs(pattern, StubCommand.__dict__['_pattern'])
+        self.assertIs(pattern, StubCommand()._pattern)
+        self.assertTrue(pattern.match('9999'))
+        self.assertTrue(StubCommand._other_pattern.match('ABC'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -123,6 +123,27 @@ class MetarCommandTestCase(unittest.TestCase):
         error = context.exception
         self.assertEqual(_("ErrorCode.IncompleteRunwayInformation"), error.message())
 
+    def test_runway_command_execute_match_max_range(self):
+        metar = Metar()
+        command = RunwayCommand()
+
+        command.execute_match(metar, command.can_parse('R26L/0550V700U'))
+
+        runway_info = metar.runways_info[0]
+        self.assertEqual('26L', runway_info.name)
+        self.assertEqual(550, runway_info.min_range)
+        self.assertEqual(700, runway_info.max_range)
+        self.assertEqual('U', runway_info.trend)
+
+    def test_runway_command_execute_unknown_format(self):
+        metar = Metar()
+        command = RunwayCommand()
+
+        self.assertTrue(command.can_parse('R26/ABC'))
+        command.execute(metar, 'R26/ABC')
+
+        self.assertEqual(0, len(metar.runways_info))
+
     def test_command_supplier(self):
         command_supplier = CommandSupplier()
 
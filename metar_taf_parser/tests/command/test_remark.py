@@ -1,6 +1,8 @@
 import unittest
 
-from metar_taf_parser.command.remark import CeilingHeightCommand, DefaultCommand, RemarkCommandSupplier
+from metar_taf_parser.command.remark import CeilingHeightCommand, DefaultCommand, RemarkCommandSupplier, \
+    SeaLevelPressureCommand, ThunderStormLocationCommand
+from metar_taf_parser.commons.exception import TranslationError
 
 
 class RemarkCommandTestCase(unittest.TestCase):
@@ -14,9 +16,69 @@ class RemarkCommandTestCase(unittest.TestCase):
     def test_default_command(self):
         self.assertTrue(DefaultCommand().can_parse(''))
 
+    def test_execute_match_returns_end_offset(self):
+        code = 'AO2 SLP013 T00221017'
+        command = SeaLevelPressureCommand()
+        remarks = []
+
+        self.assertEqual(10, command.execute_match(command.match(code, 4), remarks))
+        self.assertEqual(1, len(remarks))
+
+    def test_default_command_execute_at(self):
+        remarks = []
+
+        self.assertEqual(4, DefaultCommand().execute_at('AO2 FRQ', 1, remarks))
+        self.assertEqual(['O2'], remarks)
+
+    def test_parse_record(self):
+        command = SeaLevelPressureCommand()
+
+        record = command.parse_record(command.match('SLP982'))
+
+        self.assertEqual('sea_level_pressure', record.kind)
+        self.assertEqual({'pressure': 998.2}, record.values)
+        self.assertEqual('SLP982', record.text)
+        self.assertEqual(command.execute('SLP982', [])[1], [command.translate(record.values)])
+
+    def test_default_command_parse_record(self):
+        command = DefaultCommand()
+
+        record = command.parse_record(command.match('AO2 FRQ', 4))
+
+        self.assertEqual(('token', {'token': 'FRQ'}, 'FRQ'), (record.kind, record.values, record.text))
+        self.assertEqual(command.parse_record_at('AO2 FRQ', 4)[0], record)
+
+    def test_parse_record_with_unknown_code(self):
+        command = ThunderStormLocationCommand()
+
+        with self.assertRaises(TranslationError):
+            command.parse_record(command.match('TS XX'))
+
+    def test_supplier_kinds_are_unique(self):
+        supplier = RemarkCommandSupplier()
+
+        for command in supplier._command_list + (supplier.default_command,):
+            with self.subTest(kind=command.kind):
+                self.assertIs(command, supplier.get_by_kind(command.kind))
+
     def test_supplier_commands_list(self):
         self.assertEqual(39, len(RemarkCommandSupplier()._command_list))
 
+    def test_supplier_classify_matches_linear_scan(self):
+        supplier = RemarkCommandSupplier()
+        codes = ['PK WND 28045/15', 'WSHFT 30 FROPA', 'TWR VIS 1 1/2', 'SFC VIS 1 1/2', 'VIS 1/2V2', 'VIS NE 2 1/2',
+                 'TORNADO B13 6 NE', 'FUNNEL CLOUD B1030E1045 3 W', 'RAB05E30', 'SHRAB05', 'TS SE MOV NE', 'GR 1 3/4',
+                 'GR LESS THAN 1/4', 'GS MOD', 'VIRGA NE', 'CIG 005V010', 'CIG 002 RWY11', 'FG FEW000', 'BKN014 V OVC',
+                 'BKN V OVC', 'SLP013', 'SNINCR 2/10', '401001015', '10142', '20012', 'P0009', 'T00261015', '52032',
+                 'l1004', '60009', '70125', '4/021', '98096', '933036', 'AO2', '$']
+        for code in codes:
+            with self.subTest(code=code):
+                expected = next((command for command in supplier._command_list if command.can_parse(code)), None)
+                command, match = supplier.classify('RMK ' + code, 4)
+
+                self.assertIs(expected, command)
+                self.assertIs(expected or supplier.default_command, supplier.get(code))
+
 
 if __name__ == '__main__':
     unittest.main()
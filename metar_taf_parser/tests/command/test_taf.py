@@ -45,6 +45,17 @@ class TAFCommandTestCase(unittest.TestCase):
 
         self.assertEqual(2, len(command_supplier._commands))
 
+    def test_command_supplier_classify(self):
+        command_supplier = TAFCommandSupplier()
+        itaf = ITafGroups()
+
+        (command, match) = command_supplier.classify('520014')
+        command.execute_match(itaf, match)
+
+        self.assertIsInstance(command, TurbulenceCommand)
+        self.assertEqual(TurbulenceIntensity.MODERATE_CLEAR_AIR_OCCASIONAL, itaf.turbulence[0].intensity)
+        self.assertEqual((None, None), command_supplier.classify('BKN020'))
+
 
 if __name__ == '__main__':
     unittest.main()
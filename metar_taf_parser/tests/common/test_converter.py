@@ -60,6 +60,34 @@ class ConverterTest(unittest.TestCase):
     def test_convert_visibility_to_km_with_greater_than(self):
         self.assertAlmostEqual(10.0, converter.convert_visibility_to_km('>10000', 'M'))
 
+    @parameterized.expand([
+        ('1/4', 0.25),
+        ('1 1/2', 1.5),
+        ('P6', 6.0),
+        ('M1/4', 0.25),
+        ('1/0', None),
+    ])
+    def test_convert_distance(self, input, expected):
+        self.assertEqual(expected, converter.convert_distance(input))
+
+    @parameterized.expand([
+        ('P6', 1),
+        ('>10000', 1),
+        ('M1/4', -1),
+        ('1 1/2', 0),
+    ])
+    def test_visibility_bound(self, input, expected):
+        self.assertEqual(expected, converter.visibility_bound(input))
+
+    def test_convert_visibility_to_km_statute_miles_fraction(self):
+        self.assertAlmostEqual(2.414016, converter.convert_visibility_to_km('1 1/2', 'SM'))
+
+    def test_convert_speed_to_knots(self):
+        self.assertEqual(10.0, converter.convert_speed_to_knots(10, 'KT'))
+        self.assertAlmostEqual(19.438445, converter.convert_speed_to_knots(10, 'MPS'), places=5)
+        self.assertAlmostEqual(5.399568, converter.convert_speed_to_knots(10, 'KM/H'), places=5)
+        self.assertIsNone(converter.convert_speed_to_knots(10, 'MPH'))
+
     def test_convert_visibility_to_km_unknown_unit(self):
         self.assertIsNone(converter.convert_visibility_to_km('100', 'FT'))
 
@@ -6,9 +6,12 @@ from metar_taf_parser.commons.i18n import (
     SUPPORTED_LOCALES,
     _,
     _resolve,
+    get_translation,
     get_locale,
+    get_table,
     reset_locale,
     set_locale,
+    translate,
     translation_locale,
 )
 from metar_taf_parser.model.enum import CloudQuantity
@@ -75,6 +78,37 @@ class TestTranslationFallback(unittest.TestCase):
                 _('Remark.SLP')
 
 
+class TestTranslationTable(unittest.TestCase):
+    def test_table_falls_back_to_english(self):
+        table = get_table('pl')
+        self.assertEqual(table['Remark.AO1'], 'automated stations without a precipitation discriminator')
+
+    def test_table_misses_are_absent(self):
+        self.assertIsNone(get_table('fr').get('Remark.SLP'))
+        self.assertNotIn('', get_table('en'))
+
+    def test_table_holds_every_translated_message_of_the_catalogs(self):
+        for loc in SUPPORTED_LOCALES:
+            with self.subTest(locale=loc):
+                translation = get_translation(loc)
+                table = get_table(loc)
+                self.assertTrue(table)
+                for message, value in table.items():
+                    self.assertEqual(translation.gettext(message), value)
+
+    def test_table_is_built_once(self):
+        self.assertIs(get_table('de'), get_table('de'))
+
+    def test_translate_returns_default_on_miss(self):
+        self.assertEqual('SLP', translate('Remark.SLP', 'SLP'))
+        self.assertIsNone(translate('Remark.SLP'))
+
+    def test_translate_uses_active_locale(self):
+        with translation_locale('fr'):
+            self.assertEqual('nuages fragmentés', translate('CloudQuantity.BKN'))
+        self.assertEqual('bedeckt', translate('CloudQuantity.OVC', locale='de'))
+
+
 class TestTranslationLocaleContextManager(unittest.TestCase):
     def test_french_translation_active_inside_block(self):
         with translation_locale('fr'):
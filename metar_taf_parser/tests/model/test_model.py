@@ -0,0 +1,196 @@
+import gc
+import json
+import pickle
+import unittest
+
+from metar_taf_parser.model.enum import WeatherChangeType
+from metar_taf_parser.model.model import ITafGroups, Metar, TAF, TAFTrend, Wind, WindShear, Visibility, Cloud, \
+    RunwayInfo, WeatherCondition, Icing, clear_interned, freeze, interned, is_frozen, thaw, \
+    _INTERNED
+from metar_taf_parser.parser.parser import MetarParser, TAFParser
+
+
+class ModelTestCase(unittest.TestCase):
+
+    def test_models_have_no_instance_dict(self):
+        for model in (Wind(), Visibility(), Cloud(), RunwayInfo(), WeatherCondition(), Icing(), Metar(), TAF(),
+                      TAFTrend(WeatherChangeType.TEMPO), ITafGroups()):
+            with self.subTest(model=type(model).__name__):
+                self.assertFalse(hasattr(model, '__dict__'))
+
+    def test_unknown_attribute_is_rejected(self):
+        with self.assertRaises(AttributeError):
+            Wind().speeed = 10
+
+    def test_taf_groups(self):
+        for groups in (TAF(), TAFTrend(WeatherChangeType.TEMPO), ITafGroups()):
+            with self.subTest(groups=type(groups).__name__):
+                icing = Icing()
+                groups.add_icing(icing)
+
+                self.assertIsInstance(groups, ITafGroups)
+                self.assertEqual([icing], groups.icings)
+                self.assertEqual([], groups.turbulence)
+
+    def test_pickle(self):
+        metar = Metar()
+        metar.station = 'LFPG'
+        metar.wind = Wind()
+        metar.wind.speed = 10
+
+        result = pickle.loads(pickle.dumps(metar))
+
+        self.assertEqual('LFPG', result.station)
+        self.assertEqual(10, result.wind.speed)
+
+    def test_metar_to_dict(self):
+        metar = MetarParser().parse('KTTN 051853Z AUTO 04011KT 1 1/2SM VCTS SN FZFG BKN003 OVC010 M02/M02 A3006 '
+                                    'R26L/0275D BECMG AT1900 4000 RA')
+
+        result = metar.to_dict()
+
+        self.assertEqual(result, json.loads(json.dumps(result)))
+        self.assertEqual('KTTN', result['station'])
+        self.assertEqual('18:53:00', result['time'])
+        self.assertEqual(['AUTO'], result['flags'])
+        self.assertEqual({'speed': 11, 'direction': 'NE', 'degrees': 40, 'gust': None, 'min_variation': None,
+                          'max_variation': None, 'unit': 'KT'}, result['wind'])
+        self.assertEqual({'distance': '1 1/2', 'min_distance': None, 'min_direction': None, 'unit': 'SM'},
+                         result['visibility'])
+        self.assertEqual({'intensity': None, 'descriptive': 'FZ', 'phenomenons': ['FG']},
+                         result['weather_conditions'][2])
+        self.assertEqual({'height': 300, 'quantity': 'BKN', 'type': None, 'unit': 'FT'}, result['clouds'][0])
+        self.assertEqual('26L', result['runways_info'][0]['name'])
+        self.assertEqual(-2, result['temperature'])
+        self.assertEqual([{'type': 'AT', 'time': '19:00:00'}], result['trends'][0]['times'])
+        self.assertEqual('BECMG', result['trends'][0]['type'])
+
+    def test_taf_to_dict(self):
+        taf = TAFParser().parse('TAF KLWT 211120Z 2112/2212 20008KT 9999 SKC 620304 520004 TX17/2115Z TN07/2205Z '
+                                'FM212300 30012G22KT 9999 FEW045 PROB30 TEMPO 2203/2206 4000 -SHRA')
+
+        result = taf.to_dict()
+
+        self.assertEqual(result, json.loads(json.dumps(result)))
+        self.assertEqual({'start_day': 21, 'start_hour': 12, 'end_day': 22, 'end_hour': 12}, result['validity'])
+        self.assertEqual({'temperature': 17, 'day': 21, 'hour': 15}, result['max_temperature'])
+        self.assertEqual({'intensity': '2', 'base_height': 3000, 'depth': 4000, 'unit': 'FT'}, result['icings'][0])
+        self.assertEqual({'start_day': 21, 'start_hour': 23, 'start_minutes': 0}, result['trends'][0]['validity'])
+        self.assertEqual(30, result['trends'][1]['probability'])
+        self.assertEqual('-', result['trends'][1]['weather_conditions'][0]['intensity'])
+
+    def test_to_dict_of_empty_models(self):
+        for model in (Metar(), TAF(), TAFTrend(WeatherChangeType.TEMPO)):
+            with self.subTest(model=type(model).__name__):
+                result = model.to_dict()
+
+                self.assertIsNone(result['wind'])
+                self.assertEqual([], result['clouds'])
+                self.assertEqual(result, json.loads(json.dumps(result)))
+
+    def test_freeze(self):
+        metar = MetarParser().parse('KTTN 051853Z AUTO 04011KT 9999 FZFG BKN003 M02/M02 A3006 TEMPO 4000 RA RMK AO2')
+        expected = metar.to_dict()
+
+        self.assertIs(metar, freeze(metar))
+
+        self.assertTrue(is_frozen(metar))
+        self.assertIsInstance(metar, Metar)
+        self.assertEqual(expected, metar.to_dict())
+        self.assertEqual(frozenset(metar.flags), metar.flags)
+        for obj, name in ((metar, 'station'), (metar, 'remark'), (metar.wind, 'speed'), (metar.clouds[0], 'height'),
+                          (metar.trends[0], 'visibility'), (metar.weather_conditions[0], 'intensity')):
+            with self.subTest(obj=type(obj).__name__, name=name):
+                with self.assertRaises(AttributeError):
+                    setattr(obj, name, None)
+        with self.assertRaises(AttributeError):
+            metar.add_weather_condition(metar.weather_conditions[0])
+
+    def test_freeze_keeps_lazy_remarks(self):
+        metar = freeze(MetarParser(lazy_remarks=True).parse('KTTN 051853Z 04011KT 9999 RMK AO2'))
+
+        self.assertEqual('AO2', metar.raw_remark)
+        self.assertEqual(1, len(metar.remarks))
+
+    def test_pickle_frozen(self):
+        taf = freeze(TAFParser().parse('TAF KLWT 211120Z 2112/2212 20008KT 9999 SKC TX17/2115Z TN07/2205Z '
+                                       'PROB30 TEMPO 2203/2206 4000 -SHRA'))
+
+        result = pickle.loads(pickle.dumps(taf))
+
+        self.assertTrue(is_frozen(result))
+        self.assertTrue(is_frozen(result.trends[0].validity))
+        self.assertEqual(taf.to_dict(), result.to_dict())
+
+    def test_freeze_other_objects(self):
+        for obj in (None, 'LFPG', [Wind()]):
+            with self.subTest(obj=obj):
+                self.assertIs(obj, freeze(obj))
+                self.assertFalse(is_frozen(obj))
+
+    def test_thaw(self):
+        metar = freeze(MetarParser().parse('KTTN 051853Z 04011KT 9999 BKN003 M02/M02 A3006'))
+
+        result = thaw(metar)
+        result.temperature = 5
+        result.add_cloud(Cloud())
+
+        self.assertFalse(is_frozen(result))
+        self.assertIs(metar.wind, result.wind)
+        self.assertEqual(-2, metar.temperature)
+        self.assertEqual((1, 2), (len(metar.clouds), len(result.clouds)))
+
+    def test_frozen_values_are_equal_by_value(self):
+        first, second, other = Cloud(), Cloud(), Cloud()
+        for cloud in (first, second, other):
+            cloud.height = 2000
+        other.height = 3000
+
+        freeze(first)
+        freeze(second)
+        freeze(other)
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(1, len({first, second}))
+        self.assertNotEqual(first, Cloud())
+
+    def test_frozen_reports_are_not_hashable_by_value(self):
+        metar = freeze(Metar())
+
+        self.assertNotEqual(metar, freeze(Metar()))
+
+    def test_interned(self):
+        clear_interned()
+        first = MetarParser().parse('LFPG 170830Z 27010KT 9999 -RA FEW020 15/12 Q1013')
+        second = MetarParser().parse('EGLL 170850Z 27010KT 9999 -RA FEW020 16/12 Q1013')
+        wind = interned(first.wind)
+
+        freeze(first, intern=True)
+        freeze(second, intern=True)
+
+        self.assertIs(wind, first.wind)
+        self.assertIs(first.wind, second.wind)
+        self.assertIs(first.visibility, second.visibility)
+        self.assertIs(first.weather_conditions[0], second.weather_conditions[0])
+        self.assertIs(first.clouds[0], second.clouds[0])
+        self.assertIsNot(first, second)
+
+    def test_interned_objects_are_not_kept_alive(self):
+        clear_interned()
+        for speed in range(1000):
+            wind = Wind()
+            wind.speed = speed
+            interned(wind)
+        gc.collect()
+
+        self.assertEqual(1, len(_INTERNED))
+        self.assertIs(wind, interned(thaw(wind)))
+
+    def test_interned_wind_shear_is_not_a_wind(self):
+        clear_interned()
+        wind, wind_shear = Wind(), WindShear()
+
+        self.assertIsNot(interned(wind), interned(wind_shear))
+        self.assertIs(interned(wind), interned(Wind()))
@@ -0,0 +1,224 @@
+import gc
+import unittest
+import weakref
+
+from parameterized import parameterized
+
+from metar_taf_parser.commons.i18n import _
+from metar_taf_parser.model.model import is_frozen
+from metar_taf_parser.parser.cache import CacheInfo, ParseCache, normalize_message
+from metar_taf_parser.parser.parser import MetarParser, TAFParser
+
+METAR = 'KTTN 051853Z 04011KT 9999 VCTS SN FZFG BKN003 OVC010 M02/M02 A3006 RMK AO2 SLP013'
+TAF = 'TAF KLWT 211120Z 2112/2212 20008KT 9999 SKC TX17/2115Z TN07/2205Z FM212300 30012G22KT 9999 FEW045'
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ParseCacheTestCase(unittest.TestCase):
+
+    @parameterized.expand([
+        ('KTTN 051853Z 04011KT', 'KTTN 051853Z 04011KT'),
+        ('  KTTN  051853Z\n04011KT=\n', 'KTTN 051853Z 04011KT'),
+        ('KTTN 051853Z 04011KT =', 'KTTN 051853Z 04011KT'),
+    ])
+    def test_normalize_message(self, message, expected):
+        self.assertEqual(expected, normalize_message(message))
+
+    def test_get_put(self):
+        cache = ParseCache(maxsize=2)
+
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 1)
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual(CacheInfo(hits=1, misses=1, evictions=0, expirations=0, size=1, maxsize=2), cache.info())
+
+    def test_least_recently_used_is_evicted(self):
+        cache = ParseCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+
+        cache.put('c', 3)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual(3, cache.get('c'))
+        self.assertEqual(1, cache.evictions)
+        self.assertEqual(2, len(cache))
+
+    def test_ttl(self):
+        clock = Clock()
+        cache = ParseCache(ttl=10, clock=clock)
+        cache.put('a', 1)
+
+        clock.now = 9.5
+        self.assertEqual(1, cache.get('a'))
+        clock.now = 10
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(1, cache.expirations)
+        self.assertEqual(0, len(cache))
+
+    def test_clear(self):
+        cache = ParseCache()
+        cache.put('a', 1)
+        cache.get('a')
+
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(1, cache.hits)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            ParseCache(maxsize=0)
+
+
+class ParserCacheTestCase(unittest.TestCase):
+
+    def test_metar_parser_returns_the_cached_result(self):
+        parser = MetarParser(cache=ParseCache())
+
+        metar = parser.parse(METAR)
+
+        self.assertIs(metar, parser.parse(METAR))
+        self.assertEqual(METAR, metar.message)
+        self.assertEqual((1, 1), (parser.cache.hits, parser.cache.misses))
+
+    def test_same_tokens_share_the_cached_result_but_not_the_message(self):
+        parser = MetarParser(cache=ParseCache())
+        metar = parser.parse(METAR)
+
+        retransmitted = parser.parse(METAR + '=\n')
+
+        self.assertEqual(METAR + '=\n', retransmitted.message)
+        self.assertIs(metar.wind, retransmitted.wind)
+        self.assertTrue(is_frozen(retransmitted))
+        self.assertEqual((1, 1), (parser.cache.hits, parser.cache.misses))
+
+    def test_different_tokens_do_not_share_the_cached_result(self):
+        parser = MetarParser(cache=ParseCache())
+
+        parser.parse('KTTN 051853Z 04011KT 1 1/2SM BKN003 M02/M02 A3006')
+        metar = parser.parse('KTTN 051853Z 04011KT 1  1/2SM BKN003 M02/M02 A3006')
+
+        self.assertEqual('1/2', metar.visibility.distance)
+        self.assertEqual((0, 2), (parser.cache.hits, parser.cache.misses))
+
+    def test_cached_result_is_frozen(self):
+        metar = MetarParser(cache=ParseCache()).parse(METAR)
+
+        with self.assertRaises(AttributeError):
+            metar.temperature = 10
+        with self.assertRaises(AttributeError):
+            metar.wind.speed = 10
+        self.assertIsInstance(metar.clouds, tuple)
+
+    def test_cached_result_equals_the_parsed_one(self):
+        for parser, message in ((MetarParser, METAR), (TAFParser, TAF)):
+            with self.subTest(parser=parser.__name__):
+                self.assertEqual(parser().parse(message).to_dict(), parser(cache=ParseCache()).parse(message).to_dict())
+
+    @parameterized.expand([
+        (MetarParser, 'KTTN 051853Z 04011KT 1  1/2SM VCTS SN FZFG BKN003 OVC010 M02/M02 A3006'),
+        (MetarParser, 'KTTN 051853Z 04011KT 1 1/2SM VCTS SN FZFG BKN003 OVC010 M02/M02 A3006'),
+        (MetarParser, 'KTTN 051853Z\t04011KT 1\t1/2SM VCTS  SN\nFZFG BKN003 OVC010 M02/M02 A3006=\n'),
+        (TAFParser, TAF + '='),
+        (TAFParser, TAF.replace(' FM', '\n   FM') + ' \n'),
+    ])
+    def test_cached_result_equals_the_parsed_one_with_irregular_layout(self, parser, message):
+        cached_parser = parser(cache=ParseCache())
+        cached_parser.parse(METAR if parser is MetarParser else TAF)
+
+        self.assertEqual(parser().parse(message).to_dict(), cached_parser.parse(message).to_dict())
+
+    def test_locale_is_part_of_the_key(self):
+        parser = MetarParser(cache=ParseCache())
+
+        english = parser.parse(METAR)
+        french = parser.parse(METAR, 'fr')
+
+        self.assertIsNot(english, french)
+        self.assertEqual(_('Remark.AO2', 'fr'), french.remarks[0])
+        self.assertIs(french, parser.parse(METAR, 'fr'))
+
+    def test_parse_locale_is_part_of_the_key_with_lazy_remarks(self):
+        parser = MetarParser(lazy_remarks=True, cache=ParseCache())
+
+        self.assertIs(parser.parse(METAR), parser.parse(METAR))
+        self.assertIs(parser.parse(METAR, 'fr'), parser.parse(METAR, 'fr'))
+        self.assertIsNot(parser.parse(METAR), parser.parse(METAR, 'fr'))
+        self.assertEqual(_('Remark.AO2', 'fr'), parser.parse(METAR, 'fr').remarks[0])
+
+    def test_cache_shared_by_parsers(self):
+        cache = ParseCache()
+        metar_parser = MetarParser(cache=cache)
+
+        self.assertIs(metar_parser.parse(METAR), MetarParser(cache=cache).parse(METAR))
+        self.assertIsNot(metar_parser.parse(METAR), MetarParser(lazy_remarks=True, cache=cache).parse(METAR))
+        self.assertIsNotNone(TAFParser(cache=cache).parse(TAF))
+        self.assertEqual(3, len(cache))
+
+    def test_parse_many(self):
+        parser = TAFParser(cache=ParseCache(maxsize=1))
+
+        results, errors = parser.parse_many([TAF, TAF, 'TAF', TAF])
+
+        self.assertIs(results[0], results[1])
+        self.assertIs(results[0], results[3])
+        self.assertEqual(2, errors[0].index)
+        self.assertEqual(CacheInfo(hits=2, misses=2, evictions=0, expirations=0, size=1, maxsize=1),
+                         parser.cache.info())
+
+    def test_no_cache(self):
+        parser = MetarParser()
+
+        self.assertIsNone(parser.cache)
+        self.assertIsNot(parser.parse(METAR), parser.parse(METAR))
+
+
+class TokenMemoTestCase(unittest.TestCase):
+
+    @parameterized.expand([
+        (MetarParser, 'LFBD 031300Z 27010G25KT 240V300 9999 4000NE FEW020 BKN040CB VCSH 15/12 Q1013 TEMPO 4000 -RA'),
+        (MetarParser, 'KTTN 051853Z 04011KT 1 1/2SM VCTS SN FZFG BKN003 OVC010 M02/M02 A3006 BECMG AT1900 CAVOK'),
+        (TAFParser, 'TAF LFPG 150500Z 1506/1612 17005KT 6000 SCT012 WS020/24045KT TEMPO 1506/1509 3000 BR BKN006 '
+                    'PROB40 TEMPO 1506/1508 0400 BCFG BKN002 BECMG 1520/1522 CAVOK TX17/1512Z TN07/1605Z'),
+    ])
+    def test_memo_gives_the_parsed_result(self, parser, message):
+        memoizing_parser = parser(token_memo=ParseCache(maxsize=64))
+
+        for attempt in range(3):
+            self.assertEqual(parser().parse(message).to_dict(), memoizing_parser.parse(message).to_dict())
+        self.assertGreater(memoizing_parser._token_memo.hits, 0)
+
+    def test_repeated_tokens_share_their_value(self):
+        parser = MetarParser(token_memo=ParseCache())
+
+        first = parser.parse('LFPG 170830Z 27010KT 9999 -RA FEW020 15/12 Q1013')
+        second = parser.parse('EGLL 170850Z 27010KT 9999 -RA FEW020 16/12 Q1013')
+
+        self.assertIs(first.wind, second.wind)
+        self.assertIs(first.clouds[0], second.clouds[0])
+        self.assertIs(first.weather_conditions[0], second.weather_conditions[0])
+        self.assertIsNot(first.visibility, second.visibility)
+        self.assertEqual(5, parser._token_memo.hits)
+
+    def test_memo_bounds_the_decoded_values(self):
+        parser = MetarParser(token_memo=ParseCache(maxsize=4))
+
+        winds = [weakref.ref(parser.parse(f'LFPG 170830Z 270{speed:02d}KT 9999 15/12 Q1013').wind) for speed in range(50)]
+        gc.collect()
+
+        self.assertLessEqual(sum(wind() is not None for wind in winds), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,15 @@
+import re
 import unittest
 
 from parameterized import parameterized
 
 from metar_taf_parser.model.enum import Intensity, Phenomenon, Descriptive, DepositType, DepositCoverage, WeatherChangeType, CloudQuantity, CloudType, \
     TimeIndicator, TurbulenceIntensity, IcingIntensity, LengthUnit
-from metar_taf_parser.model.model import AbstractWeatherContainer, Visibility, Wind
+from metar_taf_parser.model.model import AbstractWeatherContainer, RemarkRecord, Visibility, Wind
+from metar_taf_parser.parser.cache import ParseCache
 from metar_taf_parser.parser.parser import AbstractParser, MetarParser, _parse_validity, _parse_temperature, TAFParser, \
     RemarkParser
-from metar_taf_parser.commons.i18n import _
+from metar_taf_parser.commons.i18n import _, translation_locale
 
 
 CLOUD_QUANTITY_BROKEN = 'CloudQuantity.BKN'
@@ -43,6 +45,38 @@ class AbstractParserTestCase(unittest.TestCase):
         self.assertEqual(Phenomenon.SNOW, weather_condition.phenomenons[0])
         self.assertEqual(Phenomenon.RAIN, weather_condition.phenomenons[1])
 
+    def test_parse_weather_condition_thunderstorm_with_hail(self):
+        weather_condition = StubParser()._parse_weather_condition('+TSRAGR')
+
+        self.assertEqual(Intensity.HEAVY, weather_condition.intensity)
+        self.assertEqual(Descriptive.THUNDERSTORM, weather_condition.descriptive)
+        self.assertListEqual([Phenomenon.RAIN, Phenomenon.HAIL], weather_condition.phenomenons)
+
+    def test_parse_weather_condition_descriptive_only_at_start(self):
+        weather_condition = StubParser()._parse_weather_condition('+TSHZ')
+
+        self.assertEqual(Descriptive.THUNDERSTORM, weather_condition.descriptive)
+        self.assertListEqual([Phenomenon.HAZE], weather_condition.phenomenons)
+
+        weather_condition = StubParser()._parse_weather_condition('UPRA')
+
+        self.assertIsNone(weather_condition.descriptive)
+        self.assertListEqual([Phenomenon.UNKNOW_PRECIPITATION, Phenomenon.RAIN], weather_condition.phenomenons)
+
+    def test_parse_weather_condition_invalid(self):
+        self.assertIsNone(StubParser()._parse_weather_condition('VCSH'))
+        self.assertIsNone(StubParser()._parse_weather_condition('NOSIG'))
+        self.assertIsNone(StubParser()._parse_weather_condition('RAX'))
+
+    def test_parse_weather_condition_returns_new_instances(self):
+        parser = StubParser()
+
+        first = parser._parse_weather_condition('-RA')
+        second = parser._parse_weather_condition('-RA')
+
+        self.assertIsNot(first, second)
+        self.assertIsNot(first.phenomenons, second.phenomenons)
+
     def test_tokenize(self):
         code = 'METAR KTTN 051853Z 04011KT 1 1/2SM VCTS SN FZFG BKN003 OVC010 M02/M02 A3006 RMK AO2 TSB40 SLP176 P0002 T10171017='
         expected = ['METAR', 'KTTN', '051853Z', '04011KT', '1 1/2SM', 'VCTS', 'SN', 'FZFG', 'BKN003', 'OVC010',
@@ -52,6 +86,38 @@ class AbstractParserTestCase(unittest.TestCase):
 
         self.assertListEqual(expected, res)
 
+    def test_deprecated_tokenize_regex_gives_the_same_tokens(self):
+        code = 'KTTN 051853Z 04011KT 1 1/2SM VCTS SN FZFG BKN003 OVC010 M02/M02 A3006 RMK AO2 TSB40 SLP176='
+
+        tokens = [token for token in re.split(AbstractParser.TOKENIZE_REGEX, code) if token]
+
+        self.assertListEqual(StubParser().tokenize(code), tokens)
+
+    def test_command_suppliers_are_shared(self):
+        metar_parser = MetarParser()
+        taf_parser = TAFParser(lazy_remarks=True)
+
+        self.assertIs(metar_parser._common_supplier, taf_parser._common_supplier)
+        self.assertIs(metar_parser._metar_command_supplier, MetarParser()._metar_command_supplier)
+        self.assertIs(taf_parser._taf_command_supplier, TAFParser()._taf_command_supplier)
+        self.assertIs(RemarkParser()._supplier, RemarkParser()._supplier)
+
+    def test_parser_without_parse_cannot_be_instantiated(self):
+        class IncompleteParser(AbstractParser):
+            def parse(self, input):
+                pass
+
+        with self.assertRaises(TypeError):
+            IncompleteParser()
+
+    def test_tokenize_spans(self):
+        code = 'KTTN 051853Z  1 1/2SM\tVCTS=\n'
+
+        spans = list(StubParser().tokenize_spans(code))
+
+        self.assertListEqual([(0, 4), (5, 12), (14, 21), (22, 26)], spans)
+        self.assertListEqual(StubParser().tokenize(code), [code[start:end] for start, end in spans])
+
     @parameterized.expand([
         ('05009KT', True),
         ('030V113', True),
@@ -307,7 +373,7 @@ class MetarParserTestCase(unittest.TestCase):
         self.assertEqual('KATW', metar.station)
         self.assertIsNotNone(metar.wind)
         self.assertEqual(0, metar.wind.speed)
-        self.assertEqual(0, metar.wind._degrees)
+        self.assertEqual(0, metar.wind.degrees)
 
     def test_parse_recent_rain(self):
         metar = MetarParser().parse('LTAE 250250Z VRB02KT 9999 BKN030 BKN080 06/05 Q1005 RESHRA NOSIG RMK RWY21 07004KT 040V100')
@@ -326,6 +392,110 @@ class MetarParserTestCase(unittest.TestCase):
         self.assertEqual(1, len(metar.clouds))
         self.assertEqual(CloudQuantity.CLR, metar.clouds[0].quantity)
 
+    def test_parse_many(self):
+        metars, errors = MetarParser().parse_many(['LFPG 170830Z 00000KT 0350 R27L/0375N', 'LFPG', 'KTTN 051853Z 04011KT 9999 M02/M02 A3006'])
+
+        self.assertEqual(3, len(metars))
+        self.assertEqual('LFPG', metars[0].station)
+        self.assertIsNone(metars[1])
+        self.assertEqual('KTTN', metars[2].station)
+        self.assertEqual(1, len(errors))
+        self.assertEqual(1, errors[0].index)
+        self.assertIsInstance(errors[0].error, IndexError)
+
+    def test_parse_many_skip(self):
+        metars, errors = MetarParser().parse_many(iter(['LFPG', 'KTTN 051853Z 04011KT 9999']), on_error='skip')
+
+        self.assertEqual(1, len(metars))
+        self.assertEqual('KTTN', metars[0].station)
+        self.assertListEqual([], errors)
+
+    def test_parse_many_raise(self):
+        with self.assertRaises(IndexError):
+            MetarParser().parse_many(['KTTN 051853Z 04011KT 9999', 'LFPG'], on_error='raise')
+
+    def test_parse_many_invalid_on_error(self):
+        with self.assertRaises(ValueError):
+            MetarParser().parse_many([], on_error='ignore')
+
+    def test_parse_bytes(self):
+        code = 'KTTN 051853Z 04011KT 1 1/2SM VCTS SN FZFG BKN003 OVC010 M02/M02 A3006 RMK AO2 SLP013'
+        expected = MetarParser().parse(code).to_dict()
+
+        for input in (code.encode(), bytearray(code.encode()), memoryview(b'  ' + code.encode())[2:]):
+            with self.subTest(type=type(input).__name__):
+                metar = MetarParser().parse(input)
+
+                self.assertEqual(code, metar.message)
+                self.assertEqual(expected, metar.to_dict())
+
+    def test_parse_many_bytes(self):
+        metars, errors = MetarParser().parse_many([b'KTTN 051853Z 04011KT 9999 M02/M02 A3006', 'LFPG 170830Z 00000KT 0350'.encode('utf-16')])
+
+        self.assertEqual('KTTN', metars[0].station)
+        self.assertIsNone(metars[1])
+        self.assertIsInstance(errors[0].error, UnicodeDecodeError)
+
+    def test_parse_many_with_locale(self):
+        metars, errors = MetarParser().parse_many(['KTTN 051853Z 04011KT 9999 RMK AO2'], locale='fr')
+
+        self.assertEqual(_('Remark.AO2', 'fr'), metars[0].remark)
+
+    def test_parse_with_lazy_remarks(self):
+        code = 'KTTN 051853Z 04011KT 9999 RMK AO2 SLP013'
+        eager = MetarParser().parse(code)
+
+        metar = MetarParser(lazy_remarks=True).parse(code)
+
+        self.assertEqual('AO2 SLP013', metar.raw_remark)
+        self.assertEqual(eager.remarks, metar.remarks)
+        self.assertEqual(eager.remark, metar.remark)
+        self.assertIs(metar.remarks, metar.remarks)
+        with translation_locale('fr'):
+            self.assertEqual(_('Remark.AO2', 'fr'), metar.remarks[0])
+        self.assertEqual(eager.remarks, metar.remarks)
+        self.assertEqual(RemarkParser().parse_records('AO2 SLP013'), metar.remark_records)
+
+    def test_parse_with_lazy_remarks_and_locale(self):
+        code = 'KTTN 051853Z 04011KT 9999 RMK AO2 SLP013'
+        eager = MetarParser().parse(code, 'fr')
+
+        metar = MetarParser(lazy_remarks=True).parse(code, 'fr')
+
+        self.assertEqual(eager.remark, metar.remark)
+        self.assertEqual(_('Remark.AO2', 'fr'), metar.remarks[0])
+        with translation_locale('de'):
+            self.assertEqual(_('Remark.AO2', 'de'), metar.remarks[0])
+
+    def test_parse_many_with_lazy_remarks_and_locale_through_the_cache(self):
+        parser = MetarParser(lazy_remarks=True, cache=ParseCache())
+
+        metars, errors = parser.parse_many(['KTTN 051853Z 04011KT 9999 RMK AO2'], locale='fr')
+        metar = parser.parse('KTTN 051853Z 04011KT 9999 RMK AO2', 'en')
+
+        self.assertEqual(_('Remark.AO2', 'fr'), metars[0].remark)
+        self.assertEqual(_('Remark.AO2', 'en'), metar.remark)
+
+    def test_parse_without_lazy_remarks_has_records(self):
+        metar = MetarParser().parse('KTTN 051853Z 04011KT 9999 RMK AO2 SLP013')
+
+        self.assertEqual(RemarkParser().parse_records('AO2 SLP013'), metar.remark_records)
+        self.assertEqual(RemarkParser().translate(metar.remark_records), metar.remarks)
+
+    def test_parse_without_remark_has_no_records(self):
+        metar = MetarParser().parse('KTTN 051853Z 04011KT 9999')
+
+        self.assertIsNone(metar.remark_records)
+
+    def test_parse_with_lazy_remarks_setter(self):
+        metar = MetarParser(lazy_remarks=True).parse('KTTN 051853Z 04011KT 9999 RMK AO2')
+
+        metar.remarks = ['custom']
+
+        self.assertIsNone(metar.raw_remark)
+        self.assertIsNone(metar.remark_records)
+        self.assertEqual(['custom'], metar.remarks)
+
 
 class FunctionTestCase(unittest.TestCase):
 
@@ -867,6 +1037,46 @@ class TAFParserTestCase(unittest.TestCase):
         self.assertEqual(23, taf.time.hour)
         self.assertEqual(0, taf.time.minute)
 
+    def test_parse_many(self):
+        tafs, errors = TAFParser().parse_many([
+            'TAF LFPG 150500Z 1506/1612 17005KT 6000 SCT012 TEMPO 1506/1509 3000 BR BKN006',
+            'METAR LFPG 150500Z 17005KT'
+        ])
+
+        self.assertEqual('LFPG', tafs[0].station)
+        self.assertEqual(1, len(tafs[0].trends))
+        self.assertIsNone(tafs[1])
+        self.assertEqual(1, errors[0].index)
+
+    def test_parse_with_lazy_remarks(self):
+        code = 'TAF CZBF 300939Z 3010/3022 VRB03KT 6SM -SN OVC015 RMK FCST BASED ON AUTO OBS.\n TEMPO 3010/3012 11/2SM -SN OVC009 RMK NXT FCST BY 301400Z'
+        eager = TAFParser().parse(code)
+
+        taf = TAFParser(lazy_remarks=True).parse(code)
+
+        self.assertEqual('FCST BASED ON AUTO OBS.', taf.raw_remark)
+        self.assertEqual(eager.remark, taf.remark)
+        self.assertEqual('NXT FCST BY 301400Z', taf.trends[0].raw_remark)
+        self.assertEqual(eager.trends[0].remarks, taf.trends[0].remarks)
+
+    def test_parse_bytes(self):
+        code = 'TAF KLWT 211120Z 2112/2212 20008KT 9999 SKC TX17/2115Z TN07/2205Z FM212300 30012G22KT 9999 FEW045'
+
+        self.assertEqual(TAFParser().parse(code).to_dict(), TAFParser().parse(code.encode()).to_dict())
+
+    @parameterized.expand([
+        ('TAF KLWT 211120Z 2112/2212 20008KT 1 1/2SM FM212300 30012KT P6SM PROB30 TEMPO 2203/2206 4000 TX17/2115Z TN07/2205Z',
+         [['TAF', 'KLWT', '211120Z', '2112/2212', '20008KT', '1 1/2SM', 'TX17/2115Z', 'TN07/2205Z'],
+          ['FM212300', '30012KT', 'P6SM'], ['PROB30', 'TEMPO', '2203/2206', '4000']]),
+        ('\n  TAF LFPG 150500Z 1506/1612 9999 \n\tBECMG 1520/1522 CAVOK PROB40\nTEMPO 1603/1608 3000 BR=\n',
+         [['TAF', 'LFPG', '150500Z', '1506/1612', '9999'], ['BECMG', '1520/1522', 'CAVOK'],
+          ['PROB40', 'TEMPO', '1603/1608', '3000', 'BR']]),
+        ('TAF LFPG 150500Z 1506/1612 9999 RMK FMAB FMAB', [['TAF', 'LFPG', '150500Z', '1506/1612', '9999', 'RMK', 'FMAB'], ['FMAB']]),
+        ('TAF LFPG 150500Z 1506/1612 9999=BECMG 1520/1522 CAVOK=', [['TAF', 'LFPG', '150500Z', '1506/1612', '9999', 'BECMG', '1520/1522', 'CAVOK']]),
+    ])
+    def test_extract_lines_tokens(self, code, expected):
+        self.assertEqual(expected, TAFParser()._extract_lines_tokens(code))
+
 
 class RemarkParserTestCase(unittest.TestCase):
 
@@ -1184,6 +1394,41 @@ class RemarkParserTestCase(unittest.TestCase):
         remarks = RemarkParser().parse('SHRAE0545 AO1')
         self.assertEqual('showers of rain ending at 05:45', remarks[0])
 
+    def test_parse_records(self):
+        records = RemarkParser().parse_records('AO2 PK WND 28045/15 SLP013 P0009 T00221017 ZZZ')
+
+        self.assertEqual([
+            RemarkRecord('token', {'token': 'AO2'}, 'AO2'),
+            RemarkRecord('peak_wind', {'direction': 280, 'speed': 45, 'hour': None, 'minute': 15}, 'PK WND 28045/15'),
+            RemarkRecord('token', {'token': ''}, ''),
+            RemarkRecord('sea_level_pressure', {'pressure': 1001.3}, 'SLP013'),
+            RemarkRecord('token', {'token': ''}, ''),
+            RemarkRecord('hourly_precipitation_amount', {'amount': 9}, 'P0009'),
+            RemarkRecord('token', {'token': ''}, ''),
+            RemarkRecord('hourly_temperature', {'temperature': 2.2, 'dew_point': -1.7}, 'T00221017'),
+            RemarkRecord('token', {'token': ''}, ''),
+            RemarkRecord('token', {'token': 'ZZZ'}, 'ZZZ'),
+        ], records)
+
+    def test_parse_records_with_unknown_code(self):
+        records = RemarkParser().parse_records('TS XX')
+
+        self.assertEqual(['token', 'token'], [record.kind for record in records])
+
+    @parameterized.expand([
+        ('AO1 PK WND 28045/1515 WSHFT 30 FROPA TWR VIS 16 1/2',),
+        ('AO1 TORNADO B1513 6 NE SHRAB05E30SHSNB20E55 TS SE MOV NE',),
+        ('AO2 GR LESS THAN 1/4 GS MOD VIRGA NE CIG 005V010 FG FEW000 BKN014 V OVC',),
+        ('AO2 SLP982 SNINCR 2/10 401001015 10142 20012 52032 l1004 60009 70125 4/021 98096 933036',),
+    ])
+    def test_translate_records(self, code):
+        parser = RemarkParser()
+        records = parser.parse_records(code)
+
+        for locale in (None, 'fr'):
+            with self.subTest(locale=locale):
+                self.assertEqual(parser.parse(code, locale), parser.translate(records, locale))
+
 
 class StubParser(AbstractParser):
     def __init__(self):
@@ -1197,12 +1442,20 @@ class StubParser(AbstractParser):
         """
         pass
 
+    def _parse(self, input):
+        """
+        Does nothing for the stub
+        :param input:
+        :return:
+        """
+        pass
+
 
 class StubWeatherContainer(AbstractWeatherContainer):
     def __init__(self):
         super().__init__()
-        self.wind = Wind
-        self.visibility = Visibility
+        self.wind = Wind()
+        self.visibility = Visibility()
 
 
 if __name__ == '__main__':
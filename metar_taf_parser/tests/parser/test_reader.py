@@ -0,0 +1,119 @@
+import io
+import os
+import pathlib
+import tempfile
+import unittest
+
+from metar_taf_parser.parser.parser import ParseFailure
+from metar_taf_parser.parser.reader import _iter_lines, iter_metars, iter_tafs, split_metars, split_tafs
+
+METARS = '''LFPG 170830Z 00000KT 0350 FG SCT000 M01/M01 Q1026 NOSIG=
+KTTN 051853Z 04011KT 9999 VCTS SN FZFG BKN003 OVC010 M02/M02 A3006 RMK AO2 SLP013
+LFBD 031300Z 27010G25KT 240V300 9999 FEW020 BKN040CB 15/12 Q1013= LFBO 031300Z 27010KT CAVOK 15/12 Q1013=
+
+LFPG
+'''
+
+TAFS = '''TAF LFPG 150500Z 1506/1612 17005KT 6000 SCT012
+      TEMPO 1506/1509 3000 BR BKN006
+      PROB40 TEMPO 1506/1508 0400 BCFG BKN002 PROB40
+      TEMPO 1512/1516 4000 -SHRA FEW030TCU BKN040
+      BECMG 1520/1522 CAVOK
+      TEMPO 1603/1608 3000 BR BKN006 PROB40
+      TEMPO 1604/1607 0400 BCFG BKN002 TX17/1512Z TN07/1605Z=
+TAF KLWT 211120Z 2112/2212 20008KT 9999 SKC
+TAF LFBD 151700Z 1518/1624 29006KT CAVOK BECMG 1607/1609 24010KT=
+'''
+
+
+class ReaderTestCase(unittest.TestCase):
+
+    def test_split_metars(self):
+        messages = list(split_metars(METARS.splitlines()))
+
+        self.assertEqual(5, len(messages))
+        self.assertEqual('LFPG 170830Z 00000KT 0350 FG SCT000 M01/M01 Q1026 NOSIG', messages[0])
+        self.assertEqual('LFBO 031300Z 27010KT CAVOK 15/12 Q1013', messages[3])
+        self.assertEqual('LFPG', messages[4])
+
+    def test_split_tafs(self):
+        messages = list(split_tafs(TAFS.splitlines()))
+
+        self.assertEqual(3, len(messages))
+        self.assertEqual(7, len(messages[0].splitlines()))
+        self.assertTrue(messages[0].endswith('TN07/1605Z'))
+        self.assertEqual('TAF KLWT 211120Z 2112/2212 20008KT 9999 SKC', messages[1])
+
+    def test_iter_lines(self):
+        chunks = ['LFPG 1', '70830Z\nKTTN=LF', 'BD= LFB', 'O\n\nLFPG', ' 17']
+
+        self.assertEqual(['LFPG 170830Z', 'KTTN=LFBD=', ' LFBO', '', 'LFPG 17'], list(_iter_lines(chunks)))
+
+    def test_iter_lines_without_line_breaks(self):
+        metar = 'LFBD 031300Z 27010G25KT 240V300 9999 FEW020 BKN040CB 15/12 Q1013= '
+        text = metar * 10000
+
+        lines = list(_iter_lines(text[start:start + 64] for start in range(0, len(text), 64)))
+
+        self.assertEqual(text, ''.join(lines))
+        self.assertLessEqual(max(map(len, lines)), 64 + len(metar))
+        self.assertEqual(10000, len(list(iter_metars(io.StringIO(text), chunk_size=64))))
+
+    def test_iter_metars_with_file_object(self):
+        metars = list(iter_metars(io.StringIO(METARS), on_error='skip'))
+
+        self.assertEqual(['LFPG', 'KTTN', 'LFBD', 'LFBO'], [metar.station for metar in metars])
+        self.assertEqual(240, metars[2].wind.min_variation)
+        self.assertTrue(metars[3].cavok)
+
+    def test_iter_metars_collect(self):
+        results = list(iter_metars(io.BytesIO(METARS.encode()), on_error='collect', batch_size=2))
+
+        self.assertEqual(5, len(results))
+        self.assertIsInstance(results[4], ParseFailure)
+        self.assertEqual(4, results[4].index)
+
+    def test_iter_metars_with_buffer(self):
+        for buffer in (METARS.encode(), bytearray(METARS.encode()), memoryview(METARS.encode())):
+            with self.subTest(type=type(buffer).__name__):
+                metars = list(iter_metars(buffer, on_error='skip', chunk_size=16, encoding='ascii'))
+
+                self.assertEqual(['LFPG', 'KTTN', 'LFBD', 'LFBO'], [metar.station for metar in metars])
+
+    def test_iter_metars_raise(self):
+        with self.assertRaises(IndexError):
+            list(iter_metars(io.StringIO(METARS)))
+
+    def test_iter_metars_invalid_on_error(self):
+        with self.assertRaises(ValueError):
+            iter_metars(io.StringIO(METARS), on_error='ignore')
+
+    def test_iter_tafs_with_path(self):
+        for use_mmap in (False, True):
+            with self.subTest(use_mmap=use_mmap), tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'tafs.txt')
+                with open(path, 'w') as file:
+                    file.write(TAFS)
+
+                tafs = list(iter_tafs(path, chunk_size=16, use_mmap=use_mmap))
+
+                self.assertEqual(['LFPG', 'KLWT', 'LFBD'], [taf.station for taf in tafs])
+                self.assertEqual(5, len(tafs[0].tempos()))
+                self.assertEqual(17, tafs[0].max_temperature.temperature)
+                self.assertEqual(1, len(tafs[2].becmgs()))
+
+    def test_iter_metars_with_path_like(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory, 'metars.txt')
+            path.write_text(METARS)
+
+            metars = list(iter_metars(path, on_error='skip', chunk_size=16))
+
+            self.assertEqual(['LFPG', 'KTTN', 'LFBD', 'LFBO'], [metar.station for metar in metars])
+
+    def test_iter_tafs_with_empty_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'tafs.txt')
+            open(path, 'w').close()
+
+            self.assertEqual([], list(iter_tafs(path, use_mmap=True)))
@@ -0,0 +1,152 @@
+import importlib.util
+import unittest
+
+from parameterized import parameterized
+
+from metar_taf_parser.columns import METAR_COLUMNS, MetarColumnBuilder, parse_columns, to_columns
+from metar_taf_parser.parser.parser import MetarParser, ParseFailure
+
+METARS = [
+    'LFPG 170830Z 00000KT 0350 FG SCT000 M01/M01 Q1026 NOSIG',
+    'KTTN 051853Z VRB11KT 9999 VCTS SN FZFG BKN003 OVC010 M02/M02 A3006 RMK AO2 SLP013',
+    'LFBD 031300Z 27010G25KT 240V300 1 1/2SM FEW020 BKN040CB 15/12',
+]
+
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+HAS_PYARROW = HAS_NUMPY and importlib.util.find_spec('pyarrow') is not None
+
+
+class ColumnsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        parser = MetarParser()
+        self.columns = to_columns((parser.parse(message) for message in METARS), capacity=2)
+
+    def test_to_columns(self):
+        self.assertEqual(3, len(self.columns))
+        self.assertEqual(['LFPG', 'KTTN', 'LFBD'], self.columns['station'])
+        self.assertEqual([17, 5, 3], list(self.columns['day']))
+        self.assertEqual([8, 18, 13], list(self.columns['hour']))
+        self.assertEqual([30, 53, 0], list(self.columns['minute']))
+        self.assertEqual([0, 11, 10], list(self.columns['wind_speed']))
+        self.assertEqual([-1, -2, 15], list(self.columns['temperature']))
+        self.assertEqual([0, 300, 2000], list(self.columns['cloud_base']))
+        self.assertAlmostEqual(0.35, self.columns['visibility_km'][0])
+        self.assertAlmostEqual(10.0, self.columns['visibility_km'][1])
+        self.assertAlmostEqual(2.414016, self.columns['visibility_km'][2])
+        self.assertEqual([0, 1, 0], list(self.columns['visibility_bound']))
+        self.assertEqual(1026, self.columns['altimeter'][0])
+
+    @parameterized.expand([
+        ('1/4SM', 0.402336, 0),
+        ('1 1/2SM', 2.414016, 0),
+        ('P6SM', 9.656064, 1),
+        ('M1/4SM', 0.402336, -1),
+    ])
+    def test_to_columns_statute_miles_visibility(self, visibility, distance_km, bound):
+        columns = to_columns([MetarParser().parse(f'KTTN 051853Z 04011KT {visibility} BKN003 M02/M02 A3006')])
+
+        self.assertAlmostEqual(distance_km, columns['visibility_km'][0])
+        self.assertEqual(bound, columns['visibility_bound'][0])
+        self.assertEqual(1, columns.valid('visibility_bound')[0])
+
+    @parameterized.expand([
+        ('18010G20KT', 10.0, 20.0),
+        ('18010G20MPS', 19.438445, 38.876890),
+        ('18010G20KM/H', 5.399568, 10.799136),
+    ])
+    def test_to_columns_wind_in_knots(self, wind, speed, gust):
+        columns = to_columns([MetarParser().parse(f'UUWW 051830Z {wind} 9999 BKN030 M02/M05 Q1013')])
+
+        self.assertAlmostEqual(speed, columns['wind_speed'][0], places=5)
+        self.assertAlmostEqual(gust, columns['wind_gust'][0], places=5)
+
+    def test_to_columns_valid(self):
+        self.assertEqual(bytearray([1, 0, 1]), self.columns.valid('wind_degrees'))
+        self.assertEqual(bytearray([0, 0, 1]), self.columns.valid('wind_gust'))
+        self.assertEqual(bytearray([1, 1, 0]), self.columns.valid('altimeter'))
+        self.assertEqual(bytearray([1, 1, 1]), self.columns.valid('visibility_bound'))
+
+    def test_names(self):
+        self.assertEqual('station', self.columns.names()[0])
+        self.assertEqual(13, len(self.columns.names()))
+
+    def test_builder_build_resets(self):
+        builder = MetarColumnBuilder(1)
+        builder.add(MetarParser().parse(METARS[0]))
+
+        self.assertEqual(1, len(builder.build()))
+        self.assertEqual(0, len(builder))
+        self.assertEqual(0, len(builder.build()['temperature']))
+
+    def test_parse_columns(self):
+        messages = METARS + [
+            'LFBD 031300Z 27010G25KT 9999 FEW020 BKN040CB SCT010 15/12 Q1013 TEMPO 4000 RA BKN005',
+            'LFPO 031300Z 18005KT CAVOK 15/12 Q1013 RMK SLP013',
+            'KLWT 051853Z 04011KT 1/2SM VCTS SN FZFG BKN003 M02/M02 A3006',
+        ]
+        parser = MetarParser()
+        expected = to_columns(parser.parse(message) for message in messages)
+
+        columns, errors = parse_columns(messages, capacity=1)
+
+        self.assertEqual([], errors)
+        self.assertEqual(expected['station'], columns['station'])
+        for name, typecode in METAR_COLUMNS:
+            with self.subTest(name=name):
+                self.assertEqual(expected.valid(name), columns.valid(name))
+                self.assertEqual([value for value, valid in zip(expected[name], expected.valid(name)) if valid],
+                                 [value for value, valid in zip(columns[name], columns.valid(name)) if valid])
+
+    def test_parse_columns_equals_to_columns_for_units(self):
+        messages = [f'KTTN 051853Z {wind} {visibility} BKN003 M02/M02 A3006' for wind, visibility in (
+            ('04011KT', '1/4SM'), ('04011G20KT', '1 1/2SM'), ('18010MPS', 'P6SM'), ('18010G15MPS', 'M1/4SM'),
+            ('18010KM/H', '9999'), ('18010KT', 'CAVOK'),
+        )]
+        parser = MetarParser()
+        expected = to_columns(parser.parse(message) for message in messages)
+
+        columns, errors = parse_columns(messages)
+
+        for name, typecode in METAR_COLUMNS:
+            with self.subTest(name=name):
+                self.assertEqual(expected.valid(name), columns.valid(name))
+                self.assertEqual(list(expected[name]), list(columns[name]))
+        self.assertAlmostEqual(0.402336, columns['visibility_km'][0])
+        self.assertAlmostEqual(2.414016, columns['visibility_km'][1])
+        self.assertEqual([0, 0, 1, -1, 1, 1], list(columns['visibility_bound']))
+        self.assertAlmostEqual(19.438445, columns['wind_speed'][2], places=5)
+
+    def test_parse_columns_collect(self):
+        columns, errors = parse_columns(['LFPG', METARS[1]], on_error='collect')
+
+        self.assertEqual(['KTTN'], columns['station'])
+        self.assertEqual([-2], list(columns['temperature']))
+        self.assertEqual([ParseFailure], [type(error) for error in errors])
+        self.assertEqual(0, errors[0].index)
+
+    def test_parse_columns_raise(self):
+        with self.assertRaises(IndexError):
+            parse_columns(['LFPG'])
+
+    def test_parse_columns_invalid_on_error(self):
+        with self.assertRaises(ValueError):
+            parse_columns(METARS, on_error='ignore')
+
+    @unittest.skipUnless(HAS_NUMPY, 'numpy is not installed')
+    def test_to_numpy(self):
+        arrays = self.columns.to_numpy()
+
+        self.assertEqual([0, 11, 10], arrays['wind_speed'].tolist())
+        self.assertEqual([1026, 1017, None], arrays['altimeter'].tolist())
+
+    @unittest.skipUnless(HAS_PYARROW, 'pyarrow is not installed')
+    def test_to_arrow(self):
+        table = self.columns.to_arrow()
+
+        self.assertEqual(3, table.num_rows)
+        self.assertEqual([1026, 1017, None], table.column('altimeter').to_pylist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+import unittest
+
+# Cumulative time of importing the parser module, in milliseconds, best of RUNS runs.
+IMPORT_TIME_BUDGET_MS = 60
+RUNS = 3
+# Modules only needed to translate the remarks or to parse a TAF.
+DEFERRED_MODULES = ('gettext', 'locale', 'typing', 'metar_taf_parser.command.remark', 'metar_taf_parser.command.taf')
+
+
+def import_times(statement: str) -> dict:
+    """
+    Runs a statement in a new interpreter with -X importtime.
+    :param statement: the python code to run
+    :return: dict mapping the name of each imported module to its cumulative import time in microseconds
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], capture_output=True, text=True,
+                            check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+class ImportTimeTestCase(unittest.TestCase):
+
+    def test_deferred_modules_are_not_imported(self):
+        imported = import_times('import metar_taf_parser.parser.parser').keys() - import_times('pass').keys()
+
+        self.assertIn('metar_taf_parser.parser.parser', imported)
+        for module in DEFERRED_MODULES:
+            with self.subTest(module=module):
+                self.assertNotIn(module, imported)
+
+    def test_import_time_budget(self):
+        elapsed = min(import_times('import metar_taf_parser.parser.parser')['metar_taf_parser.parser.parser']
+                      for attempt in range(RUNS))
+
+        self.assertLess(elapsed / 1000, IMPORT_TIME_BUDGET_MS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from metar_taf_parser.commons.i18n import _
+from metar_taf_parser.parallel import ParallelParser, TAF
+from metar_taf_parser.parser.parser import ParseFailure
+
+METARS = [
+    'LFPG 170830Z 00000KT 0350 R27L/0375N R09R/0175N R26R/0500D R08L/0400N R26L/0275D R08R/0250N R27R/0300N R09L/0200N FG SCT000 M01/M01 Q1026 NOSIG',
+    'KTTN 051853Z 04011KT 9999 VCTS SN FZFG BKN003 OVC010 M02/M02 A3006 RMK AO2 SLP013',
+    'LFPG',
+    'LFBD 031300Z 27010G25KT 240V300 9999 FEW020 BKN040CB 15/12 Q1013',
+]
+
+
+class ParallelParserTestCase(unittest.TestCase):
+
+    def test_parse_many(self):
+        with ParallelParser(max_workers=2, chunk_size=1) as parser:
+            metars, errors = parser.parse_many(METARS)
+
+        self.assertEqual(4, len(metars))
+        self.assertEqual('LFPG', metars[0].station)
+        self.assertEqual(8, len(metars[0].runways_info))
+        self.assertEqual(METARS[1], metars[1].message)
+        self.assertIsNone(metars[2])
+        self.assertEqual(240, metars[3].wind.min_variation)
+        self.assertEqual(1, len(errors))
+        self.assertEqual(2, errors[0].index)
+        self.assertIsInstance(errors[0].error, IndexError)
+
+    def test_imap_unordered(self):
+        with ParallelParser(max_workers=2, chunk_size=1) as parser:
+            results = dict(parser.imap(METARS * 3, ordered=False))
+
+        self.assertEqual(set(range(12)), set(results))
+        self.assertEqual('KTTN', results[5].station)
+        self.assertIsInstance(results[10], ParseFailure)
+
+    def test_imap_skip(self):
+        with ParallelParser(max_workers=1, chunk_size=3, on_error='skip') as parser:
+            indexes = [index for index, metar in parser.imap(iter(METARS))]
+
+        self.assertListEqual([0, 1, 3], indexes)
+
+    def test_imap_raise(self):
+        with ParallelParser(max_workers=1, on_error='raise') as parser:
+            with self.assertRaises(IndexError):
+                list(parser.imap(METARS))
+
+    def test_parse_taf_with_locale(self):
+        with ParallelParser(TAF, max_workers=1, locale='fr') as parser:
+            tafs, errors = parser.parse_many(['TAF LFPG 150500Z 1506/1612 17005KT 6000 SCT012 RMK AO2'])
+
+        self.assertListEqual([], errors)
+        self.assertEqual(_('Remark.AO2', 'fr'), tafs[0].remark)
+
+    def test_invalid_kind(self):
+        with self.assertRaises(ValueError):
+            ParallelParser('synop')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from metar_taf_parser.commons.i18n import _, translation_locale
+from metar_taf_parser.model.enum import CloudQuantity, Flag, IcingIntensity, Phenomenon, WeatherChangeType
+from metar_taf_parser.model.model import FMValidity, Metar, freeze
+from metar_taf_parser.parser.parser import MetarParser, TAFParser
+from metar_taf_parser.serialization import MAGIC, VERSION, from_bytes, read_reports, to_bytes, write_ndjson, \
+    write_reports
+
+METAR = 'KTTN 051853Z AUTO 04011KT 1 1/2SM VCTS SN FZFG BKN003 OVC010 M02/M02 A3006 R26L/0275D TEMPO FM1830 4000 RA ' \
+        'RMK AO2 SLP013'
+TAF = 'TAF KLWT 211120Z 2112/2212 20008KT 9999 SKC 620304 520004 TX17/2115Z TN07/2205Z FM212300 30012G22KT 9999 ' \
+      'FEW045 BKN100 PROB30 TEMPO 2203/2206 4000 -SHRA'
+
+
+class SerializationTestCase(unittest.TestCase):
+
+    def test_metar_round_trip(self):
+        metar = MetarParser().parse(METAR)
+
+        decoded = from_bytes(to_bytes(metar))
+
+        self.assertIsInstance(decoded, Metar)
+        self.assertEqual(repr(metar), repr(decoded))
+        self.assertEqual(METAR, decoded.message)
+        self.assertEqual({Flag.AUTO}, decoded.flags)
+        self.assertEqual(-2, decoded.temperature)
+        self.assertEqual('1 1/2', decoded.visibility.distance)
+        self.assertEqual([Phenomenon.SNOW], decoded.weather_conditions[1].phenomenons)
+        self.assertEqual(CloudQuantity.OVC, decoded.clouds[1].quantity)
+        self.assertEqual('R26L', 'R' + decoded.runways_info[0].name)
+        self.assertEqual(WeatherChangeType.TEMPO, decoded.trends[0].type)
+        self.assertEqual(metar.trends[0].times[0].time, decoded.trends[0].times[0].time)
+
+    def test_taf_round_trip(self):
+        taf = TAFParser().parse(TAF)
+
+        decoded = from_bytes(to_bytes(taf))
+
+        self.assertEqual(repr(taf), repr(decoded))
+        self.assertEqual(17, decoded.max_temperature.temperature)
+        self.assertEqual(IcingIntensity.LIGHT_RIME_ICING_CLOUD, decoded.icings[0].intensity)
+        self.assertIsInstance(decoded.trends[0].validity, FMValidity)
+        self.assertEqual(30, decoded.trends[1].probability)
+
+    def test_remark_round_trip(self):
+        metar = MetarParser().parse('KTTN 051853Z 04011KT 9999 RMK AO2 SLP013')
+
+        decoded = from_bytes(to_bytes(metar))
+
+        self.assertIsNone(decoded.raw_remark)
+        self.assertEqual(metar.remarks, decoded.remarks)
+        self.assertEqual(metar.remark, decoded.remark)
+        self.assertEqual(metar.remark_records, decoded.remark_records)
+
+    def test_remark_records_values_round_trip(self):
+        metar = MetarParser().parse('KTTN 051853Z 04011KT 9999 RMK AO2 PK WND 28045/15 SLP013 T00261015 TSB0159E30')
+
+        decoded = from_bytes(to_bytes(metar))
+
+        self.assertEqual(metar.remark_records, decoded.remark_records)
+        self.assertEqual({type(None), int, float, str},
+                         {type(value) for record in decoded.remark_records for value in record.values.values()})
+
+    def test_lazy_remark_round_trip(self):
+        metar = MetarParser(lazy_remarks=True).parse('KTTN 051853Z 04011KT 9999 RMK AO2 SLP013')
+
+        decoded = from_bytes(to_bytes(metar))
+
+        self.assertEqual('AO2 SLP013', decoded.raw_remark)
+        self.assertEqual(metar.remark_records, decoded.remark_records)
+        with translation_locale('fr'):
+            self.assertEqual(_('Remark.AO2', 'fr'), decoded.remarks[0])
+
+    def test_lazy_remark_locale_round_trip(self):
+        metar = MetarParser(lazy_remarks=True).parse('KTTN 051853Z 04011KT 9999 RMK AO2 SLP013', 'fr')
+
+        decoded = from_bytes(to_bytes(metar))
+
+        self.assertEqual(_('Remark.AO2', 'fr'), decoded.remarks[0])
+
+    def test_frozen_round_trip(self):
+        taf = freeze(TAFParser().parse(TAF))
+
+        self.assertEqual(repr(TAFParser().parse(TAF)), repr(from_bytes(to_bytes(taf))))
+
+    def test_from_bytes_invalid(self):
+        data = to_bytes(MetarParser().parse(METAR))
+
+        with self.assertRaises(ValueError):
+            from_bytes(b'PK' + data)
+        with self.assertRaises(ValueError):
+            from_bytes(MAGIC + bytes((VERSION + 1,)) + data[len(MAGIC) + 1:])
+
+    def test_to_bytes_is_smaller_than_the_message(self):
+        metar = MetarParser().parse(METAR)
+        metar.message = None
+
+        self.assertLess(len(to_bytes(metar)), len(METAR))
+
+    def test_write_read_reports(self):
+        reports = [MetarParser().parse(METAR), TAFParser().parse(TAF)] * 3
+        file = io.BytesIO()
+
+        self.assertEqual(6, write_reports(file, reports, block_size=4))
+        file.seek(0)
+        decoded = list(read_reports(file))
+
+        self.assertEqual([repr(report) for report in reports], [repr(report) for report in decoded])
+
+    def test_write_read_reports_with_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'reports.bin')
+            write_reports(path, iter([]))
+
+            self.assertEqual([], list(read_reports(path)))
+
+    def test_write_ndjson(self):
+        reports = [MetarParser().parse(METAR), TAFParser().parse(TAF)]
+        file = io.StringIO()
+
+        self.assertEqual(2, write_ndjson(file, iter(reports)))
+        lines = file.getvalue().splitlines()
+
+        self.assertEqual([report.to_dict() for report in reports], [json.loads(line) for line in lines])
+        self.assertTrue(lines[0].startswith('{"wind":{"speed":11,'))
+
+    def test_write_ndjson_with_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'reports.ndjson')
+            self.assertEqual(1, write_ndjson(path, [MetarParser().parse(METAR)]))
+
+            with open(path, encoding='utf-8') as file:
+                self.assertEqual('KTTN', json.loads(file.readline())['station'])
+
+
+if __name__ == '__main__':
+    unittest.main()